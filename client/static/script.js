@@ -506,6 +506,25 @@ async function submitQuery() {
                             }
                             displayComparisonResults(comparisonData);
                             switchResultsTab('summary');
+                        } else if (!selectedModels.length && data.type === 'summarizing' && data.status === 'streaming') {
+                            // Streamed summary text: grow one log entry instead of adding one per chunk
+                            if (!modelLogs['default']) {
+                                modelLogs['default'] = [];
+                            }
+                            const logs = modelLogs['default'];
+                            const last = logs[logs.length - 1];
+                            if (last && last.type === 'summarizing' && last.status === 'streaming') {
+                                last.message += data.delta;
+                            } else {
+                                logs.push({
+                                    type: 'summarizing',
+                                    status: 'streaming',
+                                    message: data.delta,
+                                    timestamp: data.timestamp || Date.now() / 1000,
+                                    model: 'default'
+                                });
+                            }
+                            updateModelLogsDisplay(modelLogs, ['default']);
                         } else if (!selectedModels.length && data.type) {
                             // Handle single query progress events
                             const logEntry = {
@@ -1,377 +1,251 @@
 """
 Add targeted tweets to improve demo query results
 """
-import json
-import random
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+import numpy as np
 from data_generator import MockXDataGenerator
+from data_store import Post, append_posts, iter_posts, read_count
+import config
+
+# Fixed pick lists (module-level so they are built once); overlapping lists extend a shared base
+SENTIMENTS = MockXDataGenerator.SENTIMENTS
+SPORTS_TOPICS = ("Premier League", "NBA", "tennis", "soccer")
+SPORTS_CELEBRITIES = ("Messi", "LeBron", "Serena")
+ENTERTAINMENT_TOPICS = ("Oscar season", "movies", "streaming", "TV shows")
+FASHION_FOCUS_TOPICS = ("sustainable fashion", "runway")
+SPANISH_FASHION_TOPICS = FASHION_FOCUS_TOPICS + ("streetwear", "haute couture")
+FASHION_CELEBRITIES = ("Rihanna", "Pharrell")
+FASHION_NAMES = FASHION_CELEBRITIES + ("Anna Wintour",)
+FRENCH_ART_TOPICS = ("museums", "contemporary art", "galleries", "art market")
+ART_CELEBRITIES = ("Banksy", "Damien Hirst")
+ART_NAMES = ART_CELEBRITIES + ("Jeff Koons",)
+PORTUGUESE_SPORTS_TOPICS = ("soccer", "Premier League", "World Cup", "tennis", "F1")
+PORTUGUESE_SPORTS_CELEBRITIES = ("Messi", "Ronaldo")
+PORTUGUESE_SPORTS_NAMES = PORTUGUESE_SPORTS_CELEBRITIES + ("Mbappé",)
+_EMPTY_DICT = {}  # shared read-only default for missing author/engagement
+COVERAGE_KEYS = (
+    "verified_js", "verified_python", "verified_sports_high", "recent_negative", "scorsese_ent",
+    "fashion_sustainable", "fashion_runway", "spanish_fashion", "french_art_museums", "portuguese_sports",
+)
+
+def _iso_timestamps(now: np.datetime64, days: np.ndarray, hours=0) -> list:
+    """ISO-8601 strings for `now` minus day/hour offsets, converted in one vectorized pass"""
+    offsets = days * 24 + hours
+    return np.datetime_as_string(now - offsets.astype("timedelta64[h]"), unit="us").tolist()
+
+def _make_post(text, author, created_at, engagement, sentiment, category, topics, language, has_media) -> Post:
+    """Build a standalone demo post (never a reply); the id is assigned once all blocks are collected"""
+    return Post(None, text, author, created_at, engagement, sentiment, category, topics, language, has_media)
+
+def _tally(coverage: dict, week_ago_iso: str, text, topics, author, engagement, category, language, sentiment, created_at):
+    """Update the coverage counters for one post (fields passed in, so dict rows and Post records share it)"""
+    author = author or _EMPTY_DICT
+    text_lower = (text or '').lower()  # lowercased once, shared by every predicate
+    topics_lower = {t.lower() for t in topics or ()}  # set: O(1) membership per predicate
+    
+    if author.get('verified'):
+        if 'javascript' in text_lower or 'javascript' in topics_lower:
+            coverage['verified_js'] += 1
+        if 'python' in text_lower or 'python' in topics_lower:
+            coverage['verified_python'] += 1
+        if category == 'sports' and sum((engagement or _EMPTY_DICT).values()) > 10000:
+            coverage['verified_sports_high'] += 1
+    # created_at values are naive isoformat() strings, so string order is chronological order
+    if sentiment == 'negative' and (created_at or '') >= week_ago_iso:
+        coverage['recent_negative'] += 1
+    # Exact tag match; rows written before the tag existed fall back to the identical display_name
+    if category == 'entertainment' and author.get('celebrity_name', author.get('display_name')) == 'Scorsese':
+        coverage['scorsese_ent'] += 1
+    if category == 'fashion':
+        if 'sustainable fashion' in text_lower or 'sustainable fashion' in topics_lower:
+            coverage['fashion_sustainable'] += 1
+        if 'runway' in text_lower or 'runway' in topics_lower:
+            coverage['fashion_runway'] += 1
+        if language == 'es':
+            coverage['spanish_fashion'] += 1
+    elif category == 'art':
+        if language == 'fr' and ('museum' in text_lower or 'museums' in topics_lower):
+            coverage['french_art_museums'] += 1
+    elif category == 'sports':
+        if language == 'pt':
+            coverage['portuguese_sports'] += 1
+
+def _block_setup(seed: int, now: datetime):
+    """Per-block generator, random stream and numpy timestamp, so blocks share no state"""
+    return MockXDataGenerator(seed=seed), np.random.default_rng(seed), np.datetime64(now, "us")
+
+def _gen_block(spec: dict, seed: int, now: datetime) -> list:
+    """
+    Generate one block of demo posts from its BLOCKS spec
+
+    Every random field is drawn for the whole block up front; the per-post loop
+    below is the only post-building code path, shared by all blocks.
+
+    Args:
+        spec: Block description (see BLOCKS)
+        seed: Seed for this block's generator and random stream
+        now: Reference time for created_at offsets
+
+    Returns:
+        List of Post records with ids left unset
+    """
+    generator, rng, now_np = _block_setup(seed, now)
+    gen_author = generator._generate_author
+    gen_content = generator._generate_post_content
+    gen_engagement = generator._generate_engagement
+    gen_foreign = generator._generate_foreign_content
+    gen_pick_topic = generator._pick_category_and_topic
+    
+    n = spec["n"]
+    category = spec.get("category")  # None: pick a random category/topic per post
+    lang = spec.get("lang", "en")
+    fixed_sentiment = spec.get("sentiment")
+    celeb_every = spec.get("celeb_every", 1)
+    verified_all = spec.get("verified", False)
+    author_type = spec.get("author_type")  # override for non-celebrity authors
+    default_name = spec.get("name")
+    
+    topics = rng.choice(spec["topics"], n).tolist() if category else None
+    sents = [fixed_sentiment] * n if fixed_sentiment else rng.choice(SENTIMENTS, n).tolist()
+    celebs = rng.choice(spec["celebs"], n).tolist() if "celebs" in spec else None
+    if "names" in spec:
+        names = rng.choice(spec["names"], n).tolist()
+        use_name = (rng.random(n) < 0.5).tolist()
+    else:
+        names = None
+    days = rng.integers(0, spec["days"], n)
+    hours = rng.integers(0, 24, n) if spec.get("hours") else 0
+    created = _iso_timestamps(now_np, days, hours)
+    boosts = [(field, rng.integers(low, high + 1, n).tolist()) for field, (low, high) in spec.get("engagement", {}).items()]
+    media = (rng.random(n) < spec.get("media_p", 0.3)).tolist()
+    
+    posts = []
+    for i in range(n):
+        if category:
+            post_category, topic = category, topics[i]
+        else:
+            post_category, topic = gen_pick_topic()
+        celeb = celebs[i] if celebs and i % celeb_every == 0 else None
+        author = gen_author(category=post_category, celebrity_name=celeb)
+        if verified_all or celeb:
+            author["verified"] = True
+        if author_type and not celeb:
+            author["author_type"] = author_type
+        
+        sentiment = sents[i]
+        name = names[i] if names and use_name[i] else default_name
+        if lang == "en":
+            text = gen_content(topic, sentiment, post_category, name=name, lang="en")
+        else:
+            text = gen_foreign(topic, sentiment, post_category, name, lang)
+        
+        engagement = gen_engagement(author["author_type"])
+        for field, values in boosts:
+            engagement[field] = values[i]
+        
+        posts.append(_make_post(
+            text, author, created[i], engagement,
+            sentiment, post_category, [topic], lang, media[i]
+        ))
+    return posts
+
+# One spec per block, in output order; block k is seeded with DEMO_SEED + k.
+# Keys: n, category (omit for random), topics, sentiment (omit for random), lang,
+# celebs/celeb_every (celebrity author on every k-th post, always verified),
+# verified (all authors), author_type (non-celebrity override), name/names (text mention),
+# days (created within N days), hours (also offset by hour), engagement (field: inclusive range),
+# media_p (probability of media)
+DEMO_SEED = 999  # Different seed from the main dataset
+BLOCKS = (
+    # Verified accounts talking about JavaScript/Python (recent, for 7-day comparison)
+    {"label": "verified JavaScript", "n": 8, "category": "tech", "topics": ("JavaScript",),
+     "celebs": ("Sam Altman",), "celeb_every": 3, "verified": True, "author_type": "influencer",
+     "days": 7, "hours": True, "engagement": {"likes": (5000, 50000), "retweets": (1000, 20000)}},
+    {"label": "verified Python", "n": 8, "category": "tech", "topics": ("Python",),
+     "celebs": ("Andrej Karpathy",), "celeb_every": 3, "verified": True, "author_type": "influencer",
+     "days": 7, "hours": True, "engagement": {"likes": (5000, 50000), "retweets": (1000, 20000)}},
+    # Verified sports accounts with very high engagement
+    {"label": "verified sports high engagement", "n": 10, "category": "sports", "topics": SPORTS_TOPICS,
+     "celebs": SPORTS_CELEBRITIES, "days": 15, "media_p": 1.0,
+     "engagement": {"likes": (20000, 200000), "retweets": (5000, 50000),
+                    "replies": (500, 5000), "bookmarks": (100, 2000)}},
+    # Recent negative sentiment posts (for "most discussed this week → negative only")
+    {"label": "recent negative sentiment", "n": 15, "sentiment": "negative", "days": 7, "hours": True,
+     "engagement": {"likes": (1000, 15000), "retweets": (500, 8000)}},
+    {"label": "Scorsese entertainment", "n": 8, "category": "entertainment", "topics": ENTERTAINMENT_TOPICS,
+     "celebs": ("Scorsese",), "name": "Scorsese", "days": 21, "media_p": 0.4,
+     "engagement": {"likes": (10000, 100000)}},
+    {"label": "fashion sustainable/runway", "n": 12, "category": "fashion", "topics": FASHION_FOCUS_TOPICS,
+     "days": 26, "media_p": 1.0},
+    {"label": "Spanish fashion", "n": 10, "category": "fashion", "topics": SPANISH_FASHION_TOPICS, "lang": "es",
+     "celebs": FASHION_CELEBRITIES, "celeb_every": 3, "names": FASHION_NAMES, "name": "Rihanna",
+     "days": 21, "media_p": 0.4},
+    {"label": "French art/museums", "n": 10, "category": "art", "topics": FRENCH_ART_TOPICS, "lang": "fr",
+     "celebs": ART_CELEBRITIES, "celeb_every": 3, "names": ART_NAMES, "name": "Banksy",
+     "days": 21, "media_p": 0.4},
+    {"label": "Portuguese sports", "n": 10, "category": "sports", "topics": PORTUGUESE_SPORTS_TOPICS, "lang": "pt",
+     "celebs": PORTUGUESE_SPORTS_CELEBRITIES, "celeb_every": 3, "names": PORTUGUESE_SPORTS_NAMES, "name": "Messi",
+     "days": 21, "media_p": 1.0},
+    # More AI posts (for simple query)
+    {"label": "more AI", "n": 10, "category": "tech", "topics": ("AI",), "days": 16},
+)
 
 def add_demo_tweets():
     """Add targeted tweets for demo queries"""
     
-    # Load existing data
+    # New posts are appended, so only the existing count is needed (read from the sidecar, no load)
     project_root = Path(__file__).parent.parent
-    data_file = project_root / "data" / "mock_x_data.json"
-    with open(data_file, 'r', encoding='utf-8') as f:
-        existing_posts = json.load(f)
-    
-    generator = MockXDataGenerator(seed=999)  # Different seed for demo tweets
-    new_posts = []
-    post_id_start = len(existing_posts)
-    
+    data_file = project_root / config.DATA_FILE
+    post_id_start = read_count(data_file)
     now = datetime.now()
     
-    # 1. Verified accounts talking about JavaScript (recent, for 7-day comparison)
-    print("Adding verified JavaScript tweets...")
-    for i in range(8):
-        days_ago = random.randint(0, 6)  # Within last week
-        hours_ago = random.randint(0, 23)
-        timestamp = now - timedelta(days=days_ago, hours=hours_ago)
-        
-        author = generator._generate_author(category="tech", celebrity_name="Sam Altman" if i % 3 == 0 else None)
-        author["verified"] = True
-        author["author_type"] = "celebrity" if i % 3 == 0 else "influencer"
-        
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        text = generator._generate_post_content("JavaScript", sentiment, "tech", name=None, lang="en")
-        
-        engagement = generator._generate_engagement(author["author_type"])
-        # Boost engagement for verified accounts
-        engagement["likes"] = random.randint(5000, 50000)
-        engagement["retweets"] = random.randint(1000, 20000)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "tech",
-            "topics": ["JavaScript"],
-            "language": "en",
-            "has_media": random.random() > 0.7,
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 2. Verified accounts talking about Python (recent, for 7-day comparison)
-    print("Adding verified Python tweets...")
-    for i in range(8):
-        days_ago = random.randint(0, 6)  # Within last week
-        hours_ago = random.randint(0, 23)
-        timestamp = now - timedelta(days=days_ago, hours=hours_ago)
-        
-        author = generator._generate_author(category="tech", celebrity_name="Andrej Karpathy" if i % 3 == 0 else None)
-        author["verified"] = True
-        author["author_type"] = "celebrity" if i % 3 == 0 else "influencer"
-        
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        text = generator._generate_post_content("Python", sentiment, "tech", name=None, lang="en")
-        
-        engagement = generator._generate_engagement(author["author_type"])
-        engagement["likes"] = random.randint(5000, 50000)
-        engagement["retweets"] = random.randint(1000, 20000)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "tech",
-            "topics": ["Python"],
-            "language": "en",
-            "has_media": random.random() > 0.7,
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 3. Verified sports accounts with high engagement
-    print("Adding verified sports high engagement tweets...")
-    for i in range(10):
-        author = generator._generate_author(category="sports", celebrity_name=random.choice(["Messi", "LeBron", "Serena"]))
-        author["verified"] = True
-        author["author_type"] = "celebrity"
-        
-        topic = random.choice(["Premier League", "NBA", "tennis", "soccer"])
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        text = generator._generate_post_content(topic, sentiment, "sports", name=None, lang="en")
-        
-        # Very high engagement
-        engagement = {
-            "likes": random.randint(20000, 200000),
-            "retweets": random.randint(5000, 50000),
-            "replies": random.randint(500, 5000),
-            "bookmarks": random.randint(100, 2000)
-        }
-        
-        days_ago = random.randint(0, 14)
-        timestamp = now - timedelta(days=days_ago)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "sports",
-            "topics": [topic],
-            "language": "en",
-            "has_media": True,  # Sports posts often have media
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 4. Recent negative sentiment posts (for "most discussed this week → negative only")
-    print("Adding recent negative sentiment tweets...")
-    for i in range(15):
-        days_ago = random.randint(0, 6)  # Within last week
-        hours_ago = random.randint(0, 23)
-        timestamp = now - timedelta(days=days_ago, hours=hours_ago)
-        
-        category, topic = generator._pick_category_and_topic()
-        author = generator._generate_author(category=category)
-        text = generator._generate_post_content(topic, "negative", category, name=None, lang="en")
-        
-        engagement = generator._generate_engagement(author["author_type"])
-        # Boost engagement for discussion
-        engagement["likes"] = random.randint(1000, 15000)
-        engagement["retweets"] = random.randint(500, 8000)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": "negative",
-            "category": category,
-            "topics": [topic],
-            "language": "en",
-            "has_media": random.random() > 0.7,
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 5. Scorsese entertainment posts
-    print("Adding Scorsese entertainment tweets...")
-    for i in range(8):
-        author = generator._generate_author(category="entertainment", celebrity_name="Scorsese")
-        author["verified"] = True
-        
-        topic = random.choice(["Oscar season", "movies", "streaming", "TV shows"])
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        text = generator._generate_post_content(topic, sentiment, "entertainment", name="Scorsese", lang="en")
-        
-        engagement = generator._generate_engagement("celebrity")
-        engagement["likes"] = random.randint(10000, 100000)
-        
-        days_ago = random.randint(0, 20)
-        timestamp = now - timedelta(days=days_ago)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "entertainment",
-            "topics": [topic],
-            "language": "en",
-            "has_media": random.random() > 0.6,
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 6. More fashion sustainable/runway posts
-    print("Adding fashion sustainable/runway tweets...")
-    for i in range(12):
-        topic = random.choice(["sustainable fashion", "runway"])
-        author = generator._generate_author(category="fashion")
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        text = generator._generate_post_content(topic, sentiment, "fashion", name=None, lang="en")
-        
-        engagement = generator._generate_engagement(author["author_type"])
-        days_ago = random.randint(0, 25)
-        timestamp = now - timedelta(days=days_ago)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "fashion",
-            "topics": [topic],
-            "language": "en",
-            "has_media": True,  # Fashion posts often have media
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 7. Spanish fashion posts
-    print("Adding Spanish fashion tweets...")
-    for i in range(10):
-        topic = random.choice(["sustainable fashion", "runway", "streetwear", "haute couture"])
-        author = generator._generate_author(category="fashion", celebrity_name=random.choice(["Rihanna", "Pharrell"]) if i % 3 == 0 else None)
-        if i % 3 == 0:
-            author["verified"] = True
-        
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        name = random.choice(["Rihanna", "Pharrell", "Anna Wintour"]) if random.random() < 0.5 else None
-        text = generator._generate_foreign_content(topic, sentiment, "fashion", name or "Rihanna", "es")
-        
-        engagement = generator._generate_engagement(author["author_type"])
-        days_ago = random.randint(0, 20)
-        timestamp = now - timedelta(days=days_ago)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "fashion",
-            "topics": [topic],
-            "language": "es",
-            "has_media": random.random() > 0.6,
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 8. French art/museums posts
-    print("Adding French art/museums tweets...")
-    for i in range(10):
-        topic = random.choice(["museums", "contemporary art", "galleries", "art market"])
-        author = generator._generate_author(category="art", celebrity_name=random.choice(["Banksy", "Damien Hirst"]) if i % 3 == 0 else None)
-        if i % 3 == 0:
-            author["verified"] = True
-        
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        name = random.choice(["Banksy", "Damien Hirst", "Jeff Koons"]) if random.random() < 0.5 else None
-        text = generator._generate_foreign_content(topic, sentiment, "art", name or "Banksy", "fr")
-        
-        engagement = generator._generate_engagement(author["author_type"])
-        days_ago = random.randint(0, 20)
-        timestamp = now - timedelta(days=days_ago)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "art",
-            "topics": [topic],
-            "language": "fr",
-            "has_media": random.random() > 0.6,
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 9. Portuguese sports posts
-    print("Adding Portuguese sports tweets...")
-    for i in range(10):
-        topic = random.choice(["soccer", "Premier League", "World Cup", "tennis", "F1"])
-        author = generator._generate_author(category="sports", celebrity_name=random.choice(["Messi", "Ronaldo"]) if i % 3 == 0 else None)
-        if i % 3 == 0:
-            author["verified"] = True
-        
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        name = random.choice(["Messi", "Ronaldo", "Mbappé"]) if random.random() < 0.5 else None
-        text = generator._generate_foreign_content(topic, sentiment, "sports", name or "Messi", "pt")
-        
-        engagement = generator._generate_engagement(author["author_type"])
-        days_ago = random.randint(0, 20)
-        timestamp = now - timedelta(days=days_ago)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "sports",
-            "topics": [topic],
-            "language": "pt",
-            "has_media": True,  # Sports posts often have media
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # 10. More AI posts (for simple query)
-    print("Adding more AI tweets...")
-    for i in range(10):
-        author = generator._generate_author(category="tech")
-        sentiment = random.choice(["positive", "negative", "neutral"])
-        text = generator._generate_post_content("AI", sentiment, "tech", name=None, lang="en")
-        
-        engagement = generator._generate_engagement(author["author_type"])
-        days_ago = random.randint(0, 15)
-        timestamp = now - timedelta(days=days_ago)
-        
-        new_posts.append({
-            "id": f"post_{post_id_start + len(new_posts)}",
-            "text": text,
-            "author": author,
-            "created_at": timestamp.isoformat(),
-            "engagement": engagement,
-            "sentiment": sentiment,
-            "category": "tech",
-            "topics": ["AI"],
-            "language": "en",
-            "has_media": random.random() > 0.7,
-            "is_reply": False,
-            "reply_to": None
-        })
-    
-    # Combine and save
-    all_posts = existing_posts + new_posts
-    
-    # Save updated data
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(all_posts, f, indent=2, ensure_ascii=False, default=str)
+    coverage = dict.fromkeys(COVERAGE_KEYS, 0)
+    week_ago_iso = (now - timedelta(days=7)).isoformat()
+    
+    # Blocks are independent and CPU-bound, so they run in separate processes;
+    # results are collected in block order, keeping the output deterministic per seed
+    with ProcessPoolExecutor(max_workers=min(len(BLOCKS), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(_gen_block, spec, DEMO_SEED + k, now) for k, spec in enumerate(BLOCKS)]
+        
+        # Count coverage of the existing posts while the blocks generate (one streaming pass)
+        if data_file.exists():
+            for p in iter_posts(data_file):
+                _tally(coverage, week_ago_iso, p.get('text'), p.get('topics'), p.get('author'),
+                       p.get('engagement'), p.get('category'), p.get('language'),
+                       p.get('sentiment'), p.get('created_at'))
+        
+        new_posts = []
+        for spec, future in zip(BLOCKS, futures):
+            print(f"Adding {spec['label']} tweets...")
+            block_posts = future.result()
+            # New posts are counted as they arrive, so the saved file is never rescanned
+            for post in block_posts:
+                _tally(coverage, week_ago_iso, post.text, post.topics, post.author, post.engagement,
+                       post.category, post.language, post.sentiment, post.created_at)
+            new_posts.extend(block_posts)
+    
+    # Sequential IDs continuing after the existing posts
+    for post_id, post in enumerate(new_posts, post_id_start):
+        post.id = f"post_{post_id}"
+    
+    # Append only the new posts (existing lines are never rewritten)
+    total_posts = append_posts(data_file, new_posts)
     
     print(f"\n✅ Added {len(new_posts)} demo tweets")
-    print(f"Total posts: {len(all_posts)}")
+    print(f"Total posts: {total_posts}")
     
-    # Verify coverage
     print("\n📊 Updated Coverage:")
-    verified_js = sum(1 for p in all_posts if p.get('author', {}).get('verified') and ('javascript' in p.get('text', '').lower() or 'javascript' in [t.lower() for t in p.get('topics', [])]))
-    verified_python = sum(1 for p in all_posts if p.get('author', {}).get('verified') and ('python' in p.get('text', '').lower() or 'python' in [t.lower() for t in p.get('topics', [])]))
-    print(f"  Verified JS: {verified_js}, Verified Python: {verified_python}")
-    
-    verified_sports_high = sum(1 for p in all_posts if p.get('author', {}).get('verified') and p.get('category') == 'sports' and sum(p.get('engagement', {}).values()) > 10000)
-    print(f"  Verified sports high engagement: {verified_sports_high}")
-    
-    week_ago = now - timedelta(days=7)
-    recent_negative = sum(1 for p in all_posts if datetime.fromisoformat(p.get('created_at', '').replace('Z', '+00:00').replace('+00:00', '')) >= week_ago and p.get('sentiment') == 'negative')
-    print(f"  Recent negative: {recent_negative}")
-    
-    scorsese_ent = sum(1 for p in all_posts if 'scorsese' in p.get('author', {}).get('display_name', '').lower() and p.get('category') == 'entertainment')
-    print(f"  Scorsese entertainment: {scorsese_ent}")
-    
-    fashion_sustainable = sum(1 for p in all_posts if p.get('category') == 'fashion' and ('sustainable fashion' in p.get('text', '').lower() or 'sustainable fashion' in [t.lower() for t in p.get('topics', [])]))
-    fashion_runway = sum(1 for p in all_posts if p.get('category') == 'fashion' and ('runway' in p.get('text', '').lower() or 'runway' in [t.lower() for t in p.get('topics', [])]))
-    print(f"  Fashion sustainable: {fashion_sustainable}, runway: {fashion_runway}")
-    
-    spanish_fashion = sum(1 for p in all_posts if p.get('language') == 'es' and p.get('category') == 'fashion')
-    print(f"  Spanish fashion: {spanish_fashion}")
-    
-    french_art_museums = sum(1 for p in all_posts if p.get('language') == 'fr' and p.get('category') == 'art' and ('museum' in p.get('text', '').lower() or 'museums' in [t.lower() for t in p.get('topics', [])]))
-    print(f"  French art/museums: {french_art_museums}")
-    
-    portuguese_sports = sum(1 for p in all_posts if p.get('language') == 'pt' and p.get('category') == 'sports')
-    print(f"  Portuguese sports: {portuguese_sports}")
+    print(f"  Verified JS: {coverage['verified_js']}, Verified Python: {coverage['verified_python']}")
+    print(f"  Verified sports high engagement: {coverage['verified_sports_high']}")
+    print(f"  Recent negative: {coverage['recent_negative']}")
+    print(f"  Scorsese entertainment: {coverage['scorsese_ent']}")
+    print(f"  Fashion sustainable: {coverage['fashion_sustainable']}, runway: {coverage['fashion_runway']}")
+    print(f"  Spanish fashion: {coverage['spanish_fashion']}")
+    print(f"  French art/museums: {coverage['french_art_museums']}")
+    print(f"  Portuguese sports: {coverage['portuguese_sports']}")
 
 if __name__ == "__main__":
     add_demo_tweets()
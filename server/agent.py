@@ -3,16 +3,66 @@ Main Agentic Research Agent
 Implements state machine workflow: plan → execute → analyze → evaluate → refine → critique → summarize
 Supports dynamic transitions including Analyzer → Replan
 """
-import json
-from typing import Dict, List, Optional
-from datetime import datetime
+import logging
+import sys
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Union
 from enum import Enum
 import config
-from grok_client import GrokClient
+from grok_client import GrokClient, JSON_RESPONSE
+from llm_cache import SemanticLLMCache
+from results_view import ResultsView
 from context_manager import ContextManager, ExecutionStep
 from retrieval import HybridRetriever
 from tools import ToolRegistry
-from utils.truncation import create_concise_data_summary, truncate_results_for_llm, truncate_text
+from utils.truncation import truncate_results_for_llm, truncate_text
+
+# Workflow log: state banners at INFO, per-state details at DEBUG (config.LOG_LEVEL).
+# Messages use lazy %-formatting so disabled levels cost one isEnabledFor check.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+logger.setLevel(config.LOG_LEVEL)
+
+
+def _dumps(obj) -> str:
+    """Compact JSON for prompt text and step records (orjson: no whitespace tokens, numpy values serialized)"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _norm_search(step: Dict, query: str) -> Dict:
+    """Refinement search step in the execute contract (falls back to the original query)"""
+    desc = (step.get("description") or "").strip()
+    return {"action": "search", "description": desc or query, "tools": step.get("tools", ["hybrid_search"])}
+
+
+def _norm_filter(step: Dict, query: str) -> Optional[Dict]:
+    """Refinement filter step, or None when it carries no filters"""
+    return {"action": "filter", "filters": step["filters"]} if step.get("filters") else None
+
+
+_ACTION_NORMALIZERS = {"search": _norm_search, "filter": _norm_filter}
+
+
+def _normalize_step(step, query: str) -> Optional[Dict]:
+    """Normalize one refinement next_step; None if it is not executable"""
+    if not isinstance(step, dict):
+        return None
+    action = (step.get("action") or "search").strip().lower()
+    fn = _ACTION_NORMALIZERS.get(action)
+    if fn is None and "search" in action:  # e.g. "hybrid_search", "keyword search"
+        fn = _norm_search
+    return fn(step, query) if fn else None
+
 
 class WorkflowState(Enum):
     """States in the agent workflow state machine"""
@@ -27,6 +77,231 @@ class WorkflowState(Enum):
     COMPLETE = "complete"
 
 
+# Banner label per state, built once (log lines show e.g. "[VALIDATE_RESULTS]")
+_STATE_LABELS = {state: state.value.upper() for state in WorkflowState}
+
+# End-of-run report, logged as one record (steps, iterations, replans, tokens, confidence)
+_RULE = "=" * 70
+_WORKFLOW_FOOTER = "\n".join([
+    _RULE,
+    "✅ Workflow Complete!",
+    _RULE,
+    "Total Steps: %s",
+    "Refinement Iterations: %s",
+    "Replan Cycles: %s",
+    "Total Tokens Used: %s",
+    "Final Confidence: %.2f",
+    _RULE + "\n",
+])
+
+
+@dataclass(slots=True)
+class WorkflowRun:
+    """State carried between the state handlers of one run_workflow call"""
+    query: str
+    max_iterations: int
+    max_replans: int
+    # EVALUATE and CRITIQUE handlers for this run: fast mode gets the skip-only
+    # variants, so the full handlers never test for it
+    evaluate_step: Callable
+    critique_step: Callable
+    # Config flags, read once per run. A skip-if-confident flag is folded into its
+    # threshold (inf when the flag is off), leaving one comparison per state entry.
+    skip_evaluate_above: float = float("inf")
+    skip_critique_above: float = float("inf")
+    speculate_summary: bool = False
+    speculate_analysis: bool = False
+    skip_simple_validation: bool = False
+    simple_plan: bool = False  # _is_simple_plan(plan), set when the plan is made
+    plan: Optional[Dict] = None
+    results: List[Dict] = field(default_factory=list)
+    seen_ids: set = field(default_factory=set)  # ids in `results`, so REFINE only dedups new rows
+    analysis: Optional[Dict] = None
+    # Read off `analysis` by set_analysis (defaults stand in while there is none)
+    confidence: float = 0.5
+    data_quality: str = "medium"
+    summary: Optional[str] = None
+    summary_key: Optional[int] = None  # _fingerprint of the analysis and plan `summary` was written for
+    critique_result: Optional[Dict] = None
+    critique_refine_loop_count: int = 0  # Prevent CRITIQUE → REFINE → CRITIQUE infinite loop
+    max_critique_refine_loops: int = 2
+    previous_confidence: Optional[float] = None  # Track confidence for improvement detection
+    confidence_history: List[float] = field(default_factory=list)  # Track confidence over iterations
+    prefetched_refinement: Optional[Dict] = None  # Refinement returned with the strategy evaluation, consumed by REFINE
+    evaluation: Optional[Dict] = None
+    evaluated_key: Optional[int] = None  # _fingerprint of the inputs behind `evaluation`
+    critiqued_key: Optional[int] = None  # _fingerprint of the inputs behind `critique_result`
+    speculative_summary: Optional[tuple] = None  # (fingerprint of analysis and plan, Future of the summarize response) started after ANALYZE
+    speculative_analysis: Optional[tuple] = None  # (results list, Future of the analyze response) started with VALIDATE_RESULTS
+    
+    def set_analysis(self, analysis: Optional[Dict]):
+        """Replace the analysis and refresh the confidence and data quality read from it"""
+        self.analysis = analysis
+        self.confidence = analysis.get("confidence", 0.5) if analysis else 0.5
+        self.data_quality = analysis.get("data_quality", "medium") if analysis else "medium"
+
+
+# Fallback outputs, copied shallowly into each use (nested values are shared: treat as read-only)
+_FALLBACK_PLAN = {
+    "query_type": "other",
+    "use_tool_calling": False,
+    "steps": [
+        {"step_number": 1, "action": "search", "description": "Search for relevant posts", "tools": ["hybrid_search"]},
+        {"step_number": 2, "action": "analyze", "description": "Analyze retrieved results"}
+    ],
+    "success_criteria": ["Relevant results found", "Analysis completed"],
+    "expected_complexity": "medium"
+}
+_NO_RESULTS_VALIDATION = {
+    "validation_passed": False,
+    "relevance_score": 0.0,
+    "recommendations": ["No results retrieved - need to expand search"],
+    "action": "replan"  # No results = fundamental issue
+}
+_SIMPLE_PLAN_VALIDATION = {
+    "validation_passed": True,
+    "relevance_score": 0.7,
+    "recommendations": [],
+    "action": "proceed"
+}
+
+# System prompts, one constant per role. They take no interpolation, so every call
+# for a role sends a byte-identical prefix that provider-side prompt caching can reuse;
+# the query and data always go in the last user message, after its instruction line.
+PLAN_SYS = """Research planner. Break queries into steps.
+
+Modes:
+1. Plan-based: Exact steps (straightforward queries) - FASTER
+2. Tool-calling: Dynamic tool selection (complex/exploratory queries) - SLOWER
+
+Return JSON:
+{
+    "query_type": "trend_analysis|info_extraction|comparison|sentiment|temporal|other",
+    "use_tool_calling": true/false,
+    "steps": [
+        {"step_number": 1, "action": "search", "description": "...", "tools": ["hybrid_search"]},
+        {"step_number": 2, "action": "filter", "description": "...", "filters": {...}}
+    ],
+    "success_criteria": ["criterion1"],
+    "expected_complexity": "low|medium|high"
+}
+
+Use tool_calling=true ONLY for: very complex multi-step queries requiring iterative tool selection.
+Prefer plan-based (use_tool_calling=false) for: simple searches, single-step queries, straightforward info extraction."""
+
+TOOL_CALLING_SYS = """You are a research assistant that uses tools to find information.
+
+Available tools:
+- keyword_search: Search posts using keyword matching (good for exact terms, hashtags)
+- semantic_search: Search posts using semantic similarity (good for concepts, meaning)
+- hybrid_search: Combines keyword and semantic search (recommended for most queries)
+- user_profile_lookup: Find posts by specific authors
+- temporal_trend_analyzer: Analyze trends over time periods
+- filter_by_metadata: Filter results by sentiment, engagement, verification status
+- batch: Run several of the tools above in parallel in one call
+
+Use tools iteratively to gather comprehensive information. When multiple tool calls are
+independent, prefer the batch tool in one turn over separate turns.
+After seeing tool results, decide if you need more information or can proceed."""
+
+VALIDATE_SYS = """Result validator. Check if retrieved results match query intent.
+
+Return JSON:
+{
+    "validation_passed": true|false,
+    "relevance_score": 0.0-1.0,
+    "recommendations": ["action1", "action2"],
+    "action": "proceed|refine|replan"
+}
+
+Actions:
+- "proceed": Results are relevant enough to analyze (default - prefer this unless results are clearly wrong)
+- "refine": Results are somewhat relevant but need more/better data (only if relevance_score < 0.4)
+- "replan": Results don't match query at all, need completely new strategy (only if relevance_score < 0.3)
+
+Be lenient: Only recommend "refine" or "replan" if results are clearly irrelevant or insufficient. If results are somewhat related to the query, prefer "proceed" to allow analysis."""
+
+ANALYZE_SYS = """Research analyst. Analyze data for patterns, themes, insights.
+
+Return JSON:
+{
+    "main_themes": ["theme1", "theme2"],
+    "key_insights": ["insight1", "insight2"],
+    "sentiment_analysis": {"positive": count, "negative": count, "neutral": count},
+    "engagement_patterns": {...},
+    "notable_findings": ["finding1"],
+    "data_quality": "high|medium|low",
+    "confidence": 0.0-1.0,
+    "gaps_or_limitations": ["gap1"]
+}"""
+
+REFINE_SYS = """You are a research refinement specialist. Evaluate if the current analysis is sufficient or if additional steps are needed.
+
+Return JSON:
+{
+    "refinement_needed": true|false,
+    "reason": "explanation",
+    "next_steps": [
+        {"action": "search", "description": "exact search query to run for this step"}
+    ],
+    "confidence_improvement_expected": 0.0-1.0
+}
+
+For next_steps: use action "search" with a clear "description" that is the exact
+search query to run (e.g. "negative sentiment posts about X", "high engagement
+posts from verified users"). The description will be used as the search query."""
+
+EVAL_SYS = """Strategy evaluator. Determine if plan needs complete revision (not just refinement).
+
+Return JSON:
+{
+    "replan_needed": true|false,
+    "reason": "brief explanation",
+    "suggested_strategy": "new approach if replan needed"
+}
+
+Replan if: confidence < 0.7 (70%) AND (data fundamentally wrong, strategy misaligned, quality issues require different approach).
+Don't replan if: just need more data, need filters, or confidence >= 0.7 with sound strategy."""
+
+CRITIQUE_SYS = """Critique specialist. Review for hallucinations, bias, factual errors.
+
+Return JSON:
+{
+    "critique_passed": true|false,
+    "hallucinations": ["claim1 not supported"],
+    "biases": ["selection bias: only positive"],
+    "corrections": ["correction1"],
+    "confidence_adjustment": -0.1 to 0.1,
+    "revised_summary": null or "corrected summary"
+}
+
+Flag unsupported claims."""
+
+SUMMARY_SYS = """Summarization expert. Create clear, concise summaries.
+
+Structure: Executive Summary, Key Findings, Analysis, Limitations, Recommendations"""
+
+# postanalyze_combined: every task section is always sent; the user message names the tasks to do
+POSTANALYZE_SYS = """Post-analysis reviewer. Complete each task named at the start of the user message and
+return ONE JSON object with one top-level key per task ("evaluation", "refinement", "critique").
+
+## EVALUATION (key "evaluation")
+Determine if plan needs complete revision (not just refinement).
+{"replan_needed": true|false, "reason": "brief explanation", "suggested_strategy": "new approach if replan needed"}
+Replan if: confidence < 0.7 (70%) AND (data fundamentally wrong, strategy misaligned, quality issues require different approach).
+Don't replan if: just need more data, need filters, or confidence >= 0.7 with sound strategy.
+
+## REFINEMENT (key "refinement")
+Evaluate if the current analysis is sufficient or if additional steps are needed: gaps, completeness, need for more searches, confidence.
+{"refinement_needed": true|false, "reason": "explanation", "next_steps": [{"action": "search", "description": "exact search query to run for this step"}], "confidence_improvement_expected": 0.0-1.0}
+For next_steps: use action "search" with a clear "description" that is the exact search query to run
+(e.g. "negative sentiment posts about X", "high engagement posts from verified users").
+
+## CRITIQUE (key "critique")
+Review the summary for hallucinations, bias, factual errors. Flag unsupported claims.
+{"critique_passed": true|false, "hallucinations": ["claim1 not supported"], "biases": ["selection bias: only positive"], "corrections": ["correction1"], "confidence_adjustment": -0.1 to 0.1, "revised_summary": null or "corrected summary"}"""
+
+
 class AgenticResearchAgent:
     """Main agentic research agent using Grok with state machine orchestration"""
     
@@ -40,7 +315,7 @@ class AgenticResearchAgent:
             progress_callback: Optional callback function(event_type, data) for progress updates
             model_config: Optional dict overriding model config (e.g. {"PLANNER_MODEL": "grok-3", ...})
         """
-        self.grok = GrokClient(api_key)
+        self.grok = GrokClient.get_instance(api_key)
         self.context = ContextManager()
         self.retriever = HybridRetriever(data)
         self.tool_registry = ToolRegistry(self.retriever, data)
@@ -48,125 +323,200 @@ class AgenticResearchAgent:
         self.iteration_count = 0
         self.replan_count = 0
         self.progress_callback = progress_callback
+        # Progress event held for coalescing while a workflow runs: (event_type, data, monotonic_ns)
+        self._held_progress: Optional[tuple] = None
+        self._coalesce_progress = False
         self.current_state = WorkflowState.PLAN
         self.model_config = model_config or {}
+        self.results_view: Optional[ResultsView] = None  # columns of the current result set
+        # Runs analyze/summarize calls started ahead of their state (threads are spawned on first use)
+        self._speculation_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="speculative-step")
+        # step type -> {_fingerprint of inputs: output}, reset per workflow (see _memoized)
+        self._step_memo: Dict[str, Dict[int, object]] = {}
+        # _analysis_signature of each analysis the refinement check has seen this workflow
+        self._analysis_signatures: set = set()
+        
+        # Response cache in front of the step LLM calls (semantic tier only if embeddings loaded)
+        self.llm_cache = None
+        if config.ENABLE_LLM_CACHE:
+            self.llm_cache = SemanticLLMCache(
+                self.grok,
+                embed_fn=self._embed_prompt if self.retriever.embedding_model is not None else None,
+                threshold=config.LLM_CACHE_SIMILARITY,
+                ttl=config.LLM_CACHE_TTL,
+                max_entries=config.LLM_CACHE_MAX_ENTRIES,
+                semantic_namespaces=config.LLM_CACHE_SEMANTIC_STEPS,
+                db_path=config.LLM_CACHE_DB
+            )
+    
+    def close(self):
+        """Shut down the speculation threads (queued speculative calls are cancelled)"""
+        self._speculation_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _results_view(self, results: List[Dict]) -> ResultsView:
+        """Column view of `results`, built once and reused by every step until the list changes"""
+        if self.results_view is None or not self.results_view.matches(results):
+            self.results_view = ResultsView.from_results(results, self.retriever.engagement_total)
+        return self.results_view
+    
+    def _embed_prompt(self, text: str):
+        """Embed a prompt with the retriever's model (used by the semantic cache tier)"""
+        return self.retriever.embedding_model.encode([text], show_progress_bar=False)[0]
+    
+    def _cached_call(self, step_type: str, fresh: bool = False, **kwargs) -> Dict:
+        """
+        Call Grok through the response cache, namespaced by step type
+        
+        Args:
+            step_type: Cache namespace (plan, analyze, ...)
+            fresh: Skip the cache lookup (the new response is still stored)
+            **kwargs: GrokClient.call arguments
+        """
+        if self.llm_cache is None:
+            return self.grok.call(**kwargs)
+        if fresh:
+            response = self.grok.call(**kwargs)
+            if response.get("success"):
+                kwargs.pop("on_delta", None)
+                self.llm_cache.set(step_type, response, **kwargs)
+            return response
+        return self.llm_cache.call(step_type, **kwargs)
     
     def _get_model(self, model_type: str) -> str:
         """Get model name for a given type, using override if provided"""
         return self.model_config.get(model_type, getattr(config.ModelConfig, model_type))
     
+    def _step(self, step_name: str, step_type: str, input_data: Dict, output_data: Dict,
+              reasoning: Union[str, Callable[[], str]], model_used: str, tokens_used: Optional[int] = 0) -> ExecutionStep:
+        """
+        Record an execution step stamped with the current time
+        
+        `reasoning` may be a zero-argument function; the step renders it only if its
+        reasoning is ever read (context summaries, exports).
+        """
+        step = ExecutionStep(step_name, step_type, input_data, output_data, reasoning,
+                             time.time_ns(), model_used, tokens_used)
+        self.context.add_step(step)
+        return step
+    
     def _emit_progress(self, event_type: str, data: Dict):
-        """Emit progress event if callback is set"""
-        if self.progress_callback:
+        """
+        Emit progress event if callback is set
+        
+        During run_workflow, 'skipped' events and streamed deltas are held briefly so
+        they can be coalesced: a skip and the completion right after it go out as one
+        'skipped' payload, and deltas within config.EMIT_COALESCE_MS are joined. Other
+        events are sent immediately (after any held one).
+        """
+        if not self.progress_callback:
+            return
+        if not self._coalesce_progress:
+            self.progress_callback(event_type, data)
+            return
+        
+        status = data.get('status')
+        held = self._held_progress
+        if held is not None and held[0] == event_type:
+            held_status = held[1].get('status')
+            if held_status == 'skipped' and status == 'completed':
+                self._held_progress = None
+                self.progress_callback(event_type, {**data, **held[1]})
+                return
+            if held_status == 'streaming' and status == 'streaming':
+                held[1]['delta'] += data.get('delta', '')
+                if time.monotonic_ns() - held[2] >= config.EMIT_COALESCE_MS * 1_000_000:
+                    self._flush_progress()
+                return
+        
+        self._flush_progress()
+        if status in ('skipped', 'streaming'):
+            self._held_progress = (event_type, dict(data), time.monotonic_ns())
+        else:
             self.progress_callback(event_type, data)
     
+    def _flush_progress(self):
+        """Send the held progress event, if any"""
+        held, self._held_progress = self._held_progress, None
+        if held is not None and self.progress_callback:
+            self.progress_callback(held[0], held[1])
+    
     def plan(self, query: str) -> Dict:
         """
         Step 1: Plan - Decompose query into actionable steps
         
-        Uses grok-4-fast-reasoning for complex reasoning
+        Uses grok-4-fast-reasoning for complex reasoning. Plans are memoized across
+        workflows by the "plan" cache namespace: the exact tier matches repeated queries
+        (whitespace-normalized here), the semantic tier near-duplicates.
         """
-        system_prompt = """Research planner. Break queries into steps.
-
-Modes:
-1. Plan-based: Exact steps (straightforward queries) - FASTER
-2. Tool-calling: Dynamic tool selection (complex/exploratory queries) - SLOWER
-
-Return JSON:
-{
-    "query_type": "trend_analysis|info_extraction|comparison|sentiment|temporal|other",
-    "use_tool_calling": true/false,
-    "steps": [
-        {"step_number": 1, "action": "search", "description": "...", "tools": ["hybrid_search"]},
-        {"step_number": 2, "action": "filter", "description": "...", "filters": {...}}
-    ],
-    "success_criteria": ["criterion1"],
-    "expected_complexity": "low|medium|high"
-}
-
-Use tool_calling=true ONLY for: very complex multi-step queries requiring iterative tool selection.
-Prefer plan-based (use_tool_calling=false) for: simple searches, single-step queries, straightforward info extraction."""
-        
-        user_prompt = f"""Query: "{query}"
+        normalized_query = " ".join(query.split())
+        user_prompt = f"""Create a plan. Consider: query type, information needed, analysis required, filters/constraints.
 
-Create a plan. Consider: query type, information needed, analysis required, filters/constraints."""
+Query: "{normalized_query}"""
         
         messages = [{"role": "user", "content": user_prompt}]
         
-        response = self.grok.call(
+        # A replan sends the same prompt again to get a different plan, so it must not be served from cache
+        response = self._cached_call(
+            "plan",
+            fresh=self.replan_count > 0,
             model=self._get_model("PLANNER_MODEL"),
             messages=messages,
-            system_prompt=system_prompt,
-            response_format={"type": "json_object"}
+            system_prompt=PLAN_SYS,
+            response_format=JSON_RESPONSE
         )
         
         if not response.get("success", False):
             # Fallback plan if API fails
-            plan = {
-                "query_type": "other",
-                "use_tool_calling": False,
-                "steps": [
-                    {"step_number": 1, "action": "search", "description": "Search for relevant posts", "tools": ["hybrid_search"]},
-                    {"step_number": 2, "action": "analyze", "description": "Analyze retrieved results"}
-                ],
-                "success_criteria": ["Relevant results found", "Analysis completed"],
-                "expected_complexity": "medium"
-            }
-            plan_content = json.dumps(plan)
+            plan = {**_FALLBACK_PLAN}
+            plan_content = _dumps(plan)
         else:
             plan_content = response["content"]
-            plan = self.grok.parse_json_response(plan_content)
+            plan = self.grok.parse_json_response(plan_content, is_json=response.get("is_json", False))
             
             # Validate plan structure
             if not isinstance(plan, dict) or "steps" not in plan:
-                # Fallback to basic plan
-                plan = {
-                    "query_type": plan.get("query_type", "other"),
-                    "use_tool_calling": False,
-                    "steps": [
-                        {"step_number": 1, "action": "search", "description": "Search for relevant posts", "tools": ["hybrid_search"]},
-                        {"step_number": 2, "action": "analyze", "description": "Analyze retrieved results"}
-                    ],
-                    "success_criteria": ["Relevant results found"],
-                    "expected_complexity": "medium"
-                }
+                # Fallback to basic plan (keeping the query type if the response had one)
+                query_type = plan.get("query_type", "other") if isinstance(plan, dict) else "other"
+                plan = {**_FALLBACK_PLAN, "query_type": query_type}
             
             # Ensure use_tool_calling is set (default to False for speed)
             if "use_tool_calling" not in plan:
                 plan["use_tool_calling"] = False
             
-            # Override: Disable tool calling for simple queries (performance optimization)
-            complexity = plan.get("expected_complexity", "medium").lower()
-            query_type = plan.get("query_type", "other").lower()
-            steps_count = len(plan.get("steps", []))
-            
-            # Simple query heuristics: disable tool calling for faster execution
-            is_simple = (
-                complexity == "low" or
-                steps_count <= 2 or
-                query_type in ["info_extraction", "sentiment"]  # Usually straightforward
-            )
+            # Lower-case the enumerated fields once, so every later check compares plain constants
+            for key in ("query_type", "expected_complexity"):
+                if isinstance(plan.get(key), str):
+                    plan[key] = plan[key].lower()
+            for step in plan["steps"]:
+                if isinstance(step, dict) and isinstance(step.get("action"), str):
+                    step["action"] = step["action"].lower()
             
-            if is_simple and plan.get("use_tool_calling", False):
+            # Override: Disable tool calling for simple queries (performance optimization)
+            if plan.get("use_tool_calling", False) and self._is_simple_plan(plan):
                 plan["use_tool_calling"] = False
-                print(f"   ⚡ Simplified workflow: disabled tool calling for faster execution")
+                logger.debug("   ⚡ Simplified workflow: disabled tool calling for faster execution")
         
         # Store plan
-        step = ExecutionStep(
-            step_name="Planning",
-            step_type="plan",
-            input_data={"query": query},
-            output_data=plan,
-            reasoning=plan_content,
-            timestamp=datetime.now().isoformat(),
-            model_used=self._get_model("PLANNER_MODEL"),
-            tokens_used=response.get("total_tokens", 0)
+        self._step(
+            "Planning", "plan",
+            {"query": query},
+            plan,
+            plan_content,
+            "plan_cache" if response.get("cached") else self._get_model("PLANNER_MODEL"),
+            response.get("total_tokens", 0)
         )
-        self.context.add_step(step)
         self.context.store_intermediate_result("plan", plan)
         
         return plan
     
+    @staticmethod
+    def _is_simple_plan(plan: Dict) -> bool:
+        """Simple query heuristics: low complexity, at most two steps, or a usually straightforward query type"""
+        match plan.get("query_type"):
+            case "info_extraction" | "sentiment":
+                return True
+        return plan.get("expected_complexity") == "low" or len(plan.get("steps", [])) <= 2
+    
     def execute_with_tool_calling(self, query: str, max_tool_calls: int = 5) -> List[Dict]:
         """
         Execute using dynamic tool-calling loop where Grok chooses tools iteratively
@@ -184,33 +534,23 @@ Create a plan. Consider: query type, information needed, analysis required, filt
         # Get tool definitions
         tools = self.tool_registry.get_tool_definitions()
         
-        # Initial system prompt
-        system_prompt = """You are a research assistant that uses tools to find information.
-        
-Available tools:
-- keyword_search: Search posts using keyword matching (good for exact terms, hashtags)
-- semantic_search: Search posts using semantic similarity (good for concepts, meaning)
-- hybrid_search: Combines keyword and semantic search (recommended for most queries)
-- user_profile_lookup: Find posts by specific authors
-- temporal_trend_analyzer: Analyze trends over time periods
-- filter_by_metadata: Filter results by sentiment, engagement, verification status
-
-Use tools iteratively to gather comprehensive information. You can call multiple tools in one turn.
-After seeing tool results, decide if you need more information or can proceed."""
-        
         # Conversation history
         messages = [
             {
                 "role": "user",
-                "content": f"Research query: {query}\n\nUse tools to find relevant information. You can call multiple tools."
+                "content": f"Use tools to find relevant information. You can call multiple tools.\n\nResearch query: {query}"
             }
         ]
         
-        all_results = []
-        seen_post_ids = set()
+        # post id -> post, first occurrence wins (insertion order is retrieval order)
+        unique_by_id: Dict[str, Dict] = {}
+        max_results = config.MAX_RETRIEVAL_RESULTS
         tool_call_count = 0
         total_tokens = 0
         tool_calls_history = []
+        # Index in `messages` where each turn (assistant message + its tool results) starts
+        turn_starts: List[int] = []
+        summarized_tools: List[str] = []  # names of the tool calls folded into the history note
         
         # Emit initial tool calling start
         self._emit_progress('executing', {
@@ -225,7 +565,7 @@ After seeing tool results, decide if you need more information or can proceed.""
             response = self.grok.call(
                 model=self._get_model("PLANNER_MODEL"),  # Use planner model for tool selection
                 messages=messages,
-                system_prompt=system_prompt,
+                system_prompt=TOOL_CALLING_SYS,
                 tools=tools,
                 tool_choice="auto",
                 max_tokens=500,
@@ -233,7 +573,7 @@ After seeing tool results, decide if you need more information or can proceed.""
             )
             
             if not response.get("success"):
-                print(f"⚠️ Tool calling API error: {response.get('error', 'Unknown error')}")
+                logger.warning("⚠️ Tool calling API error: %s", response.get('error', 'Unknown error'))
                 total_tokens += response.get("total_tokens", 0)
                 break
             
@@ -241,6 +581,7 @@ After seeing tool results, decide if you need more information or can proceed.""
             
             # Add assistant message to conversation
             assistant_message = {"role": "assistant", "content": response.get("content", "")}
+            turn_starts.append(len(messages))
             messages.append(assistant_message)
             
             # Check for tool calls
@@ -250,30 +591,30 @@ After seeing tool results, decide if you need more information or can proceed.""
                 # No more tool calls - Grok is done
                 self._emit_progress('executing', {
                     'status': 'completed',
-                    'message': f'Tool calling completed. Retrieved {len(all_results)} results',
+                    'message': f'Tool calling completed. Retrieved {len(unique_by_id)} results',
                     'tool_calling_mode': True,
                     'tool_calls': tool_calls_history,
-                    'total_results': len(all_results),
+                    'total_results': len(unique_by_id),
                     'total_tool_calls': tool_call_count
                 })
                 break
             
-            # Execute each tool call
-            tool_results = []
-            iteration_tool_calls = []
-            
+            # Parse every call of this turn first: the tools are independent retrievals,
+            # so they run concurrently and are then collected in call order
+            parsed_calls = []
             for tool_call in tool_calls:
                 tool_call_count += 1
-                function_name = tool_call["function"]["name"]
-                function_args_str = tool_call["function"]["arguments"]
+                fn = tool_call["function"]
+                function_name = fn["name"]
+                function_args_str = fn["arguments"]
                 
                 # Parse arguments
                 try:
-                    function_args = json.loads(function_args_str)
-                except json.JSONDecodeError:
+                    function_args = orjson.loads(function_args_str)
+                except orjson.JSONDecodeError:
                     function_args = {}
                 
-                print(f"🔧 Calling tool: {function_name} with args: {function_args}")
+                logger.debug("🔧 Calling tool: %s with args: %s", function_name, function_args)
                 
                 # Emit tool call start
                 self._emit_progress('executing', {
@@ -286,42 +627,52 @@ After seeing tool results, decide if you need more information or can proceed.""
                         'status': 'executing'
                     }
                 })
-                
-                # Execute tool
-                tool_result = self.tool_registry.call_tool(function_name, function_args)
-                
+                parsed_calls.append((tool_call["id"], function_name, function_args))
+            
+            # Execute tools
+            if len(parsed_calls) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(parsed_calls))) as pool:
+                    outcomes = list(pool.map(lambda c: self.tool_registry.call_tool(c[1], c[2]), parsed_calls))
+            else:
+                outcomes = [self.tool_registry.call_tool(name, args) for _, name, args in parsed_calls]
+            
+            tool_results = []
+            iteration_tool_calls = []
+            
+            for (tc_id, function_name, function_args), tool_result in zip(parsed_calls, outcomes):
                 # Collect results
                 results_count = 0
                 if tool_result.get("success"):
                     results = tool_result.get("results", [])
                     results_count = len(results)
-                    for result in results:
-                        post_id = result.get("id")
-                        if post_id and post_id not in seen_post_ids:
-                            seen_post_ids.add(post_id)
-                            all_results.append(result)
+                    # Stop taking posts at the cap (the turn's remaining calls still go into the history)
+                    for r in results:
+                        if len(unique_by_id) >= max_results:
+                            break
+                        post_id = r.get("id")
+                        if post_id:
+                            unique_by_id.setdefault(post_id, r)
                     
-                    tool_results.append({
-                        "tool_call_id": tool_call["id"],
-                        "role": "tool",
-                        "name": function_name,
-                        "content": json.dumps({
-                            "success": True,
-                            "message": tool_result.get("message", ""),
-                            "results_count": len(results),
-                            "sample_results": results[:3] if results else []
-                        })
-                    })
+                    tool_content = {
+                        "success": True,
+                        "message": tool_result.get("message", ""),
+                        "results_count": len(results),
+                        "sample_results": results[:3] if results else []
+                    }
+                    if "invocations" in tool_result:
+                        tool_content["invocations"] = tool_result["invocations"]  # per-call outcomes of a batch
+                    content = _dumps(tool_content)
                 else:
-                    tool_results.append({
-                        "tool_call_id": tool_call["id"],
-                        "role": "tool",
-                        "name": function_name,
-                        "content": json.dumps({
-                            "success": False,
-                            "message": tool_result.get("message", "Tool execution failed")
-                        })
+                    content = _dumps({
+                        "success": False,
+                        "message": tool_result.get("message", "Tool execution failed")
                     })
+                tool_results.append({
+                    "tool_call_id": tc_id,
+                    "role": "tool",
+                    "name": function_name,
+                    "content": content
+                })
                 
                 # Track tool call for history
                 iteration_tool_calls.append({
@@ -336,22 +687,37 @@ After seeing tool results, decide if you need more information or can proceed.""
             tool_calls_history.extend(iteration_tool_calls)
             self._emit_progress('executing', {
                 'status': 'tool_calling',
-                'message': f'Completed {len(iteration_tool_calls)} tool call(s). Total results: {len(all_results)}',
+                'message': f'Completed {len(iteration_tool_calls)} tool call(s). Total results: {len(unique_by_id)}',
                 'tool_calling_mode': True,
                 'tool_calls': tool_calls_history,
-                'total_results': len(all_results),
+                'total_results': len(unique_by_id),
                 'iteration': len(tool_calls_history)
             })
             
             # Add tool results to conversation
             messages.extend(tool_results)
             
-            # Limit total results
-            if len(all_results) >= config.MAX_RETRIEVAL_RESULTS:
+            # Keep the query and the latest turns; older turns become one short note so
+            # each Grok call carries a bounded history instead of every earlier tool output
+            keep = config.TOOL_CALLING_HISTORY_TURNS
+            if len(messages) > config.TOOL_CALLING_MAX_MESSAGES and len(turn_starts) > keep:
+                cut = turn_starts[-keep]
+                summarized_tools.extend(m["name"] for m in messages[1:cut] if m["role"] == "tool")
+                messages[1:cut] = [{
+                    "role": "system",
+                    "content": (
+                        f"[{len(summarized_tools)} earlier tool calls summarized: {', '.join(summarized_tools)}, "
+                        f"cumulative results: {len(unique_by_id)}]"
+                    )
+                }]
+                shift = cut - 2
+                turn_starts = [i - shift for i in turn_starts[-keep:]]
+            
+            # Cap reached: no further Grok turn
+            if len(unique_by_id) >= max_results:
                 break
         
-        # Limit and deduplicate final results
-        final_results = all_results[:config.MAX_RETRIEVAL_RESULTS]
+        final_results = list(unique_by_id.values())
         
         # Emit final completion
         self._emit_progress('executing', {
@@ -365,17 +731,14 @@ After seeing tool results, decide if you need more information or can proceed.""
         })
         
         # Log execution step
-        step = ExecutionStep(
-            step_name="Tool-Calling Execution",
-            step_type="execute",
-            input_data={"query": query, "max_tool_calls": max_tool_calls},
-            output_data={"results_count": len(final_results), "tool_calls_made": tool_call_count, "tool_calls": tool_calls_history},
-            reasoning=f"Used {tool_call_count} tool calls to retrieve {len(final_results)} results",
-            timestamp=datetime.now().isoformat(),
-            model_used=self._get_model("PLANNER_MODEL"),
-            tokens_used=total_tokens
+        self._step(
+            "Tool-Calling Execution", "execute",
+            {"query": query, "max_tool_calls": max_tool_calls},
+            {"results_count": len(final_results), "tool_calls_made": tool_call_count, "tool_calls": tool_calls_history},
+            f"Used {tool_call_count} tool calls to retrieve {len(final_results)} results",
+            self._get_model("PLANNER_MODEL"),
+            total_tokens
         )
-        self.context.add_step(step)
         self.context.store_intermediate_result("execution_results", final_results)
         
         return final_results
@@ -387,89 +750,36 @@ After seeing tool results, decide if you need more information or can proceed.""
         Returns:
             Dict with "validation_passed", "relevance_score", "recommendations", "action"
         """
+        # Only an empty result set fails outright; even 1-2 results might be sufficient for analysis
         if not results:
-            validation = {
-                "validation_passed": False,
-                "relevance_score": 0.0,
-                "recommendations": ["No results retrieved - need to expand search"],
-                "action": "replan"  # No results = fundamental issue
-            }
-            step = ExecutionStep(
-                step_name="Result Validation",
-                step_type="validate",
-                input_data={"results_count": 0},
-                output_data=validation,
-                reasoning="No results retrieved - validation failed",
-                timestamp=datetime.now().isoformat(),
-                model_used="validation_logic",
-                tokens_used=0
-            )
-            self.context.add_step(step)
-            return validation
-        
-        # Check result count - only trigger refinement if no results at all
-        # Even 1-2 results might be sufficient for analysis
-        if len(results) == 0:
-            validation = {
-                "validation_passed": False,
-                "relevance_score": 0.0,
-                "recommendations": ["No results retrieved - need to expand search"],
-                "action": "replan"
-            }
-            step = ExecutionStep(
-                step_name="Result Validation",
-                step_type="validate",
-                input_data={"results_count": 0},
-                output_data=validation,
-                reasoning="No results retrieved - need to replan",
-                timestamp=datetime.now().isoformat(),
-                model_used="validation_logic",
-                tokens_used=0
+            validation = {**_NO_RESULTS_VALIDATION}
+            self._step(
+                "Result Validation", "validate",
+                {"results_count": 0},
+                validation,
+                "No results retrieved - validation failed",
+                "validation_logic",
+                0
             )
-            self.context.add_step(step)
             return validation
         
-        system_prompt = """Result validator. Check if retrieved results match query intent.
-        
-Return JSON:
-{
-    "validation_passed": true|false,
-    "relevance_score": 0.0-1.0,
-    "recommendations": ["action1", "action2"],
-    "action": "proceed|refine|replan"
-}
-
-Actions:
-- "proceed": Results are relevant enough to analyze (default - prefer this unless results are clearly wrong)
-- "refine": Results are somewhat relevant but need more/better data (only if relevance_score < 0.4)
-- "replan": Results don't match query at all, need completely new strategy (only if relevance_score < 0.3)
-
-Be lenient: Only recommend "refine" or "replan" if results are clearly irrelevant or insufficient. If results are somewhat related to the query, prefer "proceed" to allow analysis."""
-        
-        # Sample results for validation
-        sample_size = min(5, len(results))
-        sample_results = results[:sample_size]
+        # Sample the leading results straight from the shared view (only those rows are rendered)
+        data_summary = self._results_view(results).concise_summary(query, max_items=5, max_text_length=100)
         
-        data_summary = create_concise_data_summary(
-            sample_results,
-            query,
-            max_items=sample_size,
-            max_text_length=100
-        )
-        
-        user_prompt = f"""Query: {query}
-Plan: {json.dumps({'query_type': plan.get('query_type'), 'steps_count': len(plan.get('steps', []))}, separators=(',', ':'))}
-Retrieved Results ({len(results)} total): {data_summary}
+        user_prompt = f"""Validate: Do these results match the query intent? Are they relevant?
 
-Validate: Do these results match the query intent? Are they relevant?"""
+Query: {query}
+Plan: {_dumps({'query_type': plan.get('query_type'), 'steps_count': len(plan.get('steps', []))})}
+Retrieved Results ({len(results)} total): {data_summary}"""
         
         messages = [{"role": "user", "content": user_prompt}]
         
-        response = self.grok.call(
+        response = self._cached_call(
+            "validate",
             model=self._get_model("ANALYZER_MODEL"),
             messages=messages,
-            system_prompt=system_prompt,
-            response_format={"type": "json_object"}
+            system_prompt=VALIDATE_SYS,
+            response_format=JSON_RESPONSE
         )
         
         if not response.get("success", False):
@@ -480,10 +790,10 @@ Validate: Do these results match the query intent? Are they relevant?"""
                 "recommendations": [],
                 "action": "proceed"
             }
-            validation_content = json.dumps(validation)
+            validation_content = _dumps(validation)
         else:
             validation_content = response["content"]
-            validation = self.grok.parse_json_response(validation_content)
+            validation = self.grok.parse_json_response(validation_content, is_json=response.get("is_json", False))
             if not isinstance(validation, dict):
                 validation = {"validation_passed": True, "relevance_score": 0.6, "action": "proceed"}
             if "action" not in validation:
@@ -491,17 +801,14 @@ Validate: Do these results match the query intent? Are they relevant?"""
             if "relevance_score" not in validation:
                 validation["relevance_score"] = 0.7 if validation.get("validation_passed") else 0.4
         
-        step = ExecutionStep(
-            step_name="Result Validation",
-            step_type="validate",
-            input_data={"results_count": len(results)},
-            output_data=validation,
-            reasoning=validation_content,
-            timestamp=datetime.now().isoformat(),
-            model_used=self._get_model("ANALYZER_MODEL"),
-            tokens_used=response.get("total_tokens", 0)
+        self._step(
+            "Result Validation", "validate",
+            {"results_count": len(results)},
+            validation,
+            validation_content,
+            self._get_model("ANALYZER_MODEL"),
+            response.get("total_tokens", 0)
         )
-        self.context.add_step(step)
         
         return validation
     
@@ -533,102 +840,69 @@ Validate: Do these results match the query intent? Are they relevant?"""
         
         # Plan-based execution (original approach)
         steps = plan.get("steps", [])
-        all_results = []
-        
-        for step in steps:
-            action = (step.get("action") or "search").lower()
-            tools = step.get("tools", ["hybrid_search"])
-            if isinstance(tools, str):
-                tools = [tools]
-            
-            if action == "search":
-                search_query = step.get("description") or query
-                if "hybrid_search" in tools or "semantic_search" in tools:
-                    results = self.retriever.hybrid_search(search_query)
-                elif "keyword_search" in tools:
-                    results = self.retriever.keyword_search(search_query)
-                    results = [post for post, _ in results]
-                else:
-                    results = self.retriever.hybrid_search(search_query)
-                all_results.extend(results)
-            
-            elif action == "filter":
-                filters = step.get("filters", {})
-                if filters:
-                    all_results = self.retriever.filter_by_metadata(all_results, filters)
-        
-        # Remove duplicates
-        seen_ids = set()
-        unique_results = []
-        for result in all_results:
-            if result["id"] not in seen_ids:
-                seen_ids.add(result["id"])
-                unique_results.append(result)
+        actions = [step.get("action") or "search" for step in steps]  # lower-cased by plan()
+        
+        # Search steps don't depend on each other, so run them all concurrently up front;
+        # the loop below then replays the steps in plan order with the results in hand
+        search_steps = [step for step, action in zip(steps, actions) if action == "search"]
+        if len(search_steps) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(search_steps))) as pool:
+                search_results = iter(pool.map(lambda s: self._search_step(s, query), search_steps))
+        else:
+            search_results = (self._search_step(s, query) for s in search_steps)
+        
+        # Deduplicated as results arrive: post id -> post, each id kept at its first position
+        unique_by_id: Dict = {}
+        for step, action in zip(steps, actions):
+            match action:
+                case "search":
+                    for r in next(search_results):
+                        unique_by_id.setdefault(r.get("id", id(r)), r)
+                case "filter":
+                    filters = step.get("filters", {})
+                    if filters:
+                        kept = self.retriever.filter_by_metadata(list(unique_by_id.values()), filters)
+                        unique_by_id = {r.get("id", id(r)): r for r in kept}
         
         # Limit results
-        max_results = config.MAX_RETRIEVAL_RESULTS
-        unique_results = unique_results[:max_results]
-        
-        step = ExecutionStep(
-            step_name="Execution",
-            step_type="execute",
-            input_data={"plan": plan},
-            output_data={"results_count": len(unique_results), "sample_results": unique_results[:3]},
-            reasoning=f"Retrieved {len(unique_results)} relevant items",
-            timestamp=datetime.now().isoformat(),
-            model_used="retrieval_system",
-            tokens_used=0
+        unique_results = list(islice(unique_by_id.values(), config.MAX_RETRIEVAL_RESULTS))
+        
+        self._step(
+            "Execution", "execute",
+            {"plan": plan},
+            {"results_count": len(unique_results), "sample_results": [{"id": r.get("id")} for r in unique_results[:3]]},
+            f"Retrieved {len(unique_results)} relevant items",
+            "retrieval_system",
+            0
         )
-        self.context.add_step(step)
         self.context.store_intermediate_result("execution_results", unique_results)
         
         return unique_results
     
-    def analyze(self, query: str, results: List[Dict], plan: Dict) -> Dict:
+    def _search_step(self, step: Dict, query: str) -> List[Dict]:
+        """Run one plan search step (its description is the search query, else the original query)"""
+        tools = step.get("tools", ["hybrid_search"])
+        if isinstance(tools, str):
+            tools = [tools]
+        
+        search_query = step.get("description") or query
+        if "hybrid_search" in tools or "semantic_search" in tools:
+            return self.retriever.hybrid_search(search_query)
+        elif "keyword_search" in tools:
+            return [post for post, _ in self.retriever.keyword_search(search_query)]
+        return self.retriever.hybrid_search(search_query)
+    
+    def analyze(self, query: str, results: List[Dict], plan: Dict, response: Optional[Dict] = None) -> Dict:
         """
         Step 3: Analyze - Deep analysis of retrieved data
         
         Uses grok-4-fast-reasoning for complex reasoning
-        """
-        system_prompt = """Research analyst. Analyze data for patterns, themes, insights.
-
-Return JSON:
-{
-    "main_themes": ["theme1", "theme2"],
-    "key_insights": ["insight1", "insight2"],
-    "sentiment_analysis": {"positive": count, "negative": count, "neutral": count},
-    "engagement_patterns": {...},
-    "notable_findings": ["finding1"],
-    "data_quality": "high|medium|low",
-    "confidence": 0.0-1.0,
-    "gaps_or_limitations": ["gap1"]
-}"""
         
-        # Use optimized truncation utility
-        data_summary = create_concise_data_summary(
-            results,
-            query,
-            max_items=config.ANALYZE_SAMPLE_SIZE,
-            max_text_length=config.ANALYZE_TEXT_LENGTH
-        )
-        
-        # Truncate plan steps for prompt
-        plan_steps = plan.get('steps', [])[:3]  # Only include first 3 steps
-        
-        user_prompt = f"""{data_summary}
-
-Plan steps: {json.dumps(plan_steps, separators=(',', ':'))}
-
-Analyze and return JSON."""
-        
-        messages = [{"role": "user", "content": user_prompt}]
-        
-        response = self.grok.call(
-            model=config.ModelConfig.ANALYZER_MODEL,
-            messages=messages,
-            system_prompt=system_prompt,
-            response_format={"type": "json_object"}
-        )
+        Args:
+            response: The LLM response for these inputs, if already fetched (see _analyze_call)
+        """
+        if response is None:
+            response = self._analyze_call(query, results, plan)
         
         if not response.get("success", False):
             # Fallback analysis if API fails
@@ -640,10 +914,10 @@ Analyze and return JSON."""
                 "data_quality": "unknown",
                 "gaps_or_limitations": ["API error prevented full analysis"]
             }
-            analysis_content = json.dumps(analysis)
+            analysis_content = _dumps(analysis)
         else:
             analysis_content = response["content"]
-            analysis = self.grok.parse_json_response(analysis_content)
+            analysis = self.grok.parse_json_response(analysis_content, is_json=response.get("is_json", False))
             
             # Ensure required fields exist
             if "confidence" not in analysis:
@@ -651,21 +925,50 @@ Analyze and return JSON."""
             if "main_themes" not in analysis:
                 analysis["main_themes"] = []
         
-        step = ExecutionStep(
-            step_name="Analysis",
-            step_type="analyze",
-            input_data={"results_count": len(results)},
-            output_data=analysis,
-            reasoning=analysis_content,
-            timestamp=datetime.now().isoformat(),
-            model_used=self._get_model("ANALYZER_MODEL"),
-            tokens_used=response.get("total_tokens", 0)
+        self._step(
+            "Analysis", "analyze",
+            {"results_count": len(results)},
+            analysis,
+            analysis_content,
+            self._get_model("ANALYZER_MODEL"),
+            response.get("total_tokens", 0)
         )
-        self.context.add_step(step)
         self.context.store_intermediate_result("analysis", analysis)
         
         return analysis
     
+    def _analyze_call(self, query: str, results: List[Dict], plan: Dict) -> Dict:
+        """
+        The analyze LLM call on its own (no parsing, no execution step)
+        
+        Runs on a speculation thread while VALIDATE_RESULTS is in flight, so the
+        results view must already be built for `results`.
+        """
+        data_summary = self._results_view(results).concise_summary(
+            query,
+            max_items=config.ANALYZE_SAMPLE_SIZE,
+            max_text_length=config.ANALYZE_TEXT_LENGTH
+        )
+        
+        # Truncate plan steps for prompt
+        plan_steps = plan.get('steps', [])[:3]  # Only include first 3 steps
+        
+        user_prompt = f"""Analyze and return JSON.
+
+{data_summary}
+
+Plan steps: {_dumps(plan_steps)}"""
+        
+        messages = [{"role": "user", "content": user_prompt}]
+        
+        return self._cached_call(
+            "analyze",
+            model=config.ModelConfig.ANALYZER_MODEL,
+            messages=messages,
+            system_prompt=ANALYZE_SYS,
+            response_format=JSON_RESPONSE
+        )
+    
     def refine(self, query: str, analysis: Dict, plan: Dict, previous_confidence: Optional[float] = None) -> Dict:
         """
         Step 4: Refine - Determine if refinement is needed
@@ -678,12 +981,107 @@ Analyze and return JSON."""
             plan: Original plan
             previous_confidence: Confidence from previous iteration (for stagnation detection)
         """
+        refinement = self._refine_precheck(analysis, previous_confidence)
+        if refinement is not None:
+            return refinement
+        
+        user_prompt = f"""Evaluate if refinement needed: gaps, completeness, need for more searches, confidence.
+
+Query: {query}
+
+Analysis: {_dumps(analysis)}
+Plan: {_dumps(plan)}"""
+        
+        messages = [{"role": "user", "content": user_prompt}]
+        
+        response = self._cached_call(
+            "refine",
+            model=self._get_model("REFINER_MODEL"),
+            messages=messages,
+            system_prompt=REFINE_SYS,
+            response_format=JSON_RESPONSE
+        )
+        
+        if not response.get("success", False):
+            refinement = {
+                "refinement_needed": False,
+                "reason": "API error - skipping refinement to avoid invalid state",
+                "next_steps": []
+            }
+            self._step(
+                "Refinement", "refine",
+                {"analysis": analysis},
+                refinement,
+                "Refinement API call failed; treating as no refinement needed",
+                config.ModelConfig.REFINER_MODEL,
+                0
+            )
+            return refinement
+        
+        refinement_content = response["content"]
+        refinement = self._normalize_refinement(
+            self.grok.parse_json_response(refinement_content, is_json=response.get("is_json", False)),
+            query
+        )
+        
+        self._step(
+            "Refinement", "refine",
+            {"analysis": analysis},
+            refinement,
+            refinement_content,
+            config.ModelConfig.REFINER_MODEL,
+            response.get("total_tokens", 0)
+        )
+        
+        return refinement
+    
+    @staticmethod
+    def _min_refinement_gain(iteration: int) -> float:
+        """Confidence gain refinement iteration `iteration` (1-based) must deliver to keep refining"""
+        return config.REFINEMENT_MIN_GAIN * 2 ** (max(iteration, 1) - 1)
+    
+    @staticmethod
+    def _analysis_signature(analysis: Dict) -> int:
+        """Order-insensitive hash of an analysis's main themes and key insights"""
+        items = [*(analysis.get("main_themes") or []), *(analysis.get("key_insights") or [])]
+        return hash(frozenset(map(str, items)))
+    
+    def _refine_precheck(self, analysis: Dict, previous_confidence: Optional[float]) -> Optional[Dict]:
+        """
+        Decide refinement without the LLM when the analysis is repeating itself, or
+        confidence is stagnant or already high
+        
+        Returns:
+            The (logged) refinement decision, or None if the LLM needs to decide
+        """
         confidence = analysis.get("confidence", 0.5)
+        signature = self._analysis_signature(analysis)
+        seen = signature in self._analysis_signatures
+        self._analysis_signatures.add(signature)
         
-        # Check if confidence improved from previous iteration
         if previous_confidence is not None:
+            if self.iteration_count > 0 and seen:
+                # A refinement brought back the same themes and insights: further
+                # rounds would only loop (whatever confidence the model reports)
+                refinement = {
+                    "refinement_needed": False,
+                    "reason": "Analysis repeated an earlier one (same themes and insights) - loop detected",
+                    "next_steps": [],
+                    "analysis_repeated": True
+                }
+                self._step(
+                    "Refinement Check", "refine",
+                    {"confidence": confidence, "previous_confidence": previous_confidence},
+                    refinement,
+                    "Analysis signature repeated after refinement",
+                    "decision_logic",
+                    0
+                )
+                return refinement
+            
+            # Check if confidence improved from previous iteration
             confidence_delta = confidence - previous_confidence
-            if confidence_delta < 0.05 and self.iteration_count > 0:
+            if self.iteration_count > 0 and confidence_delta < self._min_refinement_gain(self.iteration_count):
                 # Confidence not improving - might be stuck
                 refinement = {
                     "refinement_needed": False,
@@ -691,95 +1089,38 @@ Analyze and return JSON."""
                     "next_steps": [],
                     "confidence_stagnant": True
                 }
-                step = ExecutionStep(
-                    step_name="Refinement Check",
-                    step_type="refine",
-                    input_data={"confidence": confidence, "previous_confidence": previous_confidence},
-                    output_data=refinement,
-                    reasoning=f"Confidence stagnation detected: {previous_confidence:.2f} -> {confidence:.2f}",
-                    timestamp=datetime.now().isoformat(),
-                    model_used="decision_logic",
-                    tokens_used=0
+                self._step(
+                    "Refinement Check", "refine",
+                    {"confidence": confidence, "previous_confidence": previous_confidence},
+                    refinement,
+                    f"Confidence stagnation detected: {previous_confidence:.2f} -> {confidence:.2f}",
+                    "decision_logic",
+                    0
                 )
-                self.context.add_step(step)
                 return refinement
         
         # If confidence is high, skip refinement (optimized threshold)
-        if confidence > 0.85:  # Increased from 0.75 to catch more cases needing refinement
+        if confidence > config.HIGH_CONFIDENCE_THRESHOLD:  # Increased from 0.75 to catch more cases needing refinement
             refinement = {
                 "refinement_needed": False,
                 "reason": "High confidence achieved",
                 "next_steps": []
             }
             
-            step = ExecutionStep(
-                step_name="Refinement Check",
-                step_type="refine",
-                input_data={"confidence": confidence},
-                output_data=refinement,
-                reasoning="High confidence - no refinement needed",
-                timestamp=datetime.now().isoformat(),
-                model_used="decision_logic",
-                tokens_used=0
+            self._step(
+                "Refinement Check", "refine",
+                {"confidence": confidence},
+                refinement,
+                "High confidence - no refinement needed",
+                "decision_logic",
+                0
             )
-            self.context.add_step(step)
             return refinement
         
-        system_prompt = """You are a research refinement specialist. Evaluate if the current 
-        analysis is sufficient or if additional steps are needed.
-        
-        Return JSON:
-        {
-            "refinement_needed": true|false,
-            "reason": "explanation",
-            "next_steps": [
-                {"action": "search", "description": "exact search query to run for this step"}
-            ],
-            "confidence_improvement_expected": 0.0-1.0
-        }
-        
-        For next_steps: use action "search" with a clear "description" that is the exact 
-        search query to run (e.g. "negative sentiment posts about X", "high engagement 
-        posts from verified users"). The description will be used as the search query."""
-        
-        user_prompt = f"""Query: {query}
-
-Analysis: {json.dumps(analysis, indent=2)}
-Plan: {json.dumps(plan, indent=2)}
-
-Evaluate if refinement needed: gaps, completeness, need for more searches, confidence."""
-        
-        messages = [{"role": "user", "content": user_prompt}]
-        
-        response = self.grok.call(
-            model=self._get_model("REFINER_MODEL"),
-            messages=messages,
-            system_prompt=system_prompt,
-            response_format={"type": "json_object"}
-        )
-        
-        if not response.get("success", False):
-            refinement = {
-                "refinement_needed": False,
-                "reason": "API error - skipping refinement to avoid invalid state",
-                "next_steps": []
-            }
-            step = ExecutionStep(
-                step_name="Refinement",
-                step_type="refine",
-                input_data={"analysis": analysis},
-                output_data=refinement,
-                reasoning="Refinement API call failed; treating as no refinement needed",
-                timestamp=datetime.now().isoformat(),
-                model_used=config.ModelConfig.REFINER_MODEL,
-                tokens_used=0
-            )
-            self.context.add_step(step)
-            return refinement
-        
-        refinement_content = response["content"]
-        refinement = self.grok.parse_json_response(refinement_content)
-        
+        return None
+    
+    def _normalize_refinement(self, refinement, query: str) -> Dict:
+        """Coerce a parsed refinement response into the shape the workflow executes"""
         # Validate structure
         if not isinstance(refinement, dict):
             refinement = {"refinement_needed": False, "reason": "Invalid refinement response", "next_steps": []}
@@ -791,33 +1132,11 @@ Evaluate if refinement needed: gaps, completeness, need for more searches, confi
             refinement["reason"] = "Refinement check completed"
         
         # Normalize next_steps: ensure action + description for execute contract
-        normalized = []
-        for s in refinement["next_steps"]:
-            if not isinstance(s, dict):
-                continue
-            action = (s.get("action") or "search").lower()
-            desc = (s.get("description") or "").strip()
-            if "search" in action:
-                normalized.append({"action": "search", "description": desc or query, "tools": s.get("tools", ["hybrid_search"])})
-            elif action == "filter" and s.get("filters"):
-                normalized.append({"action": "filter", "filters": s["filters"]})
+        normalized = [x for x in (_normalize_step(s, query) for s in refinement["next_steps"]) if x]
         refinement["next_steps"] = normalized
         if not normalized and refinement.get("refinement_needed"):
             refinement["refinement_needed"] = False
             refinement["reason"] = (refinement.get("reason") or "") + " (no executable steps after normalization)"
-
-        step = ExecutionStep(
-            step_name="Refinement",
-            step_type="refine",
-            input_data={"analysis": analysis},
-            output_data=refinement,
-            reasoning=refinement_content,
-            timestamp=datetime.now().isoformat(),
-            model_used=config.ModelConfig.REFINER_MODEL,
-            tokens_used=response.get("total_tokens", 0)
-        )
-        self.context.add_step(step)
-        
         return refinement
     
     def evaluate_for_replan(self, query: str, analysis: Dict, plan: Dict, results: List[Dict]) -> Dict:
@@ -832,27 +1151,9 @@ Evaluate if refinement needed: gaps, completeness, need for more searches, confi
         Returns:
             Dict with "replan_needed" (bool), "reason", "suggested_strategy"
         """
-        system_prompt = """Strategy evaluator. Determine if plan needs complete revision (not just refinement).
-
-Return JSON:
-{
-    "replan_needed": true|false,
-    "reason": "brief explanation",
-    "suggested_strategy": "new approach if replan needed"
-}
-
-Replan if: confidence < 0.7 (70%) AND (data fundamentally wrong, strategy misaligned, quality issues require different approach).
-Don't replan if: just need more data, need filters, or confidence >= 0.7 with sound strategy."""
-        
         # Analyze data quality signals
         sentiment_dist = analysis.get("sentiment_analysis", {}) or {}
-        total_sentiment = sum(v for v in sentiment_dist.values() if isinstance(v, (int, float)))
-        neg = sentiment_dist.get("negative", 0)
-        neg = neg if isinstance(neg, (int, float)) else 0
-        if total_sentiment > 0:
-            sarcasm_ratio = neg / total_sentiment
-        else:
-            sarcasm_ratio = 0
+        sarcasm_ratio = self._sarcasm_ratio(sentiment_dist)
         
         data_quality = analysis.get("data_quality", "medium")
         confidence = analysis.get("confidence", 0.5)
@@ -867,21 +1168,22 @@ Don't replan if: just need more data, need filters, or confidence >= 0.7 with so
             "sentiment_dist": sentiment_dist
         }
         
-        user_prompt = f"""Query: {query}
-Plan: {json.dumps(plan_summary, separators=(',', ':'))}
-Analysis: {json.dumps(analysis_summary, separators=(',', ':'))}
-Results: {len(results)} items, sarcasm_ratio: {sarcasm_ratio:.2f}
+        user_prompt = f"""Evaluate: replan needed (fundamental strategy wrong) or refine (more data needed)?
+Consider replanning if confidence < 0.7 (70%) and strategy appears misaligned.
 
-Evaluate: replan needed (fundamental strategy wrong) or refine (more data needed)?
-Consider replanning if confidence < 0.7 (70%) and strategy appears misaligned."""
+Query: {query}
+Plan: {_dumps(plan_summary)}
+Analysis: {_dumps(analysis_summary)}
+Results: {len(results)} items, sarcasm_ratio: {sarcasm_ratio:.2f}"""
         
         messages = [{"role": "user", "content": user_prompt}]
         
-        response = self.grok.call(
+        response = self._cached_call(
+            "evaluate",
             model=self._get_model("REFINER_MODEL"),  # Reuse refiner model for evaluation
             messages=messages,
-            system_prompt=system_prompt,
-            response_format={"type": "json_object"}
+            system_prompt=EVAL_SYS,
+            response_format=JSON_RESPONSE
         )
         
         if not response.get("success", False):
@@ -891,26 +1193,69 @@ Consider replanning if confidence < 0.7 (70%) and strategy appears misaligned.""
                 "suggested_strategy": None
             }
         else:
-            evaluation = self.grok.parse_json_response(response["content"])
-            if not isinstance(evaluation, dict):
-                evaluation = {"replan_needed": False, "reason": "Invalid response", "suggested_strategy": None}
-            if "replan_needed" not in evaluation:
-                evaluation["replan_needed"] = False
-        
-        step = ExecutionStep(
-            step_name="Strategy Evaluation",
-            step_type="evaluate",
-            input_data={"analysis": analysis, "results_count": len(results)},
-            output_data=evaluation,
-            reasoning=response.get("content", json.dumps(evaluation)),
-            timestamp=datetime.now().isoformat(),
-            model_used=config.ModelConfig.REFINER_MODEL,
-            tokens_used=response.get("total_tokens", 0)
+            evaluation = self._normalize_evaluation(
+                self.grok.parse_json_response(response["content"], is_json=response.get("is_json", False))
+            )
+        
+        self._step(
+            "Strategy Evaluation", "evaluate",
+            {"analysis": analysis, "results_count": len(results)},
+            evaluation,
+            response["content"] if "content" in response else partial(_dumps, evaluation),
+            config.ModelConfig.REFINER_MODEL,
+            response.get("total_tokens", 0)
         )
-        self.context.add_step(step)
         
         return evaluation
     
+    @staticmethod
+    def _fingerprint(*parts) -> int:
+        """Hash of step inputs (key order ignored), to tell when a step would see the same data again"""
+        return hash(orjson.dumps(parts, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
+    
+    def _memoized(self, step_type: str, key_parts: tuple, fn, *args, **kwargs):
+        """
+        Call fn(*args, **kwargs) unless this workflow already ran the step on the same inputs
+        
+        A refinement that adds no new results loops back through VALIDATE_RESULTS and
+        ANALYZE with an unchanged result set; the memo returns the earlier output instead
+        of repeating the LLM call (and its execution step).
+        """
+        memo = self._step_memo.setdefault(step_type, {})
+        key = self._fingerprint(*key_parts)
+        if key in memo:
+            logger.debug("   ♻️  Reusing %s output (inputs unchanged)", step_type)
+            return memo[key]
+        memo[key] = fn(*args, **kwargs)
+        return memo[key]
+    
+    def _analyze_key(self, query: str, results: List[Dict], plan: Dict) -> tuple:
+        """Memo key parts for analyze(): the query, plan and result ids (in order)"""
+        return (query, self._results_view(results).ids.tolist(), plan)
+    
+    def _analyze_memoized(self, query: str, results: List[Dict], plan: Dict, response: Optional[Dict] = None) -> Dict:
+        """analyze(), reused while the query, plan and result ids (in order) are unchanged"""
+        return self._memoized("analyze", self._analyze_key(query, results, plan), self.analyze, query, results, plan, response)
+    
+    @staticmethod
+    def _sarcasm_ratio(sentiment_dist: Dict) -> float:
+        """Share of negative posts in an analysis sentiment distribution (0 if empty)"""
+        total_sentiment = sum(v for v in sentiment_dist.values() if isinstance(v, (int, float)))
+        neg = sentiment_dist.get("negative", 0)
+        neg = neg if isinstance(neg, (int, float)) else 0
+        if total_sentiment > 0:
+            return neg / total_sentiment
+        return 0
+    
+    @staticmethod
+    def _normalize_evaluation(evaluation) -> Dict:
+        """Coerce a parsed strategy evaluation into a dict with a replan_needed flag"""
+        if not isinstance(evaluation, dict):
+            evaluation = {"replan_needed": False, "reason": "Invalid response", "suggested_strategy": None}
+        if "replan_needed" not in evaluation:
+            evaluation["replan_needed"] = False
+        return evaluation
+    
     def critique(self, query: str, analysis: Dict, plan: Dict, results: List[Dict], summary: str) -> Dict:
         """
         Critique step: Review analysis and summary for hallucinations and bias
@@ -924,23 +1269,7 @@ Consider replanning if confidence < 0.7 (70%) and strategy appears misaligned.""
         Returns:
             Dict with "critique_passed" (bool), "hallucinations", "biases", "corrections"
         """
-        system_prompt = """Critique specialist. Review for hallucinations, bias, factual errors.
-
-Return JSON:
-{
-    "critique_passed": true|false,
-    "hallucinations": ["claim1 not supported"],
-    "biases": ["selection bias: only positive"],
-    "corrections": ["correction1"],
-    "confidence_adjustment": -0.1 to 0.1,
-    "revised_summary": null or "corrected summary"
-}
-
-Flag unsupported claims."""
-        
-        # Use truncation utility
-        data_sample = create_concise_data_summary(
-            results,
+        data_sample = self._results_view(results).concise_summary(
             query,
             max_items=config.CRITIQUE_SAMPLE_SIZE,
             max_text_length=100
@@ -954,20 +1283,21 @@ Flag unsupported claims."""
         }
         summary_truncated = truncate_text(summary, max_chars=500)
         
-        user_prompt = f"""Query: {query}
-Data: {data_sample}
-Analysis: {json.dumps(analysis_summary, separators=(',', ':'))}
-Summary: {summary_truncated}
+        user_prompt = f"""Check: claims supported? hallucinations? bias? balanced?
 
-Check: claims supported? hallucinations? bias? balanced?"""
+Query: {query}
+Data: {data_sample}
+Analysis: {_dumps(analysis_summary)}
+Summary: {summary_truncated}"""
         
         messages = [{"role": "user", "content": user_prompt}]
         
-        response = self.grok.call(
+        response = self._cached_call(
+            "critique",
             model=config.ModelConfig.ANALYZER_MODEL,
             messages=messages,
-            system_prompt=system_prompt,
-            response_format={"type": "json_object"}
+            system_prompt=CRITIQUE_SYS,
+            response_format=JSON_RESPONSE
         )
         
         if not response.get("success", False):
@@ -980,36 +1310,183 @@ Check: claims supported? hallucinations? bias? balanced?"""
                 "revised_summary": None
             }
         else:
-            critique = self.grok.parse_json_response(response["content"])
-            if not isinstance(critique, dict):
-                critique = {"critique_passed": True, "hallucinations": [], "biases": [], "corrections": []}
-            if "critique_passed" not in critique:
-                critique["critique_passed"] = len(critique.get("hallucinations", [])) == 0
-        
-        step = ExecutionStep(
-            step_name="Critique",
-            step_type="critique",
-            input_data={"results_count": len(results)},
-            output_data=critique,
-            reasoning=response.get("content", json.dumps(critique)),
-            timestamp=datetime.now().isoformat(),
-            model_used=self._get_model("ANALYZER_MODEL"),
-            tokens_used=response.get("total_tokens", 0)
+            critique = self._normalize_critique(
+                self.grok.parse_json_response(response["content"], is_json=response.get("is_json", False))
+            )
+        
+        self._step(
+            "Critique", "critique",
+            {"results_count": len(results)},
+            critique,
+            response["content"] if "content" in response else partial(_dumps, critique),
+            self._get_model("ANALYZER_MODEL"),
+            response.get("total_tokens", 0)
         )
-        self.context.add_step(step)
         
         return critique
     
-    def summarize(self, query: str, analysis: Dict, plan: Dict) -> str:
+    @staticmethod
+    def _normalize_critique(critique) -> Dict:
+        """Coerce a parsed critique into a dict with a critique_passed flag"""
+        if not isinstance(critique, dict):
+            critique = {"critique_passed": True, "hallucinations": [], "biases": [], "corrections": []}
+        if "critique_passed" not in critique:
+            critique["critique_passed"] = len(critique.get("hallucinations", [])) == 0
+        return critique
+    
+    def postanalyze_combined(
+        self,
+        query: str,
+        analysis: Dict,
+        plan: Dict,
+        results: List[Dict],
+        summary: Optional[str] = None,
+        previous_confidence: Optional[float] = None,
+        with_refinement: bool = True
+    ) -> Dict:
+        """
+        Strategy evaluation, refinement check and (given a summary) critique in one LLM call
+        
+        The three reviews read the same query/analysis/plan context, so one multi-task
+        prompt replaces up to three round trips. Sections the model leaves out, or a
+        failed call, fall back to the individual methods.
+        
+        Args:
+            query: Research query
+            analysis: Current analysis results
+            plan: Current plan
+            results: Retrieved results
+            summary: Summary to critique; no critique section without it
+            previous_confidence: Confidence from previous iteration (for stagnation detection)
+            with_refinement: Include the refinement check
+            
+        Returns:
+            Dict with "evaluation", plus "refinement" and "critique" when requested
+        """
+        tasks = ["evaluation"]
+        refinement = None
+        if with_refinement:
+            # Stagnant or high confidence is decided without the LLM, as in refine()
+            refinement = self._refine_precheck(analysis, previous_confidence)
+            if refinement is None:
+                tasks.append("refinement")
+        if summary is not None:
+            tasks.append("critique")
+        
+        sentiment_dist = analysis.get("sentiment_analysis", {}) or {}
+        user_prompt = f"""Complete: {', '.join(tasks)}.
+
+Query: {query}
+Plan: {_dumps(plan)}
+Analysis: {_dumps(analysis)}
+Results: {len(results)} items, sarcasm_ratio: {self._sarcasm_ratio(sentiment_dist):.2f}"""
+        if summary is not None:
+            data_sample = self._results_view(results).concise_summary(
+                query,
+                max_items=config.CRITIQUE_SAMPLE_SIZE,
+                max_text_length=100
+            )
+            user_prompt += f"""
+Data: {data_sample}
+Summary: {truncate_text(summary, max_chars=500)}"""
+        response = self._cached_call(
+            "postanalyze",
+            model=self._get_model("REFINER_MODEL"),
+            messages=[{"role": "user", "content": user_prompt}],
+            system_prompt=POSTANALYZE_SYS,
+            response_format=JSON_RESPONSE
+        )
+        
+        parsed = {}
+        if response.get("success", False):
+            parsed = self.grok.parse_json_response(response["content"], is_json=response.get("is_json", False))
+            if not isinstance(parsed, dict):
+                parsed = {}
+        
+        combined = {}
+        tokens = response.get("total_tokens", 0)  # charged to the first step logged from this call
+        
+        if isinstance(parsed.get("evaluation"), dict):
+            combined["evaluation"] = self._normalize_evaluation(parsed["evaluation"])
+            self._step(
+                "Strategy Evaluation", "evaluate",
+                {"analysis": analysis, "results_count": len(results)},
+                combined["evaluation"],
+                partial(_dumps, combined["evaluation"]),
+                self._get_model("REFINER_MODEL"),
+                tokens
+            )
+            tokens = 0
+        else:
+            combined["evaluation"] = self.evaluate_for_replan(query, analysis, plan, results)
+        
+        if with_refinement:
+            if refinement is None and isinstance(parsed.get("refinement"), dict):
+                refinement = self._normalize_refinement(parsed["refinement"], query)
+                self._step(
+                    "Refinement", "refine",
+                    {"analysis": analysis},
+                    refinement,
+                    partial(_dumps, refinement),
+                    self._get_model("REFINER_MODEL"),
+                    tokens
+                )
+                tokens = 0
+            elif refinement is None:
+                refinement = self.refine(query, analysis, plan, previous_confidence)
+            combined["refinement"] = refinement
+        
+        if summary is not None:
+            if isinstance(parsed.get("critique"), dict):
+                combined["critique"] = self._normalize_critique(parsed["critique"])
+                self._step(
+                    "Critique", "critique",
+                    {"results_count": len(results)},
+                    combined["critique"],
+                    partial(_dumps, combined["critique"]),
+                    self._get_model("REFINER_MODEL"),
+                    tokens
+                )
+            else:
+                combined["critique"] = self.critique(query, analysis, plan, results, summary)
+        
+        return combined
+    
+    def summarize(self, query: str, analysis: Dict, plan: Dict, stream: bool = True) -> str:
         """
         Step 5: Summarize - Generate final comprehensive summary
         
         Uses grok-4-fast-reasoning for high-quality summaries
+        
+        Args:
+            stream: Stream deltas to the progress callback
         """
-        system_prompt = """Summarization expert. Create clear, concise summaries.
-
-Structure: Executive Summary, Key Findings, Analysis, Limitations, Recommendations"""
+        # With a progress listener, stream the summary as it is generated, batching
+        # deltas so the client gets a few dozen updates rather than one per token
+        pending = []
+        def on_delta(text: str):
+            pending.append(text)
+            if sum(map(len, pending)) >= config.SUMMARY_STREAM_CHARS:
+                self._emit_progress('summarizing', {'status': 'streaming', 'delta': "".join(pending)})
+                pending.clear()
+        
+        response = self._summarize_call(query, analysis, plan, on_delta if self.progress_callback and stream else None)
+        if pending:
+            self._emit_progress('summarizing', {'status': 'streaming', 'delta': "".join(pending)})
+        
+        return self._record_summary(analysis, response)
+    
+    def _summarize_call(self, query: str, analysis: Dict, plan: Dict,
+                        on_delta: Optional[Callable[[str], None]] = None) -> Dict:
+        """
+        Summary LLM call, without recording a step (safe to run ahead speculatively)
         
+        Args:
+            on_delta: Optional callback for streamed text deltas
+        
+        Returns:
+            Raw response dict from the Grok client
+        """
         # Truncate for summary prompt
         analysis_summary = {
             "main_themes": analysis.get("main_themes", [])[:5],
@@ -1019,21 +1496,26 @@ Structure: Executive Summary, Key Findings, Analysis, Limitations, Recommendatio
         }
         plan_summary = {"steps_count": len(plan.get("steps", [])), "query_type": plan.get("query_type", "other")}
         
-        user_prompt = f"""Query: {query}
-Plan: {json.dumps(plan_summary, separators=(',', ':'))}
-Analysis: {json.dumps(analysis_summary, separators=(',', ':'))}
+        user_prompt = f"""Create concise summary answering the query.
 
-Create concise summary answering the query."""
+Query: {query}
+Plan: {_dumps(plan_summary)}
+Analysis: {_dumps(analysis_summary)}"""
         
         messages = [{"role": "user", "content": user_prompt}]
         
-        response = self.grok.call(
+        stream_kwargs = {"on_delta": on_delta} if on_delta else {}
+        return self._cached_call(
+            "summarize",
             model=self._get_model("SUMMARIZER_MODEL"),
             messages=messages,
-            system_prompt=system_prompt,
-            max_tokens=config.MAX_TOKENS_SUMMARY
+            system_prompt=SUMMARY_SYS,
+            max_tokens=config.MAX_TOKENS_SUMMARY,
+            **stream_kwargs
         )
-        
+    
+    def _record_summary(self, analysis: Dict, response: Dict) -> str:
+        """Summary text from a _summarize_call response, recorded as the Summarization step"""
         if not response.get("success", False):
             summary = (
                 "Summary could not be generated due to an API error. "
@@ -1042,27 +1524,551 @@ Create concise summary answering the query."""
         else:
             summary = response["content"]
         
-        step = ExecutionStep(
-            step_name="Summarization",
-            step_type="summarize",
-            input_data={"analysis": analysis},
-            output_data={"summary": summary},
-            reasoning=summary,
-            timestamp=datetime.now().isoformat(),
-            model_used=self._get_model("SUMMARIZER_MODEL"),
-            tokens_used=response.get("total_tokens", 0)
+        self._step(
+            "Summarization", "summarize",
+            {"analysis": analysis},
+            {"summary": summary},
+            summary,
+            self._get_model("SUMMARIZER_MODEL"),
+            response.get("total_tokens", 0)
         )
-        self.context.add_step(step)
         
         return summary
     
+    def _take_summary(self, speculative: Optional[tuple], query: str, analysis: Dict, plan: Dict) -> str:
+        """
+        Summary for the current analysis
+        
+        Uses the speculative summary started after ANALYZE when it was built from this
+        same analysis and plan; otherwise (refinement changed the analysis) cancels it if
+        still queued and generates one. The Summarization step is recorded only for the
+        summary actually used.
+        
+        Args:
+            speculative: (fingerprint of analysis and plan, Future of the summarize response) or None
+        """
+        if speculative is not None:
+            if speculative[0] == self._fingerprint(analysis, plan):
+                summary = self._record_summary(analysis, speculative[1].result())
+                self._emit_progress('summarizing', {'status': 'streaming', 'delta': summary})
+                return summary
+            speculative[1].cancel()
+        return self._memoized("summarize", (query, analysis, plan), self.summarize, query, analysis, plan)
+    
+    def _summary_current(self, run: WorkflowRun) -> bool:
+        """
+        True if run.summary was written for the current analysis and plan
+        
+        A summary (or a critique's revision of it) stays valid while its analysis is
+        unchanged, so a critique → refine cycle that adds nothing keeps the draft.
+        """
+        return run.summary is not None and run.summary_key == self._fingerprint(run.analysis, run.plan)
+    
+    def _write_summary(self, run: WorkflowRun):
+        """Summarize the current analysis into run.summary"""
+        speculative, run.speculative_summary = run.speculative_summary, None
+        run.summary = self._take_summary(speculative, run.query, run.analysis, run.plan)
+        run.summary_key = self._fingerprint(run.analysis, run.plan)
+    
+    def _handle_plan(self, run: WorkflowRun) -> Optional[Callable]:
+        """PLAN → EXECUTE"""
+        self.current_state = WorkflowState.PLAN
+        logger.info("📋 [%s] Planning...", _STATE_LABELS[self.current_state])
+        self._emit_progress('planning', {'status': 'started', 'message': 'Analyzing query and creating plan...'})
+        run.plan = self.plan(run.query)
+        run.simple_plan = self._is_simple_plan(run.plan)
+        
+        plan_summary = f"Created a {run.plan.get('expected_complexity', 'medium')} complexity plan for a {run.plan.get('query_type', 'unknown')} query. "
+        plan_summary += f"Identified {len(run.plan.get('steps', []))} execution steps."
+        
+        self._emit_progress('planning', {
+            'status': 'completed',
+            'query_type': run.plan.get('query_type', 'unknown'),
+            'steps_count': len(run.plan.get('steps', [])),
+            'complexity': run.plan.get('expected_complexity', 'unknown'),
+            'summary': plan_summary
+        })
+        logger.debug("   Query Type: %s", run.plan.get('query_type', 'unknown'))
+        logger.debug("   Steps Planned: %s\n", len(run.plan.get('steps', [])))
+        
+        return self._handle_execute
+    
+    def _handle_execute(self, run: WorkflowRun) -> Optional[Callable]:
+        """EXECUTE → VALIDATE_RESULTS, or ANALYZE for a simple plan"""
+        self.current_state = WorkflowState.EXECUTE
+        logger.info("⚙️  [%s] Executing retrieval...", _STATE_LABELS[self.current_state])
+        self._emit_progress('executing', {'status': 'started', 'message': 'Retrieving relevant data...'})
+        run.results = self.execute(run.plan, run.query)
+        run.seen_ids = {r.get("id", id(r)) for r in run.results}
+        
+        execute_summary = f"Retrieved {len(run.results)} relevant items from the dataset."
+        self._emit_progress('executing', {
+            'status': 'completed', 
+            'results_count': len(run.results),
+            'summary': execute_summary
+        })
+        logger.debug("   Retrieved: %s items\n", len(run.results))
+        
+        if (run.skip_simple_validation and run.simple_plan
+                and len(run.results) >= config.SIMPLE_PLAN_MIN_RESULTS):
+            # A simple plan's first retrieval goes straight to analysis (a thin or empty one is
+            # still validated, e.g. to trigger the replan); refined results are always validated
+            logger.info("✅ [%s] Skipping validation (simple plan)\n", _STATE_LABELS[WorkflowState.VALIDATE_RESULTS])
+            self._step(
+                "Result Validation", "validate",
+                {"results_count": len(run.results)},
+                {**_SIMPLE_PLAN_VALIDATION},
+                "Simple plan with enough results - validation skipped",
+                "validation_logic",
+                0
+            )
+            self._emit_progress('validating', {
+                'status': 'skipped',
+                'reason': 'Simple plan',
+                'summary': 'Validation skipped for simple plan'
+            })
+            return self._handle_analyze
+        return self._handle_validate_results
+    
+    def _handle_validate_results(self, run: WorkflowRun) -> Optional[Callable]:
+        """VALIDATE_RESULTS → ANALYZE, or REFINE/PLAN when results are off-target"""
+        self.current_state = WorkflowState.VALIDATE_RESULTS
+        logger.info("✅ [%s] Validating result quality...", _STATE_LABELS[self.current_state])
+        self._emit_progress('validating', {'status': 'started', 'message': 'Validating result relevance...'})
+        if run.speculative_analysis is not None:
+            run.speculative_analysis[1].cancel()  # left over from results ANALYZE never used
+        run.speculative_analysis = None
+        if run.speculate_analysis and run.results:
+            # Analysis reads the same inputs as validation, so its LLM call goes out now;
+            # it is dropped if validation sends the run to REFINE or PLAN instead
+            analyze_key = self._fingerprint(*self._analyze_key(run.query, run.results, run.plan))
+            if analyze_key not in self._step_memo.get("analyze", {}):
+                run.speculative_analysis = (
+                    run.results,
+                    self._speculation_pool.submit(self._analyze_call, run.query, run.results, run.plan)
+                )
+        validation = self.validate_results(run.query, run.results, run.plan)
+        
+        action = validation.get("action", "proceed")
+        relevance_score = validation.get("relevance_score", 0.5)
+        validation_passed = validation.get("validation_passed", True)
+        
+        validation_summary = f"Validation {'passed' if validation_passed else 'failed'} (relevance: {relevance_score:.2f})"
+        self._emit_progress('validating', {
+            'status': 'completed',
+            'validation_passed': validation_passed,
+            'relevance_score': relevance_score,
+            'action': action,
+            'summary': validation_summary
+        })
+        
+        if action == "replan" and self.replan_count < run.max_replans:
+            # Only replan if relevance is very low (< 0.3)
+            if relevance_score < 0.3:
+                self.replan_count += 1
+                logger.warning("   ⚠️  Very low relevance (%.2f) - replanning needed", relevance_score)
+                logger.debug("   Reason: %s", validation.get('recommendations', ['Low relevance']))
+                run.results = []
+                run.set_analysis(None)
+                run.previous_confidence = None
+                run.confidence_history = []
+                return self._handle_plan
+            else:
+                # Relevance not low enough for replan - proceed to analyze
+                logger.debug("   ✅ Results validated (relevance: %.2f) - proceeding to analyze", relevance_score)
+                return self._handle_analyze
+        elif action == "refine" and relevance_score < 0.4:
+            # Only refine if explicitly requested AND relevance is low (but not terrible)
+            logger.warning("   ⚠️  Low relevance (%.2f) - triggering refinement", relevance_score)
+            recommendations = validation.get("recommendations", ["Expand search"])
+            # Create refinement plan from validation recommendations
+            refinement = {
+                "refinement_needed": True,
+                "reason": f"Low result relevance ({relevance_score:.2f}): {', '.join(recommendations)}",
+                "next_steps": [{"action": "search", "description": rec, "tools": ["hybrid_search"]} 
+                              for rec in recommendations[:2]]  # Limit to 2 steps
+            }
+            # Store refinement for REFINE state
+            self.context.store_intermediate_result("pending_refinement", refinement)
+            return self._handle_refine
+        else:
+            # Default: proceed to analyze (even if relevance is moderate)
+            logger.debug("   ✅ Results validated (relevance: %.2f)", relevance_score)
+            return self._handle_analyze
+    
+    def _handle_analyze(self, run: WorkflowRun) -> Optional[Callable]:
+        """ANALYZE → EVALUATE"""
+        self.current_state = WorkflowState.ANALYZE
+        logger.info("🔍 [%s] Analyzing results...", _STATE_LABELS[self.current_state])
+        self._emit_progress('analyzing', {'status': 'started', 'message': 'Analyzing retrieved data...'})
+        speculative, run.speculative_analysis = run.speculative_analysis, None
+        response = None
+        if speculative is not None:
+            if speculative[0] is run.results:
+                response = speculative[1].result()
+            else:
+                speculative[1].cancel()
+        run.set_analysis(self._analyze_memoized(run.query, run.results, run.plan, response))
+        confidence = run.confidence
+        
+        # Track confidence history
+        run.confidence_history.append(confidence)
+        run.previous_confidence = run.confidence_history[-2] if len(run.confidence_history) > 1 else None
+        
+        analyze_summary = f"Analysis completed with {confidence:.0%} confidence."
+        self._emit_progress('analyzing', {
+            'status': 'completed',
+            'confidence': confidence,
+            'main_themes': run.analysis.get('main_themes', [])[:3],
+            'summary': analyze_summary
+        })
+        logger.debug("   Confidence: %.2f", confidence)
+        if run.previous_confidence is not None:
+            delta = confidence - run.previous_confidence
+            logger.debug("   Confidence Change: %+.2f (from %.2f)", delta, run.previous_confidence)
+        logger.debug("   Main Themes: %s\n", run.analysis.get('main_themes', [])[:3])
+        
+        if run.speculate_summary:
+            # Fast mode goes from here to the refinement check and then the summary, so
+            # start the summary now; it is discarded if refinement changes the analysis
+            run.speculative_summary = (
+                self._fingerprint(run.analysis, run.plan),
+                self._speculation_pool.submit(self._summarize_call, run.query, run.analysis, run.plan)
+            )
+        
+        return run.evaluate_step
+    
+    def _handle_evaluate(self, run: WorkflowRun) -> Optional[Callable]:
+        """EVALUATE → PLAN (replan) or REFINE"""
+        self.current_state = WorkflowState.EVALUATE
+        # Only skip if BOTH high confidence AND good data quality
+        skip_evaluate = run.confidence > run.skip_evaluate_above and run.data_quality == "high"
+        
+        evaluate_key = self._fingerprint(run.analysis, run.plan, len(run.results))
+        
+        if skip_evaluate:
+            logger.info("🔎 [%s] Skipping evaluation (high confidence)\n", _STATE_LABELS[self.current_state])
+            run.evaluation = {"replan_needed": False, "reason": "Skipped for performance", "suggested_strategy": None}
+            self._emit_progress('evaluating', {
+                'status': 'skipped',
+                'reason': 'High confidence',
+                'summary': 'Evaluation skipped for performance'
+            })
+        elif run.evaluation is not None and evaluate_key == run.evaluated_key:
+            # Refinement left the analysis unchanged, so the last verdict still holds
+            logger.info("🔎 [%s] Skipping evaluation (analysis unchanged)\n", _STATE_LABELS[self.current_state])
+            self._emit_progress('evaluating', {
+                'status': 'skipped',
+                'short_circuit': 'analysis_unchanged',
+                'reason': 'Analysis unchanged since last evaluation',
+                'summary': 'Evaluation reused (analysis unchanged)'
+            })
+        else:
+            logger.info("🔎 [%s] Evaluating strategy...", _STATE_LABELS[self.current_state])
+            self._emit_progress('evaluating', {'status': 'started', 'message': 'Evaluating if replan needed...'})
+            # Refine usually follows a sound evaluation, so ask for both in one call
+            # (the refinement is dropped if evaluation asks for a replan)
+            with_refinement = (
+                self.iteration_count < run.max_iterations
+                and not self.context.get_intermediate_result("pending_refinement")
+            )
+            combined = self.postanalyze_combined(
+                run.query, run.analysis, run.plan, run.results,
+                previous_confidence=run.previous_confidence,
+                with_refinement=with_refinement
+            )
+            run.evaluation = combined["evaluation"]
+            run.evaluated_key = evaluate_key
+            run.prefetched_refinement = combined.get("refinement")
+        
+        replan_needed = run.evaluation.get("replan_needed", False)
+        
+        # Emit evaluation completion
+        eval_summary = "Strategy evaluation completed"
+        if replan_needed:
+            eval_summary += f" - Replan needed: {run.evaluation.get('reason', '')}"
+        else:
+            eval_summary += " - Strategy is sound"
+        
+        self._emit_progress('evaluating', {
+            'status': 'completed',
+            'replan_needed': replan_needed,
+            'reason': run.evaluation.get('reason', ''),
+            'summary': eval_summary
+        })
+        
+        if replan_needed and self.replan_count < run.max_replans:
+            self.replan_count += 1
+            logger.warning("   ⚠️  Replan needed: %s", run.evaluation.get('reason', ''))
+            logger.debug("   Suggested strategy: %s", run.evaluation.get('suggested_strategy', 'N/A'))
+            logger.debug("   Replanning (attempt %s/%s)...\n", self.replan_count, run.max_replans)
+            self._emit_progress('replanning', {
+                'status': 'replanning',
+                'reason': run.evaluation.get('reason', ''),
+                'attempt': self.replan_count,
+                'summary': f"Replanning due to: {run.evaluation.get('reason', '')}"
+            })
+            # Reset results/analysis for new plan
+            run.results = []
+            run.set_analysis(None)
+            run.prefetched_refinement = None  # was for the abandoned plan
+            return self._handle_plan
+        else:
+            if replan_needed:
+                logger.debug("   Max replans reached (%s), proceeding with current plan\n", run.max_replans)
+            else:
+                logger.debug("   Strategy is sound, proceeding to refinement\n")
+            return self._handle_refine
+    
+    def _handle_refine(self, run: WorkflowRun) -> Optional[Callable]:
+        """REFINE → VALIDATE_RESULTS (refinement executed), CRITIQUE, or SUMMARIZE (critique loop cap)"""
+        self.current_state = WorkflowState.REFINE
+        iteration = self.iteration_count + 1
+        if iteration > run.max_iterations:
+            logger.debug("   Max refinement iterations reached (%s), proceeding to critique\n", run.max_iterations)
+            return run.critique_step
+        
+        logger.info("🔄 [%s] Refinement Check (Iteration %s)...", _STATE_LABELS[self.current_state], iteration)
+        self._emit_progress('refining', {
+            'status': 'checking',
+            'iteration': iteration,
+            'message': f'Checking if refinement needed (iteration {iteration})...'
+        })
+        
+        # Check if there's a pending refinement from VALIDATE_RESULTS
+        pending_refinement = self.context.get_intermediate_result("pending_refinement")
+        if pending_refinement:
+            refinement = pending_refinement
+            self.context.clear_intermediate_result("pending_refinement")
+        elif run.prefetched_refinement is not None:
+            refinement = run.prefetched_refinement
+        else:
+            refinement = self.refine(run.query, run.analysis, run.plan, run.previous_confidence)
+        run.prefetched_refinement = None
+        
+        refinement_needed = refinement.get("refinement_needed", False)
+        
+        # Force refinement when critique found issues (we came from CRITIQUE)
+        if run.critique_result and not run.critique_result.get("critique_passed", True):
+            if run.critique_refine_loop_count >= run.max_critique_refine_loops:
+                # Already looped too many times; proceed to summarize instead of going back to critique
+                logger.debug("   Max critique-refine loops (%s) reached, proceeding to summarize\n", run.max_critique_refine_loops)
+                revised = run.critique_result.get("revised_summary")
+                if revised:
+                    run.summary = revised
+                return self._handle_summarize
+            refinement_needed = True
+            refinement["reason"] = f"Critique found issues: {len(run.critique_result.get('hallucinations', []))} hallucinations, {len(run.critique_result.get('biases', []))} biases"
+            default_steps = [{"action": "search", "description": "Expand search to address critique issues", "tools": ["hybrid_search"]}]
+            refinement.setdefault("next_steps", default_steps)
+        
+        if refinement_needed:
+            self.iteration_count = iteration
+            logger.debug("   Refinement needed: %s", refinement.get('reason', ''))
+            
+            self._emit_progress('refining', {
+                'status': 'refining',
+                'iteration': iteration,
+                'reason': refinement.get('reason', ''),
+                'summary': f"Refinement iteration {iteration}: {refinement.get('reason', '')}"
+            })
+            
+            # Execute refinement steps
+            refinement_plan = {
+                "steps": refinement.get("next_steps", []),
+                "query_type": run.plan.get("query_type")
+            }
+            # Results are already unique, so only the new rows are checked against
+            # seen_ids and appended to the view (which serves the re-analysis)
+            new_results = []
+            for r in self.execute(refinement_plan, run.query):
+                post_id = r.get("id", id(r))
+                if post_id not in run.seen_ids:
+                    run.seen_ids.add(post_id)
+                    new_results.append(r)
+            self.results_view = self._results_view(run.results).extend(new_results, self.retriever.engagement_total)
+            run.results = self.results_view.posts
+            
+            if not new_results:
+                # Same result set: re-analysis would repeat the last LLM call for nothing
+                logger.debug("   Refinement produced no new data - keeping current analysis\n")
+                return run.critique_step
+            
+            # Re-analyze
+            run.set_analysis(self._analyze_memoized(run.query, run.results, run.plan))
+            new_confidence = run.confidence
+            
+            # Track confidence improvement
+            run.confidence_history.append(new_confidence)
+            if run.previous_confidence is not None:
+                improvement = new_confidence - run.previous_confidence
+                # Each further iteration has to earn more (see _min_refinement_gain)
+                if improvement < self._min_refinement_gain(iteration) and len(run.confidence_history) > 1:
+                    logger.warning("   ⚠️  Confidence stagnating (improvement: %.2f) - stopping refinement", improvement)
+                    run.previous_confidence = new_confidence
+                    return run.critique_step
+            
+            logger.debug("   Updated Confidence: %.2f", new_confidence)
+            if run.previous_confidence is not None:
+                logger.debug("   Improvement: %+.2f\n", improvement)
+            else:
+                logger.debug("")
+            
+            run.previous_confidence = new_confidence
+            run.critique_result = None  # Clear so we don't force refinement again
+            run.critique_refine_loop_count = 0  # Reset after successful refinement
+            # Loop back to validate (to ensure new results are still relevant)
+            return self._handle_validate_results
+        else:
+            logger.debug("   No refinement needed: %s\n", refinement.get('reason', ''))
+            # If we came from critique with issues, we'd have forced refinement above.
+            # Here we're on the normal path (REFINE → CRITIQUE).
+            return run.critique_step
+    
+    def _handle_critique(self, run: WorkflowRun) -> Optional[Callable]:
+        """CRITIQUE → SUMMARIZE, or REFINE when major issues were found"""
+        self.current_state = WorkflowState.CRITIQUE
+        # Only skip if BOTH high confidence AND good data quality
+        skip_critique = run.confidence > run.skip_critique_above and run.data_quality == "high"
+        
+        if skip_critique:
+            logger.info("🔬 [%s] Skipping critique (high confidence)\n", _STATE_LABELS[self.current_state])
+            run.critique_result = {
+                "critique_passed": True,
+                "hallucinations": [],
+                "biases": [],
+                "corrections": [],
+                "confidence_adjustment": 0.0,
+                "revised_summary": None
+            }
+            self._emit_progress('critiquing', {
+                'status': 'skipped',
+                'critique_passed': True,
+                'summary': 'Critique skipped for performance'
+            })
+            # Generate summary if not already done for this analysis
+            if not self._summary_current(run):
+                self._write_summary(run)
+        else:
+            # Generate summary first for critique (a draft from before a refinement that
+            # left the analysis unchanged is kept)
+            if not self._summary_current(run):
+                self._write_summary(run)
+            
+            critique_key = self._fingerprint(run.analysis, run.summary, len(run.results))
+            if run.critique_result is not None and critique_key == run.critiqued_key:
+                # Same analysis and summary as the last critique (refinement changed nothing)
+                logger.info("🔬 [%s] Reusing critique (analysis unchanged)", _STATE_LABELS[self.current_state])
+                self._emit_progress('critiquing', {
+                    'status': 'skipped',
+                    'short_circuit': 'analysis_unchanged',
+                    'summary': 'Critique reused (analysis unchanged)'
+                })
+            else:
+                logger.info("🔬 [%s] Critiquing analysis...", _STATE_LABELS[self.current_state])
+                self._emit_progress('critiquing', {'status': 'started', 'message': 'Reviewing for hallucinations and bias...'})
+                run.critique_result = self.critique(run.query, run.analysis, run.plan, run.results, run.summary)
+                run.critiqued_key = critique_key
+        critique_passed = run.critique_result.get("critique_passed", True)
+        
+        # Emit critique completion
+        critique_summary = f"Critique {'passed' if critique_passed else 'found issues'}"
+        if not critique_passed:
+            hallucinations = run.critique_result.get("hallucinations", [])
+            biases = run.critique_result.get("biases", [])
+            if hallucinations:
+                critique_summary += f" ({len(hallucinations)} hallucinations)"
+            if biases:
+                critique_summary += f" ({len(biases)} biases)"
+        
+        self._emit_progress('critiquing', {
+            'status': 'completed',
+            'critique_passed': critique_passed,
+            'hallucinations_count': len(run.critique_result.get("hallucinations", [])),
+            'biases_count': len(run.critique_result.get("biases", [])),
+            'summary': critique_summary
+        })
+        
+        if not critique_passed:
+            hallucinations = run.critique_result.get("hallucinations", [])
+            biases = run.critique_result.get("biases", [])
+            logger.warning("   ⚠️  Critique found issues:")
+            if hallucinations:
+                logger.debug("      Hallucinations: %s", len(hallucinations))
+            if biases:
+                logger.debug("      Biases: %s", len(biases))
+            
+            # If major issues, try to refine once more (cap loops to avoid CRITIQUE↔REFINE infinite loop)
+            if hallucinations and self.iteration_count < run.max_iterations and run.critique_refine_loop_count < run.max_critique_refine_loops:
+                run.critique_refine_loop_count += 1
+                logger.debug("   Attempting refinement to address issues (loop %s/%s)...\n", run.critique_refine_loop_count, run.max_critique_refine_loops)
+                return self._handle_refine
+            else:
+                # Use revised summary if provided
+                revised = run.critique_result.get("revised_summary")
+                if revised:
+                    run.summary = revised
+                logger.debug("   Proceeding with corrections applied\n")
+                return self._handle_summarize
+        else:
+            logger.debug("   ✅ Critique passed - no major issues found\n")
+            run.critique_refine_loop_count = 0  # Reset on pass
+            return self._handle_summarize
+    
+    def _skip_evaluate(self, run: WorkflowRun) -> Optional[Callable]:
+        """EVALUATE in fast mode: always skipped → REFINE"""
+        self.current_state = WorkflowState.EVALUATE
+        logger.info("🔎 [%s] Skipping evaluation (fast mode)\n", _STATE_LABELS[self.current_state])
+        run.evaluation = {"replan_needed": False, "reason": "Skipped for performance", "suggested_strategy": None}
+        self._emit_progress('evaluating', {
+            'status': 'skipped',
+            'replan_needed': False,
+            'reason': 'Fast mode',
+            'summary': 'Evaluation skipped for performance'
+        })
+        return self._handle_refine
+    
+    def _skip_critique(self, run: WorkflowRun) -> Optional[Callable]:
+        """CRITIQUE in fast mode: always skipped (the summary is written here) → SUMMARIZE"""
+        self.current_state = WorkflowState.CRITIQUE
+        logger.info("🔬 [%s] Skipping critique (fast mode)\n", _STATE_LABELS[self.current_state])
+        run.critique_result = {
+            "critique_passed": True,
+            "hallucinations": [],
+            "biases": [],
+            "corrections": [],
+            "confidence_adjustment": 0.0,
+            "revised_summary": None
+        }
+        self._emit_progress('critiquing', {
+            'status': 'skipped',
+            'critique_passed': True,
+            'hallucinations_count': 0,
+            'biases_count': 0,
+            'summary': 'Critique skipped for performance'
+        })
+        if not self._summary_current(run):
+            self._write_summary(run)
+        return self._handle_summarize
+    
+    def _handle_summarize(self, run: WorkflowRun) -> Optional[Callable]:
+        """SUMMARIZE → COMPLETE"""
+        self.current_state = WorkflowState.SUMMARIZE
+        if not self._summary_current(run):
+            logger.info("📝 [%s] Generating final summary...", _STATE_LABELS[self.current_state])
+            self._emit_progress('summarizing', {'status': 'started', 'message': 'Generating final summary...'})
+            self._write_summary(run)
+            logger.debug("   ✅ Summary complete\n")
+        
+        return None
+    
     def run_workflow(self, query: str, max_iterations: int = None, max_replans: int = 2, fast_mode: bool = None) -> Dict:
         """
         Main workflow orchestrator using state machine pattern
         
         State transitions:
         - PLAN → EXECUTE
-        - EXECUTE → VALIDATE_RESULTS (validate result quality)
+        - EXECUTE → VALIDATE_RESULTS (validate result quality), or ANALYZE for a simple plan
         - VALIDATE_RESULTS → ANALYZE (if validated) OR → REFINE/REPLAN (if low quality)
         - ANALYZE → EVALUATE (check if replan needed)
         - EVALUATE → PLAN (if replan needed) OR → REFINE
@@ -1070,6 +2076,9 @@ Create concise summary answering the query."""
         - CRITIQUE → SUMMARIZE (or back to REFINE if major issues)
         - SUMMARIZE → COMPLETE
         
+        In fast mode EVALUATE and CRITIQUE are bound to their skip-only handlers
+        (_skip_evaluate, _skip_critique) when the run starts.
+        
         Args:
             query: Research query
             max_iterations: Max refinement iterations
@@ -1082,420 +2091,69 @@ Create concise summary answering the query."""
         use_fast_mode = fast_mode if fast_mode is not None else config.ENABLE_FAST_MODE
         
         self.context.clear()
+        self._step_memo.clear()
+        self._analysis_signatures.clear()
         self.iteration_count = 0
         self.replan_count = 0
         self.current_state = WorkflowState.PLAN
         
-        # State variables
-        plan = None
-        results = []
-        analysis = None
-        summary = None
-        critique_result = None
-        critique_refine_loop_count = 0  # Prevent CRITIQUE → REFINE → CRITIQUE infinite loop
-        max_critique_refine_loops = 2
-        previous_confidence = None  # Track confidence for improvement detection
-        confidence_history = []  # Track confidence over iterations
-        
-        print(f"\n{'='*70}")
-        print(f"🚀 Starting Agentic Research Workflow (State Machine)")
-        print(f"{'='*70}")
-        print(f"Query: {query}\n")
-        
-        # State machine loop
-        while self.current_state != WorkflowState.COMPLETE:
-            
-            if self.current_state == WorkflowState.PLAN:
-                print(f"📋 [{self.current_state.value.upper()}] Planning...")
-                self._emit_progress('planning', {'status': 'started', 'message': 'Analyzing query and creating plan...'})
-                plan = self.plan(query)
-                
-                plan_summary = f"Created a {plan.get('expected_complexity', 'medium')} complexity plan for a {plan.get('query_type', 'unknown')} query. "
-                plan_summary += f"Identified {len(plan.get('steps', []))} execution steps."
-                
-                self._emit_progress('planning', {
-                    'status': 'completed',
-                    'query_type': plan.get('query_type', 'unknown'),
-                    'steps_count': len(plan.get('steps', [])),
-                    'complexity': plan.get('expected_complexity', 'unknown'),
-                    'summary': plan_summary
-                })
-                print(f"   Query Type: {plan.get('query_type', 'unknown')}")
-                print(f"   Steps Planned: {len(plan.get('steps', []))}\n")
-                
-                self.current_state = WorkflowState.EXECUTE
-            
-            elif self.current_state == WorkflowState.EXECUTE:
-                print(f"⚙️  [{self.current_state.value.upper()}] Executing retrieval...")
-                self._emit_progress('executing', {'status': 'started', 'message': 'Retrieving relevant data...'})
-                results = self.execute(plan, query)
-                
-                execute_summary = f"Retrieved {len(results)} relevant items from the dataset."
-                self._emit_progress('executing', {
-                    'status': 'completed', 
-                    'results_count': len(results),
-                    'summary': execute_summary
-                })
-                print(f"   Retrieved: {len(results)} items\n")
-                
-                self.current_state = WorkflowState.VALIDATE_RESULTS
-            
-            elif self.current_state == WorkflowState.VALIDATE_RESULTS:
-                print(f"✅ [{self.current_state.value.upper()}] Validating result quality...")
-                self._emit_progress('validating', {'status': 'started', 'message': 'Validating result relevance...'})
-                validation = self.validate_results(query, results, plan)
-                
-                action = validation.get("action", "proceed")
-                relevance_score = validation.get("relevance_score", 0.5)
-                validation_passed = validation.get("validation_passed", True)
-                
-                validation_summary = f"Validation {'passed' if validation_passed else 'failed'} (relevance: {relevance_score:.2f})"
-                self._emit_progress('validating', {
-                    'status': 'completed',
-                    'validation_passed': validation_passed,
-                    'relevance_score': relevance_score,
-                    'action': action,
-                    'summary': validation_summary
-                })
-                
-                if action == "replan" and self.replan_count < max_replans:
-                    # Only replan if relevance is very low (< 0.3)
-                    if relevance_score < 0.3:
-                        self.replan_count += 1
-                        print(f"   ⚠️  Very low relevance ({relevance_score:.2f}) - replanning needed")
-                        print(f"   Reason: {validation.get('recommendations', ['Low relevance'])}")
-                        results = []
-                        analysis = None
-                        previous_confidence = None
-                        confidence_history = []
-                        self.current_state = WorkflowState.PLAN
-                    else:
-                        # Relevance not low enough for replan - proceed to analyze
-                        print(f"   ✅ Results validated (relevance: {relevance_score:.2f}) - proceeding to analyze")
-                        self.current_state = WorkflowState.ANALYZE
-                elif action == "refine" and relevance_score < 0.4:
-                    # Only refine if explicitly requested AND relevance is low (but not terrible)
-                    print(f"   ⚠️  Low relevance ({relevance_score:.2f}) - triggering refinement")
-                    recommendations = validation.get("recommendations", ["Expand search"])
-                    # Create refinement plan from validation recommendations
-                    refinement = {
-                        "refinement_needed": True,
-                        "reason": f"Low result relevance ({relevance_score:.2f}): {', '.join(recommendations)}",
-                        "next_steps": [{"action": "search", "description": rec, "tools": ["hybrid_search"]} 
-                                      for rec in recommendations[:2]]  # Limit to 2 steps
-                    }
-                    # Store refinement for REFINE state
-                    self.context.store_intermediate_result("pending_refinement", refinement)
-                    self.current_state = WorkflowState.REFINE
-                else:
-                    # Default: proceed to analyze (even if relevance is moderate)
-                    print(f"   ✅ Results validated (relevance: {relevance_score:.2f})")
-                    self.current_state = WorkflowState.ANALYZE
-            
-            elif self.current_state == WorkflowState.ANALYZE:
-                print(f"🔍 [{self.current_state.value.upper()}] Analyzing results...")
-                self._emit_progress('analyzing', {'status': 'started', 'message': 'Analyzing retrieved data...'})
-                analysis = self.analyze(query, results, plan)
-                confidence = analysis.get("confidence", 0.5)
-                
-                # Track confidence history
-                confidence_history.append(confidence)
-                previous_confidence = confidence_history[-2] if len(confidence_history) > 1 else None
-                
-                analyze_summary = f"Analysis completed with {confidence:.0%} confidence."
-                self._emit_progress('analyzing', {
-                    'status': 'completed',
-                    'confidence': confidence,
-                    'main_themes': analysis.get('main_themes', [])[:3],
-                    'summary': analyze_summary
-                })
-                print(f"   Confidence: {confidence:.2f}")
-                if previous_confidence is not None:
-                    delta = confidence - previous_confidence
-                    print(f"   Confidence Change: {delta:+.2f} (from {previous_confidence:.2f})")
-                print(f"   Main Themes: {', '.join(analysis.get('main_themes', [])[:3])}\n")
-                
-                self.current_state = WorkflowState.EVALUATE
-            
-            elif self.current_state == WorkflowState.EVALUATE:
-                # Skip evaluate if fast mode OR (high confidence AND good data quality)
-                confidence = analysis.get("confidence", 0.5) if analysis else 0.5
-                data_quality = analysis.get("data_quality", "medium") if analysis else "medium"
-                
-                # Only skip if BOTH high confidence AND good data quality
-                skip_evaluate = (
-                    use_fast_mode or 
-                    (config.SKIP_EVALUATE_IF_HIGH_CONFIDENCE and confidence > 0.85 and data_quality == "high")
-                )
-                
-                if skip_evaluate:
-                    print(f"🔎 [{self.current_state.value.upper()}] Skipping evaluation (fast mode or high confidence)\n")
-                    evaluation = {"replan_needed": False, "reason": "Skipped for performance", "suggested_strategy": None}
-                    self._emit_progress('evaluating', {
-                        'status': 'skipped',
-                        'reason': 'High confidence or fast mode',
-                        'summary': 'Evaluation skipped for performance'
-                    })
-                else:
-                    print(f"🔎 [{self.current_state.value.upper()}] Evaluating strategy...")
-                    self._emit_progress('evaluating', {'status': 'started', 'message': 'Evaluating if replan needed...'})
-                    evaluation = self.evaluate_for_replan(query, analysis, plan, results)
-                
-                replan_needed = evaluation.get("replan_needed", False)
-                
-                # Emit evaluation completion
-                eval_summary = "Strategy evaluation completed"
-                if replan_needed:
-                    eval_summary += f" - Replan needed: {evaluation.get('reason', '')}"
-                else:
-                    eval_summary += " - Strategy is sound"
-                
-                self._emit_progress('evaluating', {
-                    'status': 'completed',
-                    'replan_needed': replan_needed,
-                    'reason': evaluation.get('reason', ''),
-                    'summary': eval_summary
-                })
-                
-                if replan_needed and self.replan_count < max_replans:
-                    self.replan_count += 1
-                    print(f"   ⚠️  Replan needed: {evaluation.get('reason', '')}")
-                    print(f"   Suggested strategy: {evaluation.get('suggested_strategy', 'N/A')}")
-                    print(f"   Replanning (attempt {self.replan_count}/{max_replans})...\n")
-                    self._emit_progress('replanning', {
-                        'status': 'replanning',
-                        'reason': evaluation.get('reason', ''),
-                        'attempt': self.replan_count,
-                        'summary': f"Replanning due to: {evaluation.get('reason', '')}"
-                    })
-                    # Reset results/analysis for new plan
-                    results = []
-                    analysis = None
-                    self.current_state = WorkflowState.PLAN
-                else:
-                    if replan_needed:
-                        print(f"   Max replans reached ({max_replans}), proceeding with current plan\n")
-                    else:
-                        print(f"   Strategy is sound, proceeding to refinement\n")
-                    self.current_state = WorkflowState.REFINE
-            
-            elif self.current_state == WorkflowState.REFINE:
-                iteration = self.iteration_count + 1
-                if iteration > max_iterations:
-                    print(f"   Max refinement iterations reached ({max_iterations}), proceeding to critique\n")
-                    self.current_state = WorkflowState.CRITIQUE
-                    continue
-                
-                print(f"🔄 [{self.current_state.value.upper()}] Refinement Check (Iteration {iteration})...")
-                self._emit_progress('refining', {
-                    'status': 'checking',
-                    'iteration': iteration,
-                    'message': f'Checking if refinement needed (iteration {iteration})...'
-                })
-                
-                # Check if there's a pending refinement from VALIDATE_RESULTS
-                pending_refinement = self.context.get_intermediate_result("pending_refinement")
-                if pending_refinement:
-                    refinement = pending_refinement
-                    self.context.clear_intermediate_result("pending_refinement")
-                else:
-                    refinement = self.refine(query, analysis, plan, previous_confidence)
-                
-                refinement_needed = refinement.get("refinement_needed", False)
-                
-                # Force refinement when critique found issues (we came from CRITIQUE)
-                if critique_result and not critique_result.get("critique_passed", True):
-                    if critique_refine_loop_count >= max_critique_refine_loops:
-                        # Already looped too many times; proceed to summarize instead of going back to critique
-                        print(f"   Max critique-refine loops ({max_critique_refine_loops}) reached, proceeding to summarize\n")
-                        revised = critique_result.get("revised_summary")
-                        if revised:
-                            summary = revised
-                        self.current_state = WorkflowState.SUMMARIZE
-                        continue
-                    refinement_needed = True
-                    refinement["reason"] = f"Critique found issues: {len(critique_result.get('hallucinations', []))} hallucinations, {len(critique_result.get('biases', []))} biases"
-                    default_steps = [{"action": "search", "description": "Expand search to address critique issues", "tools": ["hybrid_search"]}]
-                    refinement.setdefault("next_steps", default_steps)
-                
-                if refinement_needed:
-                    self.iteration_count = iteration
-                    print(f"   Refinement needed: {refinement.get('reason', '')}")
-                    
-                    self._emit_progress('refining', {
-                        'status': 'refining',
-                        'iteration': iteration,
-                        'reason': refinement.get('reason', ''),
-                        'summary': f"Refinement iteration {iteration}: {refinement.get('reason', '')}"
-                    })
-                    
-                    # Execute refinement steps
-                    refinement_plan = {
-                        "steps": refinement.get("next_steps", []),
-                        "query_type": plan.get("query_type")
-                    }
-                    additional_results = self.execute(refinement_plan, query)
-                    results.extend(additional_results)
-                    
-                    # Deduplicate
-                    seen_ids = set()
-                    deduped = []
-                    for r in results:
-                        if r["id"] not in seen_ids:
-                            seen_ids.add(r["id"])
-                            deduped.append(r)
-                    results = deduped
-                    
-                    # Re-analyze
-                    analysis = self.analyze(query, results, plan)
-                    new_confidence = analysis.get("confidence", 0.5)
-                    
-                    # Track confidence improvement
-                    confidence_history.append(new_confidence)
-                    if previous_confidence is not None:
-                        improvement = new_confidence - previous_confidence
-                        if improvement < 0.05 and len(confidence_history) > 1:
-                            print(f"   ⚠️  Confidence stagnating (improvement: {improvement:.2f}) - stopping refinement")
-                            self.current_state = WorkflowState.CRITIQUE
-                            previous_confidence = new_confidence
-                            continue
-                    
-                    print(f"   Updated Confidence: {new_confidence:.2f}")
-                    if previous_confidence is not None:
-                        print(f"   Improvement: {improvement:+.2f}\n")
-                    else:
-                        print()
-                    
-                    previous_confidence = new_confidence
-                    critique_result = None  # Clear so we don't force refinement again
-                    critique_refine_loop_count = 0  # Reset after successful refinement
-                    # Loop back to validate (to ensure new results are still relevant)
-                    self.current_state = WorkflowState.VALIDATE_RESULTS
-                else:
-                    print(f"   No refinement needed: {refinement.get('reason', '')}\n")
-                    # If we came from critique with issues, we'd have forced refinement above.
-                    # Here we're on the normal path (REFINE → CRITIQUE).
-                    self.current_state = WorkflowState.CRITIQUE
-            
-            elif self.current_state == WorkflowState.CRITIQUE:
-                # Skip critique if fast mode OR (high confidence AND good data quality)
-                confidence = analysis.get("confidence", 0.5) if analysis else 0.5
-                data_quality = analysis.get("data_quality", "medium") if analysis else "medium"
-                
-                # Only skip if BOTH high confidence AND good data quality
-                skip_critique = (
-                    use_fast_mode or 
-                    (config.SKIP_CRITIQUE_IF_HIGH_CONFIDENCE and confidence > 0.85 and data_quality == "high")
-                )
-                
-                if skip_critique:
-                    print(f"🔬 [{self.current_state.value.upper()}] Skipping critique (fast mode or high confidence)\n")
-                    critique_result = {
-                        "critique_passed": True,
-                        "hallucinations": [],
-                        "biases": [],
-                        "corrections": [],
-                        "confidence_adjustment": 0.0,
-                        "revised_summary": None
-                    }
-                    self._emit_progress('critiquing', {
-                        'status': 'skipped',
-                        'critique_passed': True,
-                        'summary': 'Critique skipped for performance'
-                    })
-                    # Generate summary if not already done
-                    if summary is None:
-                        summary = self.summarize(query, analysis, plan)
-                else:
-                    print(f"🔬 [{self.current_state.value.upper()}] Critiquing analysis...")
-                    self._emit_progress('critiquing', {'status': 'started', 'message': 'Reviewing for hallucinations and bias...'})
-                    
-                    # Generate summary first for critique
-                    if summary is None:
-                        summary = self.summarize(query, analysis, plan)
-                    
-                    critique_result = self.critique(query, analysis, plan, results, summary)
-                critique_passed = critique_result.get("critique_passed", True)
-                
-                # Emit critique completion
-                critique_summary = f"Critique {'passed' if critique_passed else 'found issues'}"
-                if not critique_passed:
-                    hallucinations = critique_result.get("hallucinations", [])
-                    biases = critique_result.get("biases", [])
-                    if hallucinations:
-                        critique_summary += f" ({len(hallucinations)} hallucinations)"
-                    if biases:
-                        critique_summary += f" ({len(biases)} biases)"
-                
-                self._emit_progress('critiquing', {
-                    'status': 'completed',
-                    'critique_passed': critique_passed,
-                    'hallucinations_count': len(critique_result.get("hallucinations", [])),
-                    'biases_count': len(critique_result.get("biases", [])),
-                    'summary': critique_summary
-                })
-                
-                if not critique_passed:
-                    hallucinations = critique_result.get("hallucinations", [])
-                    biases = critique_result.get("biases", [])
-                    print(f"   ⚠️  Critique found issues:")
-                    if hallucinations:
-                        print(f"      Hallucinations: {len(hallucinations)}")
-                    if biases:
-                        print(f"      Biases: {len(biases)}")
-                    
-                    # If major issues, try to refine once more (cap loops to avoid CRITIQUE↔REFINE infinite loop)
-                    if hallucinations and self.iteration_count < max_iterations and critique_refine_loop_count < max_critique_refine_loops:
-                        critique_refine_loop_count += 1
-                        print(f"   Attempting refinement to address issues (loop {critique_refine_loop_count}/{max_critique_refine_loops})...\n")
-                        self.current_state = WorkflowState.REFINE
-                    else:
-                        # Use revised summary if provided
-                        revised = critique_result.get("revised_summary")
-                        if revised:
-                            summary = revised
-                        print(f"   Proceeding with corrections applied\n")
-                        self.current_state = WorkflowState.SUMMARIZE
-                else:
-                    print(f"   ✅ Critique passed - no major issues found\n")
-                    critique_refine_loop_count = 0  # Reset on pass
-                    self.current_state = WorkflowState.SUMMARIZE
-            
-            elif self.current_state == WorkflowState.SUMMARIZE:
-                if summary is None:
-                    print(f"📝 [{self.current_state.value.upper()}] Generating final summary...")
-                    self._emit_progress('summarizing', {'status': 'started', 'message': 'Generating final summary...'})
-                    summary = self.summarize(query, analysis, plan)
-                    print("   ✅ Summary complete\n")
-                
-                self.current_state = WorkflowState.COMPLETE
-        
-        # Compile final results
-        total_tokens = sum(step.tokens_used or 0 for step in self.context.execution_steps)
-        confidence = analysis.get("confidence", 0.5) if analysis else 0.0
+        never = float("inf")
+        run = WorkflowRun(
+            query=query,
+            max_iterations=max_iterations,
+            max_replans=max_replans,
+            evaluate_step=self._skip_evaluate if use_fast_mode else self._handle_evaluate,
+            critique_step=self._skip_critique if use_fast_mode else self._handle_critique,
+            skip_evaluate_above=config.HIGH_CONFIDENCE_THRESHOLD if config.SKIP_EVALUATE_IF_HIGH_CONFIDENCE else never,
+            skip_critique_above=config.HIGH_CONFIDENCE_THRESHOLD if config.SKIP_CRITIQUE_IF_HIGH_CONFIDENCE else never,
+            speculate_summary=use_fast_mode and config.SPECULATIVE_SUMMARY,
+            speculate_analysis=config.SPECULATIVE_ANALYSIS,
+            skip_simple_validation=config.SKIP_VALIDATE_FOR_SIMPLE_PLANS
+        )
         
+        logger.info("\n" + _RULE)
+        logger.info("🚀 Starting Agentic Research Workflow (State Machine)")
+        logger.info(_RULE)
+        logger.info("Query: %s\n", query)
+        
+        # State machine loop: each handler runs its state and returns the next state's
+        # handler (None when complete); progress held for coalescing is flushed at every transition
+        self._coalesce_progress = True
+        try:
+            handler = self._handle_plan
+            while handler is not None:
+                handler = handler(run)
+                self._flush_progress()
+            self.current_state = WorkflowState.COMPLETE
+        finally:
+            self._flush_progress()
+            self._coalesce_progress = False
+            # Speculative calls the run never consumed: drop any still queued
+            for speculative in (run.speculative_summary, run.speculative_analysis):
+                if speculative is not None:
+                    speculative[1].cancel()
+        
+        # Compile final results (a new dict per run: callers keep earlier results)
+        total_tokens = self.context.total_tokens_used  # running sum kept by add_step
+        confidence = run.confidence if run.analysis else 0.0
+        steps_count = len(self.context.execution_steps)
+        
+        finished_ns = time.time_ns()
         result = {
-            "query": query,
-            "plan": plan,
-            "results_count": len(results),
-            "analysis": analysis,
+            "query": run.query,
+            "plan": run.plan,
+            "results_count": len(run.results),
+            "analysis": run.analysis,
             "refinement_iterations": self.iteration_count,
             "replan_count": self.replan_count,
-            "critique": critique_result,
-            "final_summary": summary,
-            "execution_steps": len(self.context.execution_steps),
+            "critique": run.critique_result,
+            "final_summary": run.summary,
+            "execution_steps": steps_count,
             "total_tokens_used": total_tokens,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.fromtimestamp(finished_ns / 1e9, tz=timezone.utc).isoformat(),
+            "timestamp_ns": finished_ns  # same instant as an integer, like ExecutionStep.timestamp_ns
         }
         
-        print(f"{'='*70}")
-        print("✅ Workflow Complete!")
-        print(f"{'='*70}")
-        print(f"Total Steps: {len(self.context.execution_steps)}")
-        print(f"Refinement Iterations: {self.iteration_count}")
-        print(f"Replan Cycles: {self.replan_count}")
-        print(f"Total Tokens Used: {total_tokens}")
-        print(f"Final Confidence: {confidence:.2f}")
-        print(f"{'='*70}\n")
-        
-        return result
+        logger.info(_WORKFLOW_FOOTER, steps_count, self.iteration_count, self.replan_count, total_tokens, confidence)
+        
+        return result
\ No newline at end of file
@@ -2,6 +2,7 @@
 Configuration for Grok Agentic Research Framework
 """
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -42,16 +43,35 @@ MAX_CONTEXT_TOKENS = 8000  # Context window limit
 TEMPERATURE = 0.7  # Default temperature for creativity
 MAX_TOKENS_RESPONSE = 1500  # Max tokens per response (reduced from 2000 for faster responses)
 MAX_TOKENS_SUMMARY = 1200  # Max tokens for summary (shorter summaries = faster)
+SUMMARY_STREAM_CHARS = 200  # Streamed summary text is sent to progress listeners in batches of this many chars
+EMIT_COALESCE_MS = 50  # Streamed deltas emitted within this window go to progress listeners as one event
+TOOL_CALLING_MAX_MESSAGES = 8  # Tool-calling conversation length above which older turns are folded into a note
+TOOL_CALLING_HISTORY_TURNS = 3  # Latest tool-calling turns kept verbatim when the conversation is folded
 
 # Performance Optimization Flags
-SKIP_EVALUATE_IF_HIGH_CONFIDENCE = True  # Skip evaluate step if confidence > 0.85
-SKIP_CRITIQUE_IF_HIGH_CONFIDENCE = True  # Skip critique if confidence > 0.85 and no obvious issues
+REFINEMENT_MIN_GAIN = 0.05  # Confidence gain the first refinement must deliver to continue; doubles each further iteration
+HIGH_CONFIDENCE_THRESHOLD = 0.85  # Analysis confidence above which refinement (and, with the flags below, evaluate/critique) is skipped
+SKIP_EVALUATE_IF_HIGH_CONFIDENCE = True  # Skip evaluate step if confidence > HIGH_CONFIDENCE_THRESHOLD and data quality is high
+SKIP_CRITIQUE_IF_HIGH_CONFIDENCE = True  # Skip critique if confidence > HIGH_CONFIDENCE_THRESHOLD and data quality is high
+SKIP_VALIDATE_FOR_SIMPLE_PLANS = True  # Go from retrieval straight to analysis when the plan is simple (see _is_simple_plan)
+SIMPLE_PLAN_MIN_RESULTS = 5  # ...and its first retrieval found at least this many results
 ENABLE_FAST_MODE = True  # Fast mode: skip evaluate and critique entirely (enabled for speed)
+SPECULATIVE_SUMMARY = True  # Fast mode: start the summary right after analysis, overlapping the refinement check
+SPECULATIVE_ANALYSIS = True  # Send the analysis call alongside result validation (discarded if validation rejects the results)
+
+# LLM Response Cache (see llm_cache.py)
+ENABLE_LLM_CACHE = True  # Reuse responses for repeated plan/validate/analyze/refine/evaluate/critique/summarize calls
+LLM_CACHE_TTL = 3600  # Seconds a cached response stays valid
+LLM_CACHE_MAX_ENTRIES = 256  # Per step type; least recently used evicted first
+LLM_CACHE_SIMILARITY = 0.92  # Cosine similarity needed for a semantic (near-duplicate prompt) hit
+# Steps whose prompt is essentially the query; data-heavy prompts (analyze, critique, ...) only get exact hits
+LLM_CACHE_SEMANTIC_STEPS = ("plan",)
+LLM_CACHE_DB = os.getenv("LLM_CACHE_DB")  # SQLite file that keeps cached responses across restarts; unset = memory only
 
 # Data Configuration
 MOCK_DATA_SIZE = 100  # Number of mock posts to generate
 # Data file path relative to project root
-DATA_FILE = "data/mock_x_data.json"
+DATA_FILE = "data/mock_x_data.jsonl"  # One post per line (see data_store.py)
 
 # Retrieval Configuration
 SEMANTIC_SEARCH_TOP_K = 8  # Top K results for semantic search (reduced from 10)
@@ -63,5 +83,22 @@ ANALYZE_TEXT_LENGTH = 150  # Max text length per item in analyze (reduced from 2
 CRITIQUE_SAMPLE_SIZE = 4  # Number of items to show in critique (reduced from 5)
 
 # Logging
-LOG_LEVEL = "INFO"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")  # DEBUG adds per-state details to the workflow log
 LOG_FILE = "logs/agent_execution.log"
+
+
+@dataclass(frozen=True)
+class _Cfg:
+    """Immutable snapshot of the settings read on hot paths (taken once at import)"""
+    GROK_API_KEY: str
+    GROK_BASE_URL: str
+    MAX_TOKENS_RESPONSE: int
+    TEMPERATURE: float
+
+
+CFG = _Cfg(
+    GROK_API_KEY=GROK_API_KEY,
+    GROK_BASE_URL=GROK_BASE_URL,
+    MAX_TOKENS_RESPONSE=MAX_TOKENS_RESPONSE,
+    TEMPERATURE=TEMPERATURE,
+)
@@ -2,26 +2,53 @@
 Context Manager for Agentic Workflow
 Tracks conversation history, execution steps, and manages context limits
 """
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import datetime, timezone
+from typing import Callable, List, Dict, Optional, Union
 from dataclasses import dataclass, asdict
 import json
 import config
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionStep:
     """Represents a single step in the agent workflow"""
     step_name: str
     step_type: str  # "plan", "execute", "analyze", "refine", "summarize"
     input_data: Dict
     output_data: Dict
-    reasoning: str
-    timestamp: str
+    _reasoning: Union[str, Callable[[], str]]  # text, or a function rendering it on first read
+    timestamp_ns: int  # time.time_ns(); formatted to ISO only when serialized
     model_used: str
     tokens_used: Optional[int] = None
     
+    @property
+    def reasoning(self) -> str:
+        """Rationale or raw LLM output for the step (a deferred one is rendered once, then kept)"""
+        if callable(self._reasoning):
+            self._reasoning = self._reasoning()
+        return self._reasoning
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 (UTC) form of timestamp_ns"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+    
     def to_dict(self):
-        return asdict(self)
+        reasoning = self.reasoning
+        data = asdict(self)
+        del data["_reasoning"]
+        data["reasoning"] = reasoning
+        data["timestamp"] = self.timestamp
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ExecutionStep":
+        """Rebuild a step from to_dict() output (older exports only carry the ISO timestamp)"""
+        data = dict(data)
+        timestamp = data.pop("timestamp", None)
+        data["_reasoning"] = data.pop("reasoning", "")
+        if "timestamp_ns" not in data:
+            data["timestamp_ns"] = int(datetime.fromisoformat(timestamp).timestamp() * 1e9) if timestamp else 0
+        return cls(**data)
 
 class ContextManager:
     """Manages context and execution history for the agent"""
@@ -37,7 +64,7 @@ class ContextManager:
         self.execution_steps: List[ExecutionStep] = []
         self.conversation_history: List[Dict] = []
         self.intermediate_results: Dict = {}
-        self.total_tokens_used = 0
+        self.total_tokens_used = 0  # running sum of step tokens, updated by add_step
     
     def add_step(self, step: ExecutionStep):
         """Add an execution step to history"""
@@ -162,7 +189,7 @@ class ContextManager:
             data = json.load(f)
         
         self.execution_steps = [
-            ExecutionStep(**step) for step in data.get("execution_steps", [])
+            ExecutionStep.from_dict(step) for step in data.get("execution_steps", [])
         ]
         self.conversation_history = data.get("conversation_history", [])
         self.intermediate_results = data.get("intermediate_results", {})
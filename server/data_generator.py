@@ -2,11 +2,98 @@
 Mock X (Twitter) Data Generator
 Creates realistic simulated social media posts for testing the agentic workflow
 """
-import json
-import random
+import itertools
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from typing import List, Dict
-from pathlib import Path
+import numpy as np
+from data_store import write_posts
+
+@dataclass
+class PostArrays:
+    """
+    Columnar (structure-of-arrays) batch of standalone posts.
+
+    Each field is a length-n array, so filters and aggregates run on whole
+    columns (e.g. posts[followers > 10000]); to_records() produces the
+    post dicts used by the JSON data file.
+    """
+    ids: np.ndarray
+    texts: np.ndarray
+    usernames: np.ndarray
+    display_names: np.ndarray
+    verified: np.ndarray
+    followers: np.ndarray
+    author_types: np.ndarray
+    celebrity_names: np.ndarray  # object: the notable name for celebrity authors, None otherwise
+    created_at: np.ndarray
+    likes: np.ndarray
+    retweets: np.ndarray
+    replies: np.ndarray
+    bookmarks: np.ndarray
+    sentiments: np.ndarray
+    categories: np.ndarray
+    topics: np.ndarray
+    languages: np.ndarray
+    has_media: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def concat(cls, chunks: List["PostArrays"]) -> "PostArrays":
+        """Join batches column-wise, in order"""
+        return cls(**{
+            f.name: np.concatenate([getattr(chunk, f.name) for chunk in chunks])
+            for f in fields(cls)
+        })
+
+    def to_records(self) -> List[Dict]:
+        """Export as a list of post dicts (the data file format)"""
+        cols = zip(
+            self.ids.tolist(), self.texts.tolist(), self.usernames.tolist(), self.display_names.tolist(),
+            self.verified.tolist(), self.followers.tolist(), self.author_types.tolist(),
+            self.celebrity_names.tolist(), self.created_at.tolist(),
+            self.likes.tolist(), self.retweets.tolist(), self.replies.tolist(), self.bookmarks.tolist(),
+            self.sentiments.tolist(), self.categories.tolist(), self.topics.tolist(), self.languages.tolist(),
+            self.has_media.tolist(),
+        )
+        return [
+            {
+                "id": post_id,
+                "text": text,
+                "author": {
+                    "username": username,
+                    "display_name": display_name,
+                    "verified": verified,
+                    "followers": followers,
+                    "author_type": author_type,
+                    # same tag _generate_author adds for celebrity accounts
+                    **({"celebrity_name": celebrity_name} if celebrity_name else {}),
+                },
+                "created_at": created_at,
+                "engagement": {
+                    "likes": likes,
+                    "retweets": retweets,
+                    "replies": replies,
+                    "bookmarks": bookmarks
+                },
+                "sentiment": sentiment,
+                "category": category,
+                "topics": topics,
+                "language": language,
+                "has_media": has_media,
+                "is_reply": False,
+                "reply_to": None
+            }
+            for (post_id, text, username, display_name, verified, followers, author_type, celebrity_name, created_at,
+                 likes, retweets, replies, bookmarks, sentiment, category, topics, language, has_media) in cols
+        ]
+
 
 class MockXDataGenerator:
     """Generate high-quality mock X/Twitter posts across multiple domains"""
@@ -67,6 +154,11 @@ class MockXDataGenerator:
         "interesting", "worth considering", "food for thought", "curious",
         "not sure", "need to research", "fascinating", "intriguing"
     ]
+    PHRASES_BY_SENTIMENT = {
+        "positive": POSITIVE_PHRASES,
+        "negative": NEGATIVE_PHRASES,
+        "neutral": NEUTRAL_PHRASES,
+    }
     
     # Category-specific phrases
     CATEGORY_PHRASES = {
@@ -102,6 +194,63 @@ class MockXDataGenerator:
         },
     }
     
+    # Content templates: (format string, use generic phrase pool, {extra} options).
+    # {phrase} comes from CATEGORY_PHRASES unless use_generic is set.
+    BASE_TEMPLATES = (
+        ("Thoughts on {topic}: {phrase}", False, None),
+        ("{topic} is {phrase}", True, None),
+        ("Anyone else {extra} about {topic}?", False, ("excited", "concerned", "curious")),
+        ("Hot take: {topic} — {phrase}", False, None),
+    )
+    NAME_TEMPLATES = (
+        ("{name}'s take on {topic} is {phrase}", False, None),
+        ("That {name} moment — {phrase}", False, None),
+        ("Nobody does it like {name}. {phrase}", False, None),
+        ("{name} and {topic}: {phrase}", False, None),
+    )
+    CATEGORY_TEMPLATES = {
+        "tech": (
+            ("Just read a {phrase} paper on {topic}", True, None),
+            ("Deep dive into {topic}: {extra} findings", False, ("promising", "concerning", "interesting")),
+        ),
+        "sports": (
+            ("That {topic} game was {phrase}", False, None),
+            ("MVP-level {topic} discourse today. {phrase}", False, None),
+            ("Nothing like {topic} season. {phrase}", False, None),
+        ),
+        "politics": (
+            ("The {topic} conversation is {extra}. {phrase}", False, ("heating up", "missing nuance", "important")),
+            ("Important thread on {topic}. {phrase}", False, None),
+            ("Everyone talking about {topic} but nobody saying {phrase}", False, None),
+        ),
+        "fashion": (
+            ("This {topic} moment is {phrase}", False, None),
+            ("{topic} never misses. {phrase}", False, None),
+            ("Street style x {topic}: {phrase}", False, None),
+        ),
+        "art": (
+            ("Saw a {topic} show recently. {phrase}", False, None),
+            ("This {topic} piece is {phrase}", False, None),
+            ("{topic} take: {phrase}", False, None),
+        ),
+        "entertainment": (
+            ("That {topic} drop was {phrase}", False, None),
+            ("Nobody's talking about {topic} enough. {phrase}", False, None),
+            ("{topic} — {phrase}", False, None),
+        ),
+    }
+    CATEGORY_NAME_TEMPLATES = {
+        "tech": (("{name} on {topic}: {phrase}", False, None),),
+        "sports": (
+            ("{name} in that {topic} game was {phrase}", False, None),
+            ("{name} legacy game. {phrase}", False, None),
+        ),
+        "politics": (("{name} on {topic}: {phrase}", False, None),),
+        "fashion": (("{name} x {topic} — {phrase}", False, None),),
+        "art": (("{name} and {topic}: {phrase}", False, None),),
+        "entertainment": (("{name} on {topic} — {phrase}", False, None),),
+    }
+    
     HASHTAGS_BY_CATEGORY = {
         "tech": ["#Tech", "#AI", "#BuildInPublic", "#Innovation"],
         "sports": ["#Sports", "#SZN", "#Ball", "#RespectTheGame"],
@@ -193,112 +342,99 @@ class MockXDataGenerator:
         "regular_user": {"verified": False, "followers_range": (10, 1000)},
         "celebrity": {"verified": True, "followers_range": (500000, 50000000)},
     }
+
+    # Engagement scale per author type (regular_user = 1x baseline)
+    ENGAGEMENT_MULTIPLIERS = {
+        "celebrity": 50,
+        "influencer": 10,
+        "researcher": 5,
+        "journalist": 3,
+        "developer": 2,
+        "regular_user": 1,
+    }
+
+    SENTIMENTS = ("positive", "negative", "neutral")
+    PARALLEL_MIN_POSTS = 200_000  # Batches at least this large are sharded across processes
+    FOREIGN_LANGUAGE_CODES = ("es", "fr", "pt", "de", "ja")
     
     def __init__(self, seed: int = 42):
         """Initialize generator with seed for reproducibility"""
-        random.seed(seed)
+        # Local PCG64 stream (no global random state); jumpable for per-worker streams
+        self.rng = np.random.default_rng(seed)
         self.posts = []
+        self._template_pools = {}
+        self._hashtag_suffixes = {}
+        self._now = datetime.now()  # Reference time for relative timestamps
+        self._id_iter = itertools.count()  # Post ID counter (restarted per dataset)
     
-    def _templates_for_category(self, category: str, topic: str, sentiment: str, name: str = None) -> list:
-        """Category-specific content templates. Optional name for mention-based tweets."""
-        pos = self.CATEGORY_PHRASES[category]["positive"]
-        neg = self.CATEGORY_PHRASES[category]["negative"]
-        neu = self.CATEGORY_PHRASES[category]["neutral"]
-        pick = lambda s: random.choice(pos if s == "positive" else neg if s == "negative" else neu)
-        generic_pos = self.POSITIVE_PHRASES
-        generic_neg = self.NEGATIVE_PHRASES
-        generic_neu = self.NEUTRAL_PHRASES
-        gpick = lambda s: random.choice(generic_pos if s == "positive" else generic_neg if s == "negative" else generic_neu)
-
-        base = [
-            f"Thoughts on {topic}: {pick(sentiment)}",
-            f"{topic} is {gpick(sentiment)}",
-            f"Anyone else {random.choice(['excited', 'concerned', 'curious'])} about {topic}?",
-            f"Hot take: {topic} — {pick(sentiment)}",
-        ]
-        if name:
-            base += [
-                f"{name}'s take on {topic} is {pick(sentiment)}",
-                f"That {name} moment — {pick(sentiment)}",
-                f"Nobody does it like {name}. {pick(sentiment)}",
-                f"{name} and {topic}: {pick(sentiment)}",
-            ]
-        if category == "tech":
-            base += [
-                f"Just read a {gpick(sentiment)} paper on {topic}",
-                f"Deep dive into {topic}: {random.choice(['promising', 'concerning', 'interesting'])} findings",
-            ]
-            if name:
-                base += [f"{name} on {topic}: {pick(sentiment)}"]
-        elif category == "sports":
-            base += [
-                f"That {topic} game was {pick(sentiment)}",
-                f"MVP-level {topic} discourse today. {pick(sentiment)}",
-                f"Nothing like {topic} season. {pick(sentiment)}",
-            ]
-            if name:
-                base += [
-                    f"{name} in that {topic} game was {pick(sentiment)}",
-                    f"{name} legacy game. {pick(sentiment)}",
-                ]
-        elif category == "politics":
-            base += [
-                f"The {topic} conversation is {random.choice(['heating up', 'missing nuance', 'important'])}. {pick(sentiment)}",
-                f"Important thread on {topic}. {pick(sentiment)}",
-                f"Everyone talking about {topic} but nobody saying {pick(sentiment)}",
-            ]
-            if name:
-                base += [f"{name} on {topic}: {pick(sentiment)}"]
-        elif category == "fashion":
-            base += [
-                f"This {topic} moment is {pick(sentiment)}",
-                f"{topic} never misses. {pick(sentiment)}",
-                f"Street style x {topic}: {pick(sentiment)}",
-            ]
-            if name:
-                base += [f"{name} x {topic} — {pick(sentiment)}"]
-        elif category == "art":
-            base += [
-                f"Saw a {topic} show recently. {pick(sentiment)}",
-                f"This {topic} piece is {pick(sentiment)}",
-                f"{topic} take: {pick(sentiment)}",
-            ]
-            if name:
-                base += [f"{name} and {topic}: {pick(sentiment)}"]
-        elif category == "entertainment":
-            base += [
-                f"That {topic} drop was {pick(sentiment)}",
-                f"Nobody's talking about {topic} enough. {pick(sentiment)}",
-                f"{topic} — {pick(sentiment)}",
-            ]
-            if name:
-                base += [f"{name} on {topic} — {pick(sentiment)}"]
-        return base
+    def spawn_rng(self, worker_id: int) -> np.random.Generator:
+        """Independent generator for a worker: this stream jumped ahead worker_id times"""
+        return np.random.Generator(self.rng.bit_generator.jumped(worker_id))
+
+    def _choice(self, seq):
+        """Uniform pick from a sequence"""
+        return seq[int(self.rng.integers(0, len(seq)))]
+
+    def _randint(self, a: int, b: int) -> int:
+        """Uniform integer in [a, b] (inclusive, like random.randint)"""
+        return int(self.rng.integers(a, b + 1))
+
+    def _sample(self, seq, k: int) -> list:
+        """k distinct items from a sequence (like random.sample)"""
+        return [seq[i] for i in self.rng.choice(len(seq), size=k, replace=False).tolist()]
+
+    def _template_pool(self, category: str, with_name: bool) -> tuple:
+        """Templates available for a category, with or without a name mention (built once per key)"""
+        key = (category, with_name)
+        pool = self._template_pools.get(key)
+        if pool is None:
+            pool = self.BASE_TEMPLATES
+            if with_name:
+                pool += self.NAME_TEMPLATES
+            pool += self.CATEGORY_TEMPLATES.get(category, ())
+            if with_name:
+                pool += self.CATEGORY_NAME_TEMPLATES.get(category, ())
+            self._template_pools[key] = pool
+        return pool
+
+    def _hashtag_suffix(self, category: str) -> str:
+        """One or two distinct category hashtags as a ready-made " #A #B" suffix"""
+        suffixes = self._hashtag_suffixes.get(category)
+        if suffixes is None:
+            # All 1-tag and ordered 2-tag suffixes, interned once per category
+            tags = self.HASHTAGS_BY_CATEGORY.get(category, self.HASHTAGS_BY_CATEGORY["tech"])
+            singles = tuple(sys.intern(f" {a}") for a in tags)
+            pairs = tuple(sys.intern(f" {a} {b}") for a in tags for b in tags if a != b)
+            suffixes = self._hashtag_suffixes[category] = (singles, pairs)
+        return self._choice(suffixes[self._randint(1, 2) - 1])
 
     def _generate_foreign_content(self, topic: str, sentiment: str, category: str, name: str, lang: str) -> str:
         """Generate post content in a foreign language. Name required."""
         data = self.FOREIGN_LANGUAGES[lang]
-        phrases = data["positive"] if sentiment == "positive" else data["negative"] if sentiment == "negative" else data["neutral"]
-        phrase = random.choice(phrases)
+        phrase = self._choice(data[sentiment])
         templates = data["templates"]
-        t = random.choice(templates)
+        t = self._choice(templates)
         content = t.format(name=name, topic=topic, phrase=phrase)
-        if random.random() > 0.6:
-            tags = self.HASHTAGS_BY_CATEGORY.get(category, self.HASHTAGS_BY_CATEGORY["tech"])
-            content += " " + " ".join(random.sample(tags, random.randint(1, 2)))
+        if self.rng.random() > 0.6:
+            content += self._hashtag_suffix(category)
         return content
 
     def _generate_post_content(self, topic: str, sentiment: str, category: str, name: str = None, lang: str = "en") -> str:
         """Generate realistic post content. Optional name mention, optional foreign language."""
         if lang != "en":
-            use_name = name or random.choice(self.NOTABLE_NAMES.get(category, self.NOTABLE_NAMES["tech"]))
+            use_name = name or self._choice(self.NOTABLE_NAMES.get(category, self.NOTABLE_NAMES["tech"]))
             content = self._generate_foreign_content(topic, sentiment, category, use_name, lang)
         else:
-            templates = self._templates_for_category(category, topic, sentiment, name=name)
-            content = random.choice(templates)
-            if random.random() > 0.65:
-                tags = self.HASHTAGS_BY_CATEGORY.get(category, self.HASHTAGS_BY_CATEGORY["tech"])
-                content += " " + " ".join(random.sample(tags, random.randint(1, 2)))
+            template, use_generic, extras = self._choice(self._template_pool(category, bool(name)))
+            pool = self.PHRASES_BY_SENTIMENT[sentiment] if use_generic else self.CATEGORY_PHRASES[category][sentiment]
+            content = template.format(
+                topic=topic,
+                name=name,
+                phrase=self._choice(pool),
+                extra=self._choice(extras) if extras else "",
+            )
+            if self.rng.random() > 0.65:
+                content += self._hashtag_suffix(category)
         return content
     
     def _generate_author(self, category: str = None, celebrity_name: str = None) -> Dict:
@@ -307,77 +443,71 @@ class MockXDataGenerator:
             author_config = self.AUTHOR_TYPES["celebrity"]
             handle = celebrity_name.lower().replace(" ", "")[:15]
             return {
-                "username": f"{handle}_{random.randint(1, 99)}",
+                "username": f"{handle}_{self._randint(1, 99)}",
                 "display_name": celebrity_name,
                 "verified": author_config["verified"],
-                "followers": random.randint(*author_config["followers_range"]),
+                "followers": self._randint(*author_config["followers_range"]),
                 "author_type": "celebrity",
+                "celebrity_name": celebrity_name,  # exact tag, so lookups need no display_name scan
             }
         types = [t for t in self.AUTHOR_TYPES.keys() if t != "celebrity"]
-        author_type = random.choice(types)
+        author_type = self._choice(types)
         author_config = self.AUTHOR_TYPES[author_type]
         return {
-            "username": f"{author_type}_{random.randint(1, 1000)}",
-            "display_name": f"{author_type.title()} {random.randint(1, 100)}",
+            "username": f"{author_type}_{self._randint(1, 1000)}",
+            "display_name": f"{author_type.title()} {self._randint(1, 100)}",
             "verified": author_config["verified"],
-            "followers": random.randint(*author_config["followers_range"]),
+            "followers": self._randint(*author_config["followers_range"]),
             "author_type": author_type,
         }
     
     def _generate_engagement(self, author_type: str) -> Dict:
         """Generate realistic engagement metrics"""
-        base_multiplier = {
-            "celebrity": 50,
-            "influencer": 10,
-            "researcher": 5,
-            "journalist": 3,
-            "developer": 2,
-            "regular_user": 1,
-        }.get(author_type, 1)
+        base_multiplier = self.ENGAGEMENT_MULTIPLIERS.get(author_type, 1)
         
         return {
-            "likes": random.randint(0, 10000 * base_multiplier),
-            "retweets": random.randint(0, 5000 * base_multiplier),
-            "replies": random.randint(0, 500 * base_multiplier),
-            "bookmarks": random.randint(0, 200 * base_multiplier)
+            "likes": self._randint(0, 10000 * base_multiplier),
+            "retweets": self._randint(0, 5000 * base_multiplier),
+            "replies": self._randint(0, 500 * base_multiplier),
+            "bookmarks": self._randint(0, 200 * base_multiplier)
         }
     
     def _pick_category_and_topic(self) -> tuple:
         """Pick category then topic from that category. Returns (category, topic)."""
-        category = random.choice(list(self.TOPICS_BY_CATEGORY.keys()))
-        topic = random.choice(self.TOPICS_BY_CATEGORY[category])
+        category = self._choice(list(self.TOPICS_BY_CATEGORY.keys()))
+        topic = self._choice(self.TOPICS_BY_CATEGORY[category])
         return category, topic
 
-    def generate_post(self, post_id: int, fixed_category: str = None, fixed_topic: str = None) -> Dict:
-        """Generate a single mock post. Optional fixed_category/fixed_topic for threads."""
+    def generate_post(self, post_id: int, fixed_category: str = None, fixed_topic: str = None, reply_to: str = None) -> Dict:
+        """Generate a single mock post. Optional fixed_category/fixed_topic and reply_to for threads."""
         if fixed_category and fixed_topic:
             category, topic = fixed_category, fixed_topic
             topics_list = [topic]
         else:
             category, topic = self._pick_category_and_topic()
             pool = [t for t in self.TOPICS_BY_CATEGORY[category] if t != topic]
-            n_extra = random.randint(0, min(2, len(pool)))
-            extra = random.sample(pool, n_extra) if n_extra else []
+            n_extra = self._randint(0, min(2, len(pool)))
+            extra = self._sample(pool, n_extra) if n_extra else []
             topics_list = [topic] + extra
 
-        sentiment = random.choice(["positive", "negative", "neutral"])
+        sentiment = self._choice(["positive", "negative", "neutral"])
 
         # Language: mostly English, ~18% foreign (es, fr, pt, de, ja)
-        lang = "en" if random.random() < 0.82 else random.choice(["es", "fr", "pt", "de", "ja"])
-        use_name = (random.random() < 0.35) or (lang != "en")
+        lang = "en" if self.rng.random() < 0.82 else self._choice(["es", "fr", "pt", "de", "ja"])
+        use_name = (self.rng.random() < 0.35) or (lang != "en")
         name = None
         celebrity_name = None
         if use_name:
-            name = random.choice(self.NOTABLE_NAMES.get(category, self.NOTABLE_NAMES["tech"]))
-            if random.random() < 0.12:
+            name = self._choice(self.NOTABLE_NAMES.get(category, self.NOTABLE_NAMES["tech"]))
+            if self.rng.random() < 0.12:
                 celebrity_name = name
 
         author = self._generate_author(category=None, celebrity_name=celebrity_name)
         engagement = self._generate_engagement(author["author_type"])
 
-        days_ago = random.randint(0, 30)
-        hours_ago = random.randint(0, 23)
-        timestamp = datetime.now() - timedelta(days=days_ago, hours=hours_ago)
+        days_ago = self._randint(0, 30)
+        hours_ago = self._randint(0, 23)
+        timestamp = self._now - timedelta(days=days_ago, hours=hours_ago)
 
         text = self._generate_post_content(topic, sentiment, category, name=name if use_name else None, lang=lang)
 
@@ -391,58 +521,204 @@ class MockXDataGenerator:
             "category": category,
             "topics": topics_list,
             "language": lang,
-            "has_media": random.random() > 0.7,
-            "is_reply": False,
-            "reply_to": None
+            "has_media": self.rng.random() > 0.7,
+            "is_reply": reply_to is not None,
+            "reply_to": reply_to
         }
 
         return post
-    
-    def generate_thread(self, thread_id: int, num_posts: int = 3) -> List[Dict]:
-        """Generate a threaded conversation with consistent category/topic"""
-        category, topic = self._pick_category_and_topic()
-        posts = []
 
-        original_post = self.generate_post(thread_id * 1000, fixed_category=category, fixed_topic=topic)
-        original_post["is_reply"] = False
-        posts.append(original_post)
+    def generate_dataset_vectorized(self, n: int, start_id: int = 0) -> List[Dict]:
+        """Generate n standalone posts using batched NumPy sampling (as post dicts)"""
+        if n >= self.PARALLEL_MIN_POSTS:
+            return self.generate_post_arrays_parallel(n, start_id=start_id).to_records()
+        return self.generate_post_arrays(n, start_id).to_records()
 
-        for i in range(num_posts - 1):
-            reply = self.generate_post(thread_id * 1000 + i + 1, fixed_category=category, fixed_topic=topic)
-            reply["is_reply"] = True
-            reply["reply_to"] = original_post["id"]
-            posts.append(reply)
+    def generate_post_arrays_parallel(self, n: int, nproc: int = None, start_id: int = 0) -> "PostArrays":
+        """
+        Generate n standalone posts as columnar arrays, sharded across processes.
+
+        Worker i draws from this generator's stream jumped ahead i + 1 times, so
+        shards never overlap and the result is reproducible for a given seed and nproc.
+        """
+        nproc = max(1, min(nproc or os.cpu_count() or 1, n))
+        bounds = np.linspace(0, n, nproc + 1).astype(int).tolist()
+        jobs = [
+            (self.spawn_rng(i + 1), bounds[i + 1] - bounds[i], start_id + bounds[i], self._now)
+            for i in range(nproc)
+        ]
+        with multiprocessing.Pool(nproc) as pool:
+            chunks = pool.starmap(_gen_chunk, jobs)
+        return PostArrays.concat(chunks)
+
+    def generate_post_arrays(self, n: int, start_id: int = 0) -> "PostArrays":
+        """
+        Generate n standalone posts as columnar arrays.
+
+        Every structured field (category, topic, sentiment, language, author,
+        engagement, timestamp, media flag) is drawn as a length-n array up front;
+        only topic lists, names and text rendering run per post.
+        """
+        rng = self.rng
+        categories = list(self.TOPICS_BY_CATEGORY.keys())
+        author_types = list(self.AUTHOR_TYPES.keys())
+        celebrity_idx = author_types.index("celebrity")
+        regular_types = [i for i, t in enumerate(author_types) if t != "celebrity"]
+
+        # Category, then topic within category (scale a uniform draw by category size)
+        cat_idx = rng.integers(0, len(categories), size=n)
+        topic_counts = np.array([len(self.TOPICS_BY_CATEGORY[c]) for c in categories])
+        topic_idx = (rng.random(n) * topic_counts[cat_idx]).astype(np.int64)
+        n_extra = rng.integers(0, 3, size=n)
+        sentiment_idx = rng.integers(0, len(self.SENTIMENTS), size=n)
+
+        # Language: mostly English, ~18% foreign
+        is_foreign = rng.random(n) >= 0.82
+        lang_idx = rng.integers(0, len(self.FOREIGN_LANGUAGE_CODES), size=n)
+        use_name = (rng.random(n) < 0.35) | is_foreign
+        name_counts = np.array([len(self.NOTABLE_NAMES[c]) for c in categories])
+        name_idx = (rng.random(n) * name_counts[cat_idx]).astype(np.int64)
+        is_celebrity = use_name & (rng.random(n) < 0.12)
+
+        # Authors: celebrity posts pin the type, everyone else draws a regular type
+        type_idx = np.where(
+            is_celebrity,
+            celebrity_idx,
+            np.array(regular_types)[rng.integers(0, len(regular_types), size=n)],
+        )
+        follower_lo = np.array([self.AUTHOR_TYPES[t]["followers_range"][0] for t in author_types])
+        follower_hi = np.array([self.AUTHOR_TYPES[t]["followers_range"][1] for t in author_types])
+        followers = rng.integers(follower_lo[type_idx], follower_hi[type_idx] + 1)
+        username_num = rng.integers(1, np.where(is_celebrity, 100, 1001))
+        display_num = rng.integers(1, 101, size=n)
+
+        # Engagement scales with author type via broadcasting
+        multiplier = np.array([self.ENGAGEMENT_MULTIPLIERS.get(t, 1) for t in author_types])[type_idx]
+        likes = rng.integers(0, 10000 * multiplier + 1)
+        retweets = rng.integers(0, 5000 * multiplier + 1)
+        replies = rng.integers(0, 500 * multiplier + 1)
+        bookmarks = rng.integers(0, 200 * multiplier + 1)
+
+        # Timestamps: up to 30 days and 23 hours back from the generator's "now"
+        hours_back = rng.integers(0, 31, size=n) * 24 + rng.integers(0, 24, size=n)
+        now = np.datetime64(self._now, "us")
+        created_at = np.datetime_as_string(now - hours_back.astype("timedelta64[h]"), unit="us")
+        has_media = rng.random(n) > 0.7
+
+        # Columns that are plain lookups by index
+        author_type_arr = np.array(author_types)[type_idx]
+        verified = np.array([self.AUTHOR_TYPES[t]["verified"] for t in author_types])[type_idx]
+        languages = np.where(is_foreign, np.array(self.FOREIGN_LANGUAGE_CODES)[lang_idx], "en")
+        sentiments = np.array(self.SENTIMENTS)[sentiment_idx]
+        category_arr = np.array(categories)[cat_idx]
+        ids = np.char.add("post_", np.arange(start_id, start_id + n).astype(str))
+
+        # Per-post columns: topics, names and rendered text
+        topics = np.empty(n, dtype=object)
+        texts = np.empty(n, dtype=object)
+        usernames = np.empty(n, dtype=object)
+        display_names = np.empty(n, dtype=object)
+        celebrity_names = np.full(n, None, dtype=object)
+        cat_l, topic_l, extra_l = cat_idx.tolist(), topic_idx.tolist(), n_extra.tolist()
+        sent_l, lang_l = sentiments.tolist(), languages.tolist()
+        use_name_l, name_l, celeb_l = use_name.tolist(), name_idx.tolist(), is_celebrity.tolist()
+        type_l, user_l, display_l = author_type_arr.tolist(), username_num.tolist(), display_num.tolist()
+        for i in range(n):
+            category = categories[cat_l[i]]
+            cat_topics = self.TOPICS_BY_CATEGORY[category]
+            topic = cat_topics[topic_l[i]]
+            pool = [t for t in cat_topics if t != topic]
+            topics[i] = [topic] + [pool[j] for j in rng.permutation(len(pool))[:extra_l[i]]]
+            name = self.NOTABLE_NAMES[category][name_l[i]] if use_name_l[i] else None
+            if celeb_l[i]:
+                usernames[i] = f"{name.lower().replace(' ', '')[:15]}_{user_l[i]}"
+                display_names[i] = name
+                celebrity_names[i] = name
+            else:
+                usernames[i] = f"{type_l[i]}_{user_l[i]}"
+                display_names[i] = f"{type_l[i].title()} {display_l[i]}"
+            texts[i] = self._generate_post_content(topic, sent_l[i], category, name=name, lang=lang_l[i])
+
+        return PostArrays(
+            ids=ids,
+            texts=texts,
+            usernames=usernames,
+            display_names=display_names,
+            verified=verified,
+            followers=followers,
+            author_types=author_type_arr,
+            celebrity_names=celebrity_names,
+            created_at=created_at,
+            likes=likes,
+            retweets=retweets,
+            replies=replies,
+            bookmarks=bookmarks,
+            sentiments=sentiments,
+            categories=category_arr,
+            topics=topics,
+            languages=languages,
+            has_media=has_media,
+        )
+
+    def generate_thread(self, num_posts: int = 3, category: str = None, topic: str = None) -> List[Dict]:
+        """Generate a threaded conversation with consistent category/topic (picked here unless given)"""
+        if not (category and topic):
+            category, topic = self._pick_category_and_topic()
+
+        original_post = self.generate_post(next(self._id_iter), fixed_category=category, fixed_topic=topic)
+        posts = [original_post]
+        for _ in range(num_posts - 1):
+            posts.append(self.generate_post(
+                next(self._id_iter), fixed_category=category, fixed_topic=topic, reply_to=original_post["id"]
+            ))
 
         return posts
     
     def generate_dataset(self, num_posts: int = 100, include_threads: bool = True) -> List[Dict]:
         """Generate full dataset"""
-        posts = []
-        
-        # Generate individual posts
-        for i in range(num_posts):
-            posts.append(self.generate_post(i))
-        
-        # Add some threaded conversations
-        if include_threads:
-            num_threads = num_posts // 10
-            for thread_id in range(num_threads):
-                thread_posts = self.generate_thread(thread_id, random.randint(2, 5))
-                posts.extend(thread_posts)
+        self._now = datetime.now()
+        # Single ID counter for standalone and thread posts, so IDs never collide
+        self._id_iter = itertools.count(num_posts)
+
+        # Thread categories, topics and sizes are drawn in bulk so the total is known up front
+        num_threads = num_posts // 10 if include_threads else 0
+        categories = list(self.TOPICS_BY_CATEGORY.keys())
+        thread_cats = self.rng.integers(0, len(categories), size=num_threads).tolist()
+        topic_draws = self.rng.random(num_threads).tolist()
+        thread_sizes = self.rng.integers(2, 6, size=num_threads).tolist()
+
+        posts = [None] * (num_posts + sum(thread_sizes))
+        # Individual posts (batched sampling) take IDs 0..num_posts-1
+        posts[:num_posts] = self.generate_dataset_vectorized(num_posts)
+
+        # Threaded conversations fill the remaining slots
+        slot = num_posts
+        for thread_id in range(num_threads):
+            category = categories[thread_cats[thread_id]]
+            cat_topics = self.TOPICS_BY_CATEGORY[category]
+            topic = cat_topics[int(topic_draws[thread_id] * len(cat_topics))]
+            thread_posts = self.generate_thread(thread_sizes[thread_id], category=category, topic=topic)
+            posts[slot:slot + len(thread_posts)] = thread_posts
+            slot += len(thread_posts)
         
         self.posts = posts
         return posts
     
-    def save_to_file(self, filepath: str = "data/mock_x_data.json"):
-        """Save generated dataset to file"""
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.posts, f, indent=2, ensure_ascii=False, default=str)
+    def save_to_file(self, filepath: str = "data/mock_x_data.jsonl"):
+        """Save generated dataset to file (.jsonl paths are written one post per line)"""
+        write_posts(filepath, self.posts)
         
         print(f"✅ Generated {len(self.posts)} posts and saved to {filepath}")
         return filepath
 
+def _gen_chunk(rng: np.random.Generator, n: int, start_id: int, now: datetime) -> PostArrays:
+    """Worker entry point for generate_post_arrays_parallel (top-level so it pickles)"""
+    generator = MockXDataGenerator()
+    generator.rng = rng
+    generator._now = now
+    return generator.generate_post_arrays(n, start_id)
+
+
 def main():
     """Generate mock dataset"""
     generator = MockXDataGenerator(seed=42)
@@ -454,23 +730,15 @@ def main():
     print(f"Total posts: {len(posts)}")
     print(f"Verified authors: {sum(1 for p in posts if p['author']['verified'])}")
     print(f"Sentiment distribution:")
-    sentiments = {}
-    for post in posts:
-        sentiments[post['sentiment']] = sentiments.get(post['sentiment'], 0) + 1
+    sentiments = Counter(post['sentiment'] for post in posts)
     for sent, count in sorted(sentiments.items()):
         print(f"  {sent}: {count}")
     print("Category distribution:")
-    categories = {}
-    for post in posts:
-        c = post.get("category", "?")
-        categories[c] = categories.get(c, 0) + 1
+    categories = Counter(post.get("category", "?") for post in posts)
     for cat, count in sorted(categories.items()):
         print(f"  {cat}: {count}")
     print("Language distribution:")
-    langs = {}
-    for post in posts:
-        L = post.get("language", "en")
-        langs[L] = langs.get(L, 0) + 1
+    langs = Counter(post.get("language", "en") for post in posts)
     for lang, count in sorted(langs.items()):
         print(f"  {lang}: {count}")
 
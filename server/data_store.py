@@ -0,0 +1,166 @@
+"""
+Post Data Store
+Reads and writes the mock post dataset (NDJSON, one post per line; legacy .json arrays still load)
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+import os
+import orjson
+
+IO_BUFFER_SIZE = 64 * 1024  # 64KB buffers: far fewer read/write syscalls than the 8KB default
+
+PathLike = Union[str, Path]
+
+
+@dataclass(slots=True)
+class Post:
+    """
+    One post record, in data file field order
+
+    Slotted, so it carries no per-instance __dict__; orjson serializes it
+    directly, and it loads back as a plain dict like every other post.
+    """
+    id: str
+    text: str
+    author: Dict
+    created_at: str
+    engagement: Dict
+    sentiment: str
+    category: str
+    topics: List[str] = field(default_factory=list)
+    language: str = "en"
+    has_media: bool = False
+    is_reply: bool = False
+    reply_to: Optional[str] = None
+
+
+def is_jsonl(path: PathLike) -> bool:
+    """True if the path uses the line-delimited format"""
+    return Path(path).suffix in (".jsonl", ".ndjson")
+
+
+def iter_posts(path: PathLike) -> Iterator[Dict]:
+    """
+    Stream posts from a data file
+
+    Args:
+        path: .jsonl file (parsed line by line) or legacy .json array (parsed whole)
+
+    Yields:
+        Post dictionaries in file order
+    """
+    with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        if not is_jsonl(path):
+            yield from orjson.loads(f.read())
+            return
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def load_posts(path: PathLike) -> List[Dict]:
+    """Load every post from a data file into a list"""
+    return list(iter_posts(path))
+
+
+def count_posts(path: PathLike) -> int:
+    """Number of posts in a data file (for .jsonl, counts lines without parsing them)"""
+    if not Path(path).exists():
+        return 0
+    if not is_jsonl(path):
+        return len(load_posts(path))
+    with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        return sum(1 for line in f if line.strip())
+
+
+def meta_path(path: PathLike) -> Path:
+    """Sidecar file holding the post count, e.g. data/mock_x_data.meta.json"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.meta.json")
+
+
+def read_count(path: PathLike) -> int:
+    """
+    Number of posts in a data file, read from its sidecar when possible
+
+    The sidecar also records the data file size, so a file edited by other
+    means is detected and recounted instead of trusting a stale count.
+
+    Args:
+        path: Data file path
+
+    Returns:
+        Post count (0 if the data file does not exist)
+    """
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+    try:
+        meta = orjson.loads(meta_path(path).read_bytes())
+        if meta["bytes"] == size:
+            return int(meta["count"])
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        pass
+    count = count_posts(path)
+    _write_meta(path, count)
+    return count
+
+
+def _write_meta(path: PathLike, count: int):
+    """Record the post count and data file size in the sidecar"""
+    meta = {"count": count, "bytes": os.stat(path).st_size}
+    with _atomic_writer(meta_path(path)) as f:
+        f.write(orjson.dumps(meta))
+
+
+@contextmanager
+def _atomic_writer(path: PathLike) -> Iterator[BinaryIO]:
+    """
+    Open a buffered temp file next to `path` and rename it over `path` on success
+
+    os.replace is atomic on POSIX (and replaces on Windows), so readers see either
+    the old file or the complete new one, never a partial write.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_posts(path: PathLike, posts: List[Union[Dict, Post]]):
+    """Write posts to a data file, atomically replacing its contents"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with _atomic_writer(path) as f:
+        if is_jsonl(path):
+            for post in posts:
+                f.write(orjson.dumps(post, default=str) + b"\n")
+        else:
+            f.write(orjson.dumps(posts, option=orjson.OPT_INDENT_2, default=str))
+    _write_meta(path, len(posts))
+
+
+def append_posts(path: PathLike, posts: List[Union[Dict, Post]]) -> int:
+    """
+    Append posts to a .jsonl data file without rewriting existing lines
+
+    Returns:
+        Total post count after the append (also written to the sidecar)
+    """
+    if not is_jsonl(path):
+        raise ValueError(f"Appending requires a .jsonl data file, got {path}")
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    count = read_count(path)
+    with open(path, 'ab', buffering=IO_BUFFER_SIZE) as f:
+        for post in posts:
+            f.write(orjson.dumps(post, default=str) + b"\n")
+    count += len(posts)
+    _write_meta(path, count)
+    return count
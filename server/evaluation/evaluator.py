@@ -16,6 +16,7 @@ server_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(server_dir))
 
 from agent import AgenticResearchAgent
+from data_store import load_posts
 from services.agent_service import AgentService
 from evaluation.metrics import MetricsCalculator
 import config
@@ -216,8 +217,7 @@ class BatchEvaluator:
                 data_path = Path(data_file)
                 
                 if data_path.exists():
-                    with open(data_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = load_posts(data_path)
                 else:
                     # Generate data if needed (shouldn't happen in parallel mode)
                     from data_generator import MockXDataGenerator
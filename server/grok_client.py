@@ -4,31 +4,95 @@ Handles all interactions with Grok API
 """
 import os
 import json
-from typing import Dict, Optional, List
-from openai import OpenAI
-import config
+import functools
+import re
+from types import MappingProxyType
+from typing import Callable, Dict, Optional, List, Mapping, TYPE_CHECKING
+from config import CFG
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Shared, read-only response_format for JSON mode; pass this instead of a fresh dict
+JSON_RESPONSE = MappingProxyType({"type": "json_object"})
+
+# Error-message hints: one case-insensitive regex, dispatched on the named group.
+# Anchored lookaheads keep the original priority (auth, then rate limit, then model)
+# regardless of where each keyword appears in the message.
+_ERR_RE = re.compile(
+    r"(?=[\s\S]*?(?:api_key|authentication))(?P<auth>)"
+    r"|(?=[\s\S]*?rate limit)(?P<rate>)"
+    r"|(?=[\s\S]*?model)(?P<model>)",
+    re.IGNORECASE,
+)
+_ERR_TIPS = {
+    "auth": "Check your GROK_API_KEY in .env file",
+    "rate": "You've hit rate limits. Wait a moment and try again.",
+    "model": "Check if model '{model}' is available in your API plan",
+}
 
 class GrokClient:
-    """Client for interacting with Grok API"""
+    """
+    Client for interacting with Grok API
+    
+    Prefer GrokClient.get_instance() over the constructor so every caller
+    shares one client (and its HTTP connection pool) per key/endpoint.
+    """
+    
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def get_instance(cls, api_key: Optional[str] = None, base_url: Optional[str] = None) -> "GrokClient":
+        """
+        Get the shared client for (api_key, base_url), creating it on first use
+        
+        Args:
+            api_key: Grok API key (if None, uses config)
+            base_url: API endpoint (if None, uses config)
+        """
+        return cls(api_key, base_url)
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
         """
         Initialize Grok client
         
         Args:
             api_key: Grok API key (if None, uses config)
+            base_url: API endpoint (if None, uses config)
         """
-        self.api_key = api_key or config.GROK_API_KEY
+        self.api_key = api_key or CFG.GROK_API_KEY
         
         if not self.api_key:
             raise ValueError("GROK_API_KEY not found. Set it in .env file or pass as argument.")
         
+        # Imported here so modules that never build a client skip loading the SDK
+        import httpx
+        from openai import OpenAI as _OpenAI
+        
         # Initialize OpenAI-compatible client for xAI
         # Note: xAI uses OpenAI-compatible API
-        self.client = OpenAI(
+        # One keepalive pool per client so concurrent calls reuse connections. With the
+        # optional h2 package (httpx[http2]) those calls also multiplex over one HTTP/2
+        # connection instead of each holding its own; without it, stay on HTTP/1.1
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        self.http_client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
+        self.client: "OpenAI" = _OpenAI(
             api_key=self.api_key,
-            base_url=config.GROK_BASE_URL
+            base_url=base_url or CFG.GROK_BASE_URL,
+            http_client=self.http_client
         )
+        
+        # Bind call defaults once instead of going through config per request
+        self._default_max_tokens = CFG.MAX_TOKENS_RESPONSE
+        self._default_temp = CFG.TEMPERATURE
+        self._base_params = {"max_tokens": self._default_max_tokens, "temperature": self._default_temp}
+        self._encoding = None  # tiktoken encoding, loaded on first accurate_tokens call
     
     def call(
         self,
@@ -37,9 +101,11 @@ class GrokClient:
         system_prompt: Optional[str] = None,
         max_tokens: int = None,
         temperature: float = None,
-        response_format: Optional[Dict] = None,
+        response_format: Optional[Mapping] = None,
         tools: Optional[List[Dict]] = None,
-        tool_choice: Optional[str] = None
+        tool_choice: Optional[str] = None,
+        accurate_tokens: bool = False,
+        on_delta: Optional[Callable[[str], None]] = None
     ) -> Dict:
         """
         Call Grok API
@@ -50,31 +116,39 @@ class GrokClient:
             system_prompt: Optional system prompt
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature
-            response_format: Optional response format (e.g., {"type": "json_object"})
+            response_format: Optional response format (e.g., JSON_RESPONSE for {"type": "json_object"})
             tools: Optional list of tool definitions for function calling
             tool_choice: Optional tool choice ("auto", "none", or {"type": "function", "function": {"name": "tool_name"}})
+            accurate_tokens: Count input tokens with tiktoken instead of the chars/4 estimate
+            on_delta: Optional callback; streams the response and is called with each text
+                      chunk as it arrives (ignored for tool calls). The return value is unchanged.
             
         Returns:
-            Dictionary with "content", "tokens_used", "model", "tool_calls" (if any)
+            Dictionary with "content", "tokens_used", "model", "tool_calls" (if any), and
+            "is_json" (content was requested as a JSON object)
         """
-        # Prepare messages
-        api_messages = []
-        
+        # Prepare messages (tracking input size for the token estimate)
         if system_prompt:
-            api_messages.append({"role": "system", "content": system_prompt})
-        
-        api_messages.extend(messages)
+            api_messages = [{"role": "system", "content": system_prompt}, *messages]
+            total_input_chars = len(system_prompt)
+        else:
+            api_messages = list(messages)
+            total_input_chars = 0
+        for msg in messages:
+            total_input_chars += len(msg.get("content") or "")
         
-        # Prepare parameters
-        params = {
-            "model": model,
-            "messages": api_messages,
-            "max_tokens": max_tokens or config.MAX_TOKENS_RESPONSE,
-            "temperature": temperature or config.TEMPERATURE
-        }
+        # Prepare parameters from the prebuilt defaults
+        params = self._base_params.copy()
+        params["model"] = model
+        params["messages"] = api_messages
+        if max_tokens:
+            params["max_tokens"] = max_tokens
+        if temperature:
+            params["temperature"] = temperature
         
         if response_format:
-            params["response_format"] = response_format
+            # Copy to a plain dict only at the SDK boundary
+            params["response_format"] = dict(response_format)
         
         if tools:
             params["tools"] = tools
@@ -84,14 +158,26 @@ class GrokClient:
                 params["tool_choice"] = "auto"
         
         try:
-            response = self.client.chat.completions.create(**params)
-            
-            message = response.choices[0].message
-            content = message.content or ""
+            tool_calls = None
+            if on_delta is not None and not tools:
+                # Streamed: hand each chunk to the caller, then assemble the full text
+                parts = []
+                for chunk in self.client.chat.completions.create(**params, stream=True):
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        on_delta(delta)
+                content = "".join(parts)
+                message = None
+            else:
+                response = self.client.chat.completions.create(**params)
+                message = response.choices[0].message
+                content = message.content or ""
             
             # Parse tool calls if present
-            tool_calls = None
-            if hasattr(message, 'tool_calls') and message.tool_calls:
+            if message is not None and getattr(message, 'tool_calls', None):
                 tool_calls = []
                 for tc in message.tool_calls:
                     tool_calls.append({
@@ -103,8 +189,12 @@ class GrokClient:
                         }
                     })
             
-            # Estimate tokens (rough approximation)
-            input_tokens = sum(len(msg.get("content", "")) // 4 for msg in api_messages)
+            # Estimate tokens (rough approximation unless precise counts requested)
+            encoding = self._get_encoding() if accurate_tokens else None
+            if encoding is not None:
+                input_tokens = sum(len(encoding.encode(msg.get("content") or "")) for msg in api_messages)
+            else:
+                input_tokens = total_input_chars >> 2
             output_tokens = len(content) // 4
             
             result = {
@@ -113,7 +203,8 @@ class GrokClient:
                 "output_tokens": output_tokens,
                 "total_tokens": input_tokens + output_tokens,
                 "model": model,
-                "success": True
+                "success": True,
+                "is_json": bool(response_format) and response_format.get("type") == "json_object"
             }
             
             if tool_calls:
@@ -124,13 +215,10 @@ class GrokClient:
             error_msg = str(e)
             print(f"❌ Grok API Error: {error_msg}")
             
-            # Provide helpful error messages
-            if "api_key" in error_msg.lower() or "authentication" in error_msg.lower():
-                error_msg += "\n💡 Tip: Check your GROK_API_KEY in .env file"
-            elif "rate limit" in error_msg.lower():
-                error_msg += "\n💡 Tip: You've hit rate limits. Wait a moment and try again."
-            elif "model" in error_msg.lower():
-                error_msg += f"\n💡 Tip: Check if model '{model}' is available in your API plan"
+            # Provide helpful error messages (first matching hint wins, as before)
+            match = _ERR_RE.match(error_msg)
+            if match:
+                error_msg += "\n💡 Tip: " + _ERR_TIPS[match.lastgroup].format(model=model)
             
             return {
                 "content": f"[Error: {error_msg}]",
@@ -142,8 +230,37 @@ class GrokClient:
                 "error": error_msg
             }
     
-    def parse_json_response(self, content: str) -> Dict:
-        """Parse JSON from response, handling markdown code blocks"""
+    def _get_encoding(self):
+        """Lazily load the tiktoken encoding; None if tiktoken is unavailable"""
+        if self._encoding is None:
+            try:
+                import tiktoken
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                print(f"⚠️  tiktoken unavailable ({e}), using approximate token counts")
+                self._encoding = False
+        return self._encoding or None
+    
+    def parse_json_response(self, content: str, is_json: bool = False) -> Dict:
+        """
+        Parse JSON from response, handling markdown code blocks
+        
+        Args:
+            content: Response text
+            is_json: Content came from a response_format=json_object call (see the
+                     "is_json" flag on call() results), so it is parsed directly
+        """
+        if not content:
+            return {"raw_response": content}
+        
+        # Fast path: JSON-mode output or a bare JSON object; anything malformed
+        # still falls through to the recovery steps below
+        if is_json or (content[0] == "{" and content[-1] == "}"):
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                pass
+        
         # Remove markdown code blocks if present
         if "```json" in content:
             content = content.split("```json")[1].split("```")[0].strip()
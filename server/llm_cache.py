@@ -0,0 +1,254 @@
+"""
+LLM Response Cache
+Two-tier cache in front of GrokClient.call: exact (SHA-256 of the request) and
+semantic (cosine similarity of prompt embeddings), kept per step type, optionally
+persisted to SQLite so entries survive restarts
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+import numpy as np
+
+
+class SemanticLLMCache:
+    """
+    Cache of successful LLM responses, namespaced by step type (plan, analyze, ...)
+
+    Exact tier: responses keyed by a hash of model, system prompt, messages,
+    response format and sampling params. Semantic tier: for namespaces that allow
+    it, a float32 matrix of normalized prompt embeddings is scored with a single
+    matrix-vector product, and the best match above the threshold is reused.
+    Entries expire after `ttl` seconds and each namespace is LRU-bounded.
+    With `db_path`, every stored entry (and its embedding) is also written to a
+    SQLite table, and unexpired rows are loaded back when the cache is created.
+    """
+
+    def __init__(
+        self,
+        backend,
+        embed_fn: Optional[Callable[[str], np.ndarray]] = None,
+        threshold: float = 0.92,
+        ttl: float = 3600,
+        max_entries: int = 256,
+        semantic_namespaces: Optional[Iterable[str]] = None,
+        db_path: Optional[str] = None
+    ):
+        """
+        Initialize cache
+
+        Args:
+            backend: Object with a GrokClient-compatible call(**kwargs) method
+            embed_fn: Optional function(text) -> 1-D embedding; None disables the semantic tier
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl: Seconds an entry stays valid
+            max_entries: Maximum entries per namespace (least recently used evicted first)
+            semantic_namespaces: Namespaces allowed to use the semantic tier (None = all)
+            db_path: Optional SQLite file that persists entries across restarts
+        """
+        self.backend = backend
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.semantic_namespaces = None if semantic_namespaces is None else frozenset(semantic_namespaces)
+
+        # namespace -> OrderedDict[key -> (expires_at, response)]
+        self._entries: Dict[str, OrderedDict] = {}
+        # (namespace, context key) -> [entry keys, embedding matrix (rows normalized)]
+        self._vectors: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._open_db(db_path)
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict], system_prompt: Optional[str] = None,
+                 response_format: Optional[Mapping] = None, **params) -> str:
+        """SHA-256 of the canonical JSON form of a request"""
+        payload = {
+            "model": model,
+            "system": system_prompt,
+            "messages": messages,
+            "rf": dict(response_format) if response_format else None,
+            "params": params
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _uses_semantic(self, namespace: str) -> bool:
+        """True if semantic lookups are enabled for this namespace"""
+        if self.embed_fn is None:
+            return False
+        return self.semantic_namespaces is None or namespace in self.semantic_namespaces
+
+    @staticmethod
+    def _prompt_text(messages: List[Dict]) -> str:
+        """
+        Text embedded for semantic matching: the payload of the last user message
+
+        User messages open with a fixed instruction paragraph, which is dropped so it
+        does not pull every prompt of a namespace toward the same embedding.
+        """
+        for msg in reversed(messages):
+            if msg.get("role") == "user":
+                return (msg.get("content") or "").split("\n\n", 1)[-1]
+        return ""
+
+    def _embed(self, messages: List[Dict]) -> Optional[np.ndarray]:
+        """Normalized float32 embedding of the prompt, or None if it cannot be embedded"""
+        try:
+            vector = np.asarray(self.embed_fn(self._prompt_text(messages)), dtype=np.float32).ravel()
+        except Exception as e:
+            print(f"⚠️ Cache embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def _live(self, namespace: str, key: str, now: float) -> Optional[Dict]:
+        """Unexpired response for key (refreshed as most recently used), else None"""
+        entries = self._entries.get(namespace)
+        if entries is None or key not in entries:
+            return None
+        expires_at, response = entries[key]
+        if expires_at < now:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return response
+
+    def get(self, namespace: str, model: str, messages: List[Dict], system_prompt: Optional[str] = None,
+            response_format: Optional[Mapping] = None, _embedding: Optional[np.ndarray] = None, **params) -> Optional[Dict]:
+        """
+        Look up a cached response
+
+        Returns:
+            A copy of the cached response marked "cached": True (with zero token cost), or None
+        """
+        key = self.make_key(model, messages, system_prompt, response_format, **params)
+        now = time.monotonic()
+        with self._lock:
+            response = self._live(namespace, key, now)
+            if response is None and _embedding is not None:
+                context = (namespace, self.make_key(model, [], system_prompt, response_format, **params))
+                index = self._vectors.get(context)
+                if index and index[0]:
+                    scores = index[1] @ _embedding
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.threshold:
+                        response = self._live(namespace, index[0][best], now)
+            if response is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return {**response, "cached": True, "input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+
+    def set(self, namespace: str, response: Dict, model: str, messages: List[Dict], system_prompt: Optional[str] = None,
+            response_format: Optional[Mapping] = None, _embedding: Optional[np.ndarray] = None, **params):
+        """Store a response (callers should only store successful ones)"""
+        key = self.make_key(model, messages, system_prompt, response_format, **params)
+        context = self.make_key(model, [], system_prompt, response_format, **params) if _embedding is not None else None
+        with self._lock:
+            self._insert(namespace, key, time.monotonic() + self.ttl, response, _embedding, context)
+            if self._db is not None:
+                self._persist(namespace, key, response, _embedding, context)
+
+    def _insert(self, namespace: str, key: str, expires_at: float, response: Dict,
+                embedding: Optional[np.ndarray], context: Optional[str]):
+        """Add an entry (and its embedding row) to the in-memory tiers; caller holds the lock"""
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        entries[key] = (expires_at, response)
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+        if embedding is not None:
+            index = self._vectors.get((namespace, context))
+            if index is None:
+                self._vectors[(namespace, context)] = [[key], embedding[None, :]]
+            else:
+                # Drop rows whose entries were evicted or expired before growing the matrix
+                if len(index[0]) >= self.max_entries:
+                    keep = [i for i, k in enumerate(index[0]) if k in entries]
+                    index[0] = [index[0][i] for i in keep]
+                    index[1] = index[1][keep]
+                index[0].append(key)
+                index[1] = np.vstack((index[1], embedding))
+
+    def _open_db(self, db_path: str):
+        """Open (or create) the SQLite store and load its unexpired entries"""
+        try:
+            db = sqlite3.connect(db_path, check_same_thread=False)  # access is serialized by _lock
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "namespace TEXT, key TEXT, expires_at REAL, response TEXT, context TEXT, embedding BLOB, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            # Wall-clock expiry on disk; converted to the monotonic clock used in memory
+            now_wall, now = time.time(), time.monotonic()
+            db.execute("DELETE FROM responses WHERE expires_at < ?", (now_wall,))
+            db.commit()
+            rows = db.execute(
+                "SELECT namespace, key, expires_at, response, context, embedding FROM responses ORDER BY expires_at"
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM cache database unavailable ({db_path}): {e}")
+            return
+        self._db = db
+        with self._lock:
+            for namespace, key, expires_at, response, context, blob in rows:
+                embedding = np.frombuffer(blob, dtype=np.float32) if blob is not None else None
+                self._insert(namespace, key, now + (expires_at - now_wall), json.loads(response), embedding, context)
+
+    def _persist(self, namespace: str, key: str, response: Dict,
+                 embedding: Optional[np.ndarray], context: Optional[str]):
+        """Write an entry to the SQLite store; caller holds the lock"""
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, time.time() + self.ttl, json.dumps(response, default=str), context,
+                 embedding.astype(np.float32).tobytes() if embedding is not None else None)
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM cache write failed: {e}")
+
+    def call(self, namespace: str, **kwargs) -> Dict:
+        """
+        Cached drop-in for backend.call(**kwargs)
+
+        Tool-calling requests bypass the cache (their conversation state changes every turn).
+        An on_delta streaming callback is passed through but never keyed on.
+        """
+        if kwargs.get("tools"):
+            return self.backend.call(**kwargs)
+
+        # A streaming callback is not part of the request: keep it out of the key,
+        # and on a hit hand it the whole cached text as one chunk
+        on_delta = kwargs.pop("on_delta", None)
+        embedding = self._embed(kwargs["messages"]) if self._uses_semantic(namespace) else None
+        cached = self.get(namespace, _embedding=embedding, **kwargs)
+        if cached is not None:
+            if on_delta is not None and cached.get("content"):
+                on_delta(cached["content"])
+            return cached
+
+        response = self.backend.call(on_delta=on_delta, **kwargs) if on_delta else self.backend.call(**kwargs)
+        if response.get("success"):
+            self.set(namespace, response, _embedding=embedding, **kwargs)
+        return response
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._vectors.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
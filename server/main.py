@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from data_generator import MockXDataGenerator
+from data_store import load_posts
 from agent import AgenticResearchAgent
 import config
 
@@ -30,8 +31,7 @@ def load_data(data_file: str = None) -> list:
     
     if data_path.exists():
         print(f"📂 Loading data from {data_file}...")
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_posts(data_path)
         print(f"   ✅ Loaded {len(data)} posts\n")
         return data
     else:
@@ -0,0 +1,140 @@
+"""
+Results View
+Column (struct-of-arrays) view of a retrieved result list, built once per result set
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from utils.truncation import compact_text
+
+# Sentiment label -> int8 code; labels outside the table get SENTIMENT_OTHER
+SENTIMENT_CODES = {"negative": -1, "neutral": 0, "positive": 1}
+SENTIMENT_OTHER = -128
+_SENTIMENT_LABELS = {code: label for label, code in SENTIMENT_CODES.items()}
+
+
+def _engagement_sum(post: Dict) -> int:
+    """Sum of numeric engagement counts (same rule as utils.truncation.truncate_result)"""
+    engagement = post.get("engagement")
+    if not isinstance(engagement, dict):
+        return 0
+    return sum(v for v in engagement.values() if isinstance(v, (int, float)))
+
+
+@dataclass(slots=True)
+class ResultsView:
+    """
+    Parallel columns over a list of result posts
+
+    Every stage that reads the same result set (validate, analyze, critique, the
+    refinement merge) slices these columns instead of re-reading each post dict.
+    `posts` keeps the source rows so a view can be matched to its list and
+    rows can be taken back out.
+    """
+    posts: List[Dict]
+    ids: np.ndarray                 # object: post ids (id() of the dict when missing)
+    texts: List[str]
+    authors: List[str]              # display name, "Unknown" without an author dict
+    engagement_totals: np.ndarray   # int64
+    sentiments: np.ndarray          # int8, see SENTIMENT_CODES
+    # max_text_length -> rendered sample lines for the leading rows (see _sample_lines)
+    _lines: Dict[int, List[str]] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_results(cls, results: List[Dict], engagement_total: Optional[Callable[[Dict], int]] = None) -> "ResultsView":
+        """
+        Transpose a result list into columns
+
+        Args:
+            results: Result posts (the list is kept as `posts`, not copied)
+            engagement_total: Optional function(post) -> total, e.g. HybridRetriever.engagement_total
+        """
+        engagement_total = engagement_total or _engagement_sum
+        n = len(results)
+        ids = np.empty(n, dtype=object)
+        ids[:] = [r.get("id", id(r)) for r in results]
+        authors = [
+            r["author"].get("display_name", "")[:50] if isinstance(r.get("author"), dict) else "Unknown"
+            for r in results
+        ]
+        return cls(
+            posts=results,
+            ids=ids,
+            texts=[str(r.get("text", "")) for r in results],
+            authors=authors,
+            engagement_totals=np.fromiter((engagement_total(r) for r in results), dtype=np.int64, count=n),
+            sentiments=np.fromiter(
+                (SENTIMENT_CODES.get(r.get("sentiment"), SENTIMENT_OTHER) for r in results), dtype=np.int8, count=n
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    def matches(self, results: List[Dict]) -> bool:
+        """True if this view was built from `results` and the list has not grown or shrunk since"""
+        return self.posts is results and len(self.posts) == len(self.ids)
+
+    def extend(self, rows: List[Dict], engagement_total: Optional[Callable[[Dict], int]] = None) -> "ResultsView":
+        """
+        View with `rows` appended (its `posts` is a new list)
+        
+        Only the new rows are transposed; rendered sample lines carry over since the
+        leading rows are unchanged.
+        """
+        tail = ResultsView.from_results(rows, engagement_total)
+        return ResultsView(
+            posts=self.posts + tail.posts,
+            ids=np.concatenate((self.ids, tail.ids)),
+            texts=self.texts + tail.texts,
+            authors=self.authors + tail.authors,
+            engagement_totals=np.concatenate((self.engagement_totals, tail.engagement_totals)),
+            sentiments=np.concatenate((self.sentiments, tail.sentiments)),
+            _lines={length: list(lines) for length, lines in self._lines.items()}
+        )
+    
+    def _sample_lines(self, k: int, max_text_length: int) -> List[str]:
+        """
+        Prompt lines for the first k rows
+
+        Validate, analyze, critique and the post-analysis call all sample the same
+        leading rows, so each row is rendered once per text length and reused.
+        """
+        lines = self._lines.setdefault(max_text_length, [])
+        start = len(lines)
+        if start < k:
+            codes = self.sentiments[start:k].tolist()
+            totals = self.engagement_totals[start:k].tolist()
+            for j, i in enumerate(range(start, k)):
+                text = compact_text(self.texts[i], max_text_length)
+                sentiment = _SENTIMENT_LABELS.get(codes[j]) or self.posts[i].get("sentiment", "unknown")
+                lines.append(f"{i + 1}. {text}\n   [{self.authors[i]}, {sentiment}, {totals[j]} eng]\n\n")
+        return lines[:k]
+
+    def concise_summary(self, query: str, max_items: int = 6, max_text_length: int = 100) -> str:
+        """
+        Data sample for a prompt, read from the columns
+
+        Same layout as utils.truncation.create_concise_data_summary, with each
+        post's text shortened by compact_text.
+
+        Args:
+            query: Original query
+            max_items: Maximum items to include
+            max_text_length: Maximum text length per item
+
+        Returns:
+            Concise summary string
+        """
+        n = len(self.posts)
+        if not n:
+            return f"Query: {query}\n\nNo results found."
+
+        k = min(max_items, n)
+        parts = [f"Query: {query}\n\n", f"Found {n} items. Sample ({k}):\n\n"]
+        parts.extend(self._sample_lines(k, max_text_length))
+
+        if n > max_items:
+            parts.append(f"... and {n - max_items} more items\n")
+
+        return "".join(parts)
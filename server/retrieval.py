@@ -28,6 +28,11 @@ class HybridRetriever:
         self.embeddings = None
         self.embedding_model = None
         
+        # Engagement totals are fixed per post, so sum them once here instead of per filter/tool call.
+        # Keyed by object identity (post ids are not unique in every dataset); the post is
+        # kept alongside so a recycled id() can never match a different object
+        self._engagement_by_obj = {id(post): (post, self._get_total_engagement(post)) for post in data}
+        
         # Set up cache directory
         if cache_dir is None:
             # Default to data/.embeddings_cache relative to project root
@@ -121,6 +126,13 @@ class HybridRetriever:
         
         return total
     
+    def engagement_total(self, post: Dict) -> int:
+        """Total engagement of a post (precomputed for dataset posts, computed otherwise)"""
+        entry = self._engagement_by_obj.get(id(post))
+        if entry is None or entry[0] is not post:
+            return self._get_total_engagement(post)
+        return entry[1]
+    
     def keyword_search(self, query: str, top_k: int = None) -> List[Tuple[Dict, float]]:
         """
         Keyword-based search using TF-IDF-like scoring
@@ -301,7 +313,7 @@ class HybridRetriever:
             else:
                 filtered = [
                     p for p in filtered
-                    if self._get_total_engagement(p) >= min_eng
+                    if self.engagement_total(p) >= min_eng
                 ]
         
         if "author_type" in filters:
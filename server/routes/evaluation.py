@@ -9,6 +9,7 @@ from fastapi import HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
+from utils.response import sse_event
 
 from . import evaluation_router
 
@@ -118,7 +119,7 @@ def run_evaluation(request: EvaluationRequest):
                     'total_queries': query_count,
                     'message': f'Running query {i + 1}/{query_count}...'
                 }
-                yield f"data: {json.dumps(progress)}\n\n"
+                yield sse_event(progress)
                 
                 # Wait a bit (actual progress comes from agent's progress_callback)
                 time.sleep(request.delay)
@@ -128,16 +129,16 @@ def run_evaluation(request: EvaluationRequest):
             
             # Send final result
             if result_container['error']:
-                yield f"data: {json.dumps({'type': 'error', 'message': result_container['error']})}\n\n"
+                yield sse_event({'type': 'error', 'message': result_container['error']})
             else:
                 result = result_container['result']
-                yield f"data: {json.dumps({'type': 'complete', 'result': result})}\n\n"
+                yield sse_event({'type': 'complete', 'result': result})
         
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
             print(f"❌ Evaluation API Error: {error_details}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
     
     return StreamingResponse(
         generate(),
@@ -183,11 +184,11 @@ def compare_models(request: ModelComparisonRequest):
             if request.models:
                 model_configs = {name: MODEL_CONFIGS[name] for name in request.models if name in MODEL_CONFIGS}
                 if not model_configs:
-                    yield f"data: {json.dumps({'type': 'error', 'message': f'No valid models found. Available: {list(MODEL_CONFIGS.keys())}'})}\n\n"
+                    yield sse_event({'type': 'error', 'message': f'No valid models found. Available: {list(MODEL_CONFIGS.keys())}'})
                     return
             
             # Send initial progress
-            yield f"data: {json.dumps({'type': 'comparison_start', 'models': list(model_configs.keys()), 'total_queries': request.max_queries or len(queries)})}\n\n"
+            yield sse_event({'type': 'comparison_start', 'models': list(model_configs.keys()), 'total_queries': request.max_queries or len(queries)})
             
             # Run comparison
             comparison = compare_models(
@@ -199,13 +200,13 @@ def compare_models(request: ModelComparisonRequest):
             )
             
             # Send final result
-            yield f"data: {json.dumps({'type': 'complete', 'result': comparison})}\n\n"
+            yield sse_event({'type': 'complete', 'result': comparison})
         
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
             print(f"❌ Model Comparison API Error: {error_details}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
     
     return StreamingResponse(
         generate(),
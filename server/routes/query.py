@@ -9,6 +9,7 @@ from fastapi import HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
+from utils.response import sse_event
 from . import query_router
 
 
@@ -46,7 +47,7 @@ def query(request: QueryRequest):
             # Validate query
             query_text = request.query.strip()
             if not query_text:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Query cannot be empty'})}\n\n"
+                yield sse_event({'type': 'error', 'message': 'Query cannot be empty'})
                 return
             
             # Initialize agent if needed
@@ -101,13 +102,13 @@ def query(request: QueryRequest):
                 try:
                     # Get progress event with timeout
                     event = progress_queue.get(timeout=0.5)
-                    yield f"data: {json.dumps(event)}\n\n"
+                    yield sse_event(event)
                 except queue.Empty:
                     # Check if thread is still alive
                     if not workflow_thread.is_alive() and result_container['done']:
                         break
                     # Send heartbeat to keep connection alive
-                    yield f": heartbeat\n\n"
+                    yield b": heartbeat\n\n"
                     continue
             
             # Wait for thread to complete
@@ -115,15 +116,15 @@ def query(request: QueryRequest):
             
             # Send final result
             if result_container['error']:
-                yield f"data: {json.dumps({'type': 'error', 'message': result_container['error']})}\n\n"
+                yield sse_event({'type': 'error', 'message': result_container['error']})
             else:
-                yield f"data: {json.dumps({'type': 'complete', 'result': result_container['result']})}\n\n"
+                yield sse_event({'type': 'complete', 'result': result_container['result']})
         
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
             print(f"❌ API Error: {error_details}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
     
     return StreamingResponse(
         generate(),
@@ -159,7 +160,7 @@ def compare_models_query(request: ModelComparisonQueryRequest):
         try:
             query_text = request.query.strip()
             if not query_text:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Query cannot be empty'})}\n\n"
+                yield sse_event({'type': 'error', 'message': 'Query cannot be empty'})
                 return
             
             # Validate models
@@ -168,13 +169,13 @@ def compare_models_query(request: ModelComparisonQueryRequest):
                 if model in MODEL_CONFIGS:
                     valid_models.append(model)
                 else:
-                    yield f"data: {json.dumps({'type': 'model_error', 'model': model, 'message': f'Unknown model: {model}'})}\n\n"
+                    yield sse_event({'type': 'model_error', 'model': model, 'message': f'Unknown model: {model}'})
             
             if not valid_models:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'No valid models selected'})}\n\n"
+                yield sse_event({'type': 'error', 'message': 'No valid models selected'})
                 return
             
-            yield f"data: {json.dumps({'type': 'comparison_start', 'models': valid_models, 'query': query_text})}\n\n"
+            yield sse_event({'type': 'comparison_start', 'models': valid_models, 'query': query_text})
             
             # Results container: model_name -> {result, error, logs, done}
             results = {model: {'result': None, 'error': None, 'logs': [], 'done': False} for model in valid_models}
@@ -184,6 +185,7 @@ def compare_models_query(request: ModelComparisonQueryRequest):
             
             def run_model(model_name: str):
                 """Run query for a single model"""
+                agent_instance = None
                 try:
                     model_config = MODEL_CONFIGS[model_name]
                     agent_service = get_agent_service()
@@ -215,6 +217,8 @@ def compare_models_query(request: ModelComparisonQueryRequest):
                         'message': error_msg
                     }))
                 finally:
+                    if agent_instance is not None:
+                        agent_instance.close()  # per-model agent, not the shared one
                     results[model_name]['done'] = True
                     # Signal completion
                     log_queue.put(('done', model_name))
@@ -231,7 +235,7 @@ def compare_models_query(request: ModelComparisonQueryRequest):
                     item_type, item_data = log_queue.get(timeout=0.5)
                     if item_type == 'log':
                         # Stream log event
-                        yield f"data: {json.dumps({'type': 'model_log', 'log': item_data})}\n\n"
+                        yield sse_event({'type': 'model_log', 'log': item_data})
                     elif item_type == 'done':
                         completed_models.add(item_data)
                 except queue.Empty:
@@ -250,9 +254,9 @@ def compare_models_query(request: ModelComparisonQueryRequest):
             # Send model completion events
             for model_name in valid_models:
                 if results[model_name]['error']:
-                    yield f"data: {json.dumps({'type': 'model_complete', 'model': model_name, 'status': 'error', 'error': results[model_name]['error']})}\n\n"
+                    yield sse_event({'type': 'model_complete', 'model': model_name, 'status': 'error', 'error': results[model_name]['error']})
                 else:
-                    yield f"data: {json.dumps({'type': 'model_complete', 'model': model_name, 'status': 'success', 'result': results[model_name]['result']})}\n\n"
+                    yield sse_event({'type': 'model_complete', 'model': model_name, 'status': 'success', 'result': results[model_name]['result']})
             
             # Generate comparison summary
             comparison_summary = {
@@ -307,13 +311,13 @@ def compare_models_query(request: ModelComparisonQueryRequest):
                 }
             
             # Send final comparison summary
-            yield f"data: {json.dumps({'type': 'comparison_complete', 'summary': comparison_summary})}\n\n"
+            yield sse_event({'type': 'comparison_complete', 'summary': comparison_summary})
         
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
             print(f"❌ Model Comparison API Error: {error_details}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
     
     return StreamingResponse(
         generate(),
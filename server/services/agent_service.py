@@ -1,7 +1,6 @@
 """
 Agent Service - Manages agent initialization and lifecycle
 """
-import json
 import sys
 from pathlib import Path
 from typing import Tuple, Optional, Dict
@@ -10,6 +9,7 @@ from typing import Tuple, Optional, Dict
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from data_generator import MockXDataGenerator
+from data_store import load_posts
 from agent import AgenticResearchAgent
 import config
 
@@ -41,8 +41,7 @@ class AgentService:
             
             if data_path.exists():
                 print(f"📂 Loading data from {data_file}...")
-                with open(data_path, 'r', encoding='utf-8') as f:
-                    self._data = json.load(f)
+                self._data = load_posts(data_path)
                 print(f"   ✅ Loaded {len(self._data)} posts")
             else:
                 print(f"📝 Generating mock dataset...")
@@ -88,5 +87,7 @@ class AgentService:
     
     def reset(self):
         """Reset agent and data (useful for testing)"""
+        if self._agent is not None:
+            self._agent.close()
         self._agent = None
         self._data = None
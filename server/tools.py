@@ -2,6 +2,7 @@
 Tool Definitions for Agentic Research Agent
 Explicit tools that can be called dynamically by the LLM
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from retrieval import HybridRetriever
@@ -10,6 +11,12 @@ from retrieval import HybridRetriever
 class ToolRegistry:
     """Registry of available tools for the agent"""
     
+    # Tools the batch meta-tool may dispatch (everything except batch itself)
+    BATCHABLE_TOOLS = (
+        "keyword_search", "semantic_search", "hybrid_search",
+        "user_profile_lookup", "temporal_trend_analyzer", "filter_by_metadata"
+    )
+    
     def __init__(self, retriever: HybridRetriever, data: List[Dict]):
         """
         Initialize tool registry
@@ -22,6 +29,9 @@ class ToolRegistry:
         self.data = data
         self._build_author_index()
         self._build_temporal_index()
+        # Built once and sorted by name: every tool-calling request then sends a
+        # byte-identical tools block, which provider-side prompt caching can reuse
+        self._tool_definitions = sorted(self._build_tool_definitions(), key=lambda t: t["function"]["name"])
     
     def _build_author_index(self):
         """Build index of posts by author"""
@@ -50,8 +60,12 @@ class ToolRegistry:
         Get tool definitions in OpenAI function-calling format
         
         Returns:
-            List of tool definition dictionaries
+            List of tool definition dictionaries, sorted by name (shared; do not mutate)
         """
+        return self._tool_definitions
+    
+    def _build_tool_definitions(self) -> List[Dict]:
+        """Tool definition dictionaries, in declaration order"""
         return [
             {
                 "type": "function",
@@ -220,6 +234,38 @@ class ToolRegistry:
                         "required": []
                     }
                 }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "batch",
+                    "description": "Run several independent tool calls in one turn (executed in parallel). Prefer this over separate turns when the calls don't depend on each other's results.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "invocations": {
+                                "type": "array",
+                                "description": "Tool calls to run",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "tool_name": {
+                                            "type": "string",
+                                            "description": "Name of the tool to call",
+                                            "enum": list(self.BATCHABLE_TOOLS)
+                                        },
+                                        "arguments": {
+                                            "type": "object",
+                                            "description": "Arguments for that tool"
+                                        }
+                                    },
+                                    "required": ["tool_name", "arguments"]
+                                }
+                            }
+                        },
+                        "required": ["invocations"]
+                    }
+                }
             }
         ]
     
@@ -332,7 +378,6 @@ class ToolRegistry:
                 # Analyze trends
                 daily_counts = {}
                 sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
-                total_engagement = 0
                 
                 for post in filtered_posts:
                     date_key = post.get("created_at", "")[:10]  # YYYY-MM-DD
@@ -342,10 +387,8 @@ class ToolRegistry:
                     sentiment = post.get("sentiment", "neutral")
                     if sentiment in sentiment_counts:
                         sentiment_counts[sentiment] += 1
-                    
-                    engagement = post.get("engagement", {})
-                    if isinstance(engagement, dict):
-                        total_engagement += sum(v for v in engagement.values() if isinstance(v, (int, float)))
+                
+                total_engagement = sum(self.retriever.engagement_total(post) for post in filtered_posts)
                 
                 return {
                     "success": True,
@@ -395,6 +438,9 @@ class ToolRegistry:
                     "message": f"Filtered to {len(filtered)} posts matching criteria"
                 }
             
+            elif tool_name == "batch":
+                return self._call_batch(arguments.get("invocations", []))
+            
             else:
                 return {
                     "success": False,
@@ -408,3 +454,53 @@ class ToolRegistry:
                 "results": [],
                 "message": f"Error calling {tool_name}: {str(e)}"
             }
+    
+    def _call_batch(self, invocations: List[Dict]) -> Dict[str, Any]:
+        """
+        Run the batch meta-tool: independent tool calls in parallel, merged into one result
+        
+        Args:
+            invocations: [{"tool_name": str, "arguments": dict}, ...]
+            
+        Returns:
+            Dictionary with 'success' (any call succeeded), merged deduplicated 'results',
+            'message', and per-call 'invocations' outcomes
+        """
+        calls = []
+        for inv in invocations:
+            name = inv.get("tool_name") if isinstance(inv, dict) else None
+            args = inv.get("arguments") if isinstance(inv, dict) else None
+            calls.append((name, args if isinstance(args, dict) else {}))
+        if not calls:
+            return {"success": False, "results": [], "message": "batch called without invocations"}
+        
+        def run(call):
+            name, args = call
+            if name not in self.BATCHABLE_TOOLS:
+                return {"success": False, "results": [], "message": f"Tool not allowed in batch: {name}"}
+            return self.call_tool(name, args)
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(calls))) as pool:
+            outcomes = list(pool.map(run, calls))
+        
+        seen_ids = set()
+        results = [
+            post for outcome in outcomes for post in outcome.get("results", [])
+            if not ((post_id := post.get("id")) in seen_ids or seen_ids.add(post_id))
+        ]
+        
+        succeeded = sum(1 for outcome in outcomes if outcome.get("success"))
+        return {
+            "success": succeeded > 0,
+            "results": results,
+            "message": f"Ran {len(calls)} tool calls ({succeeded} succeeded), {len(results)} unique results",
+            "invocations": [
+                {
+                    "tool_name": name,
+                    "success": outcome.get("success", False),
+                    "results_count": len(outcome.get("results", [])),
+                    "message": outcome.get("message", "")
+                }
+                for (name, _), outcome in zip(calls, outcomes)
+            ]
+        }
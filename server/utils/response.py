@@ -1,9 +1,12 @@
 """
 Response utilities
 """
+import orjson
 from fastapi.responses import JSONResponse
 from typing import Dict, Any, Optional
 
+_SSE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
 def create_error_response(message: str, status_code: int = 400, details: Optional[Dict[str, Any]] = None) -> JSONResponse:
     """
@@ -42,3 +45,16 @@ def create_success_response(data: Dict[str, Any], status_code: int = 200) -> Dic
         "success": True,
         "data": data
     }
+
+
+def sse_event(payload: Dict[str, Any]) -> bytes:
+    """
+    Encode a payload as one Server-Sent Events message
+    
+    Args:
+        payload: Event data (numpy values and non-str keys are allowed)
+    
+    Returns:
+        b"data: <json>\\n\\n", serialized with orjson (values it cannot encode fall back to str)
+    """
+    return b"data: " + orjson.dumps(payload, default=str, option=_SSE_OPTIONS) + b"\n\n"
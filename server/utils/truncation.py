@@ -1,8 +1,16 @@
 """
 Token optimization utilities for truncating content before sending to LLM
 """
+import re
 from typing import List, Dict, Any
 
+# compact_text patterns, compiled once
+_URL_RE = re.compile(r"https?://\S+")
+_LETTER_RUN_RE = re.compile(r"([^\W\d_])\1{2,}")  # "soooo" -> "soo" (digits untouched)
+_SYMBOL_RUN_RE = re.compile(r"([^\w\s])\1{2,}")  # "!!!!" / repeated emoji -> one
+_SPACE_RE = re.compile(r"\s+")
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)")
+
 
 def truncate_text(text: str, max_chars: int = None, max_tokens: int = None) -> str:
     """
@@ -30,6 +38,37 @@ def truncate_text(text: str, max_chars: int = None, max_tokens: int = None) -> s
     return text
 
 
+def compact_text(text: str, max_chars: int) -> str:
+    """
+    Shrink post text for a prompt without losing its content
+    
+    Replaces URLs with "[url]", shortens runs of a repeated character,
+    collapses whitespace, then cuts at the last sentence end that fits
+    (falling back to truncate_text's word boundary).
+    
+    Args:
+        text: Post text
+        max_chars: Maximum characters in the result
+        
+    Returns:
+        Compacted text, at most max_chars long
+    """
+    text = _URL_RE.sub("[url]", text)
+    text = _LETTER_RUN_RE.sub(r"\1\1", text)
+    text = _SYMBOL_RUN_RE.sub(r"\1", text)
+    text = _SPACE_RE.sub(" ", text).strip()
+    if len(text) <= max_chars:
+        return text
+    
+    # Prefer a whole sentence if one ends in the back half of the budget
+    end = 0
+    for match in _SENTENCE_END_RE.finditer(text, 0, max_chars):
+        end = match.end()
+    if end > max_chars // 2:
+        return text[:end]
+    return truncate_text(text, max_chars=max_chars)[:max_chars]
+
+
 def truncate_result(result: Dict, max_text_length: int = 150, include_fields: List[str] = None) -> Dict:
     """
     Truncate a single result item to reduce token usage
@@ -106,8 +145,11 @@ def create_concise_data_summary(results: List[Dict], query: str, max_items: int
     if not results:
         return f"Query: {query}\n\nNo results found."
     
-    summary = f"Query: {query}\n\n"
-    summary += f"Found {len(results)} items. Sample ({min(max_items, len(results))}):\n\n"
+    # Collect pieces and join once instead of growing one string with +=
+    parts = [
+        f"Query: {query}\n\n",
+        f"Found {len(results)} items. Sample ({min(max_items, len(results))}):\n\n"
+    ]
     
     truncated_results = truncate_results_for_llm(results, max_items=max_items, max_text_length=max_text_length)
     
@@ -117,10 +159,9 @@ def create_concise_data_summary(results: List[Dict], query: str, max_items: int
         sentiment = item.get('sentiment', 'unknown')
         engagement = item.get('engagement', {}).get('total', 0) if isinstance(item.get('engagement'), dict) else 0
         
-        summary += f"{i}. {text}\n"
-        summary += f"   [{author}, {sentiment}, {engagement} eng]\n\n"
+        parts.append(f"{i}. {text}\n   [{author}, {sentiment}, {engagement} eng]\n\n")
     
     if len(results) > max_items:
-        summary += f"... and {len(results) - max_items} more items\n"
+        parts.append(f"... and {len(results) - max_items} more items\n")
     
-    return summary
+    return "".join(parts)